@@ -0,0 +1,78 @@
+"""
+GEMM Benchmark
+Times Matrix.multiply_matrix from 3x3 up to 1024x1024.
+
+Compares three ways of composing two n x n matrices:
+    - naive:  the original approach (get_column -> Vector -> dot with row Vectors,
+              then transpose the result by hand), kept here as a reference
+    - python: the python backend's kernels.gemm (transposed-B, k-panel tiled)
+    - numpy:  the numpy backend
+
+Usage:
+    python gemm.py                  # default sizes, pure Python capped at 256
+    python gemm.py --max-python 1024
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from linear_algebra.matrix import Matrix
+from linear_algebra.vector import Vector
+from linear_algebra import backend
+
+SIZES = [3, 8, 16, 32, 64, 128, 256, 512, 1024]
+
+
+def naive_multiply(a: Matrix, b: Matrix) -> Matrix:
+    """The pre-GEMM algorithm: one Vector per column, one Vector per row."""
+    product = []
+    for i in range(b.cols):
+        column = b.get_column(i)
+        product.append([column.dot(Vector(row)) for row in a.data])
+    return Matrix([[column[r] for column in product] for r in range(a.rows)])
+
+
+def random_matrix(n: int) -> Matrix:
+    return Matrix([[random.random() for _ in range(n)] for _ in range(n)])
+
+
+def best_of(fn, repeats: int) -> float:
+    """Best wall-clock time of `repeats` runs, in seconds."""
+    best = float('inf')
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sizes', type=int, nargs='+', default=SIZES)
+    parser.add_argument('--max-python', type=int, default=256, help="largest n timed in pure Python")
+    parser.add_argument('--max-naive', type=int, default=128, help="largest n timed with the naive reference")
+    args = parser.parse_args()
+
+    has_numpy = backend.numpy_or_none() is not None
+    print(f"{'n':>6} {'naive (s)':>12} {'python (s)':>12} {'numpy (s)':>12} {'speedup':>9}")
+    for n in args.sizes:
+        a, b = random_matrix(n), random_matrix(n)
+        repeats = 5 if n <= 64 else 1
+
+        naive = best_of(lambda: naive_multiply(a, b), repeats) if n <= args.max_naive else None
+        python = best_of(lambda: a.multiply_matrix(b, use_numpy=False), repeats) if n <= args.max_python else None
+        numpy = best_of(lambda: a.multiply_matrix(b, use_numpy=True), repeats) if has_numpy else None
+
+        def fmt(t):
+            return f"{t:12.6f}" if t is not None else f"{'-':>12}"
+        speedup = f"{naive / python:8.1f}x" if naive and python else f"{'-':>9}"
+        print(f"{n:>6} {fmt(naive)} {fmt(python)} {fmt(numpy)} {speedup}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""
+Import Time Benchmark
+Times cold imports of the packages, each in a fresh interpreter.
+
+Every statement runs in its own `python -c` process (so nothing is cached
+in sys.modules) `--repeats` times; the table shows the best and median
+wall time of the statement itself, plus which heavy dependencies it
+pulled in. `import linear_algebra` and `import visualization` should load
+nothing at all; numpy and matplotlib should only appear for the
+statements that need them. The packages are byte-compiled first, so the
+numbers are for an installed tree rather than a first run that compiles
+every source file.
+
+Exits with status 1 if `import linear_algebra` takes longer than --max-ms,
+so the check can guard startup time in CI.
+
+Usage:
+    python import_time.py
+    python import_time.py --repeats 20 --max-ms 5
+"""
+
+import argparse
+import compileall
+import os
+import statistics
+import subprocess
+import sys
+
+LIB = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+
+STATEMENTS = [
+    "import linear_algebra",
+    "import visualization",
+    "from linear_algebra import Vector",
+    "from linear_algebra import Matrix3D",
+    "from linear_algebra import VectorBatch",
+    "from linear_algebra import VectorIndex",
+    "from linear_algebra import PCA",
+    "from visualization import plot_transformation",
+    "from visualization import build_scene",
+]
+
+HEAVY = ["numpy", "matplotlib"]
+
+PROBE = """
+import sys, time
+start = time.perf_counter()
+{statement}
+elapsed = time.perf_counter() - start
+print(elapsed, *[name for name in {heavy!r} if name in sys.modules])
+"""
+
+
+def time_statement(statement: str, repeats: int) -> tuple:
+    """(best seconds, median seconds, heavy modules loaded) over `repeats` fresh interpreters."""
+    times, loaded = [], []
+    for _ in range(repeats):
+        result = subprocess.run([sys.executable, "-c", PROBE.format(statement=statement, heavy=HEAVY)],
+                                cwd=LIB, capture_output=True, text=True, check=True)
+        elapsed, *loaded = result.stdout.split()
+        times.append(float(elapsed))
+    return min(times), statistics.median(times), loaded
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--repeats', type=int, default=10)
+    parser.add_argument('--max-ms', type=float, default=10.0, help="budget for `import linear_algebra`")
+    args = parser.parse_args()
+
+    for package in ("linear_algebra", "visualization"):
+        compileall.compile_dir(os.path.join(LIB, package), quiet=1)
+    width = max(len(s) for s in STATEMENTS)
+    print(f"{'statement':<{width}} {'best (ms)':>10} {'median (ms)':>12}  loads")
+    status = 0
+    for statement in STATEMENTS:
+        best, median, loaded = time_statement(statement, args.repeats)
+        print(f"{statement:<{width}} {best * 1e3:10.2f} {median * 1e3:12.2f}  {', '.join(loaded) or '-'}")
+        if statement == "import linear_algebra" and median * 1e3 > args.max_ms:
+            status = 1
+    if status:
+        print(f"`import linear_algebra` is over the {args.max_ms} ms budget")
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
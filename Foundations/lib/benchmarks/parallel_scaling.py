@@ -0,0 +1,67 @@
+"""
+Parallel Scaling Benchmark
+Reports speedup of the process-pool backend at 1, 2, 4 and 8 workers.
+
+Two workloads:
+    - matmul:    n x n Matrix.multiply_matrix (pure Python, row blocks per worker)
+    - transform: Matrix3D.transform_points over N packed 3D points
+
+NumPy is disabled for the matmul so the numbers measure the pure-Python
+kernels being spread across cores. The pool is warmed up once per worker
+count so process start-up isn't counted.
+
+Usage:
+    python parallel_scaling.py
+    python parallel_scaling.py --n 384 --points 2000000 --workers 1 2 4 8 16
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+from array import array
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from linear_algebra.matrix import Matrix
+from linear_algebra.matrix3D import Matrix3D
+from linear_algebra import parallel
+
+
+def timed(fn) -> float:
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--n', type=int, default=256, help="matrix size for the matmul workload")
+    parser.add_argument('--points', type=int, default=1_000_000, help="points for the transform workload")
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 2, 4, 8])
+    args = parser.parse_args()
+
+    n = args.n
+    a = Matrix([[random.random() for _ in range(n)] for _ in range(n)])
+    b = Matrix([[random.random() for _ in range(n)] for _ in range(n)])
+    rotation = Matrix3D.rotation(30, "z")
+    points = array('d', (random.random() for _ in range(3 * args.points)))
+
+    print(f"CPUs available: {os.cpu_count()}")
+    print(f"{'workers':>8} {'matmul (s)':>12} {'speedup':>9} {'transform (s)':>14} {'speedup':>9}")
+    base_mm = base_tf = None
+    for workers in args.workers:
+        if workers > 1:
+            # warm the pool so process start-up isn't part of the measurement
+            parallel.multiply(array('d', [1.0] * 4), array('d', [1.0] * 4), 2, 2, 2, workers)
+        mm = timed(lambda: a.multiply_matrix(b, use_numpy=False, workers=workers))
+        tf = timed(lambda: rotation.transform_points(points, workers=workers))
+        base_mm = base_mm or mm
+        base_tf = base_tf or tf
+        print(f"{workers:>8} {mm:12.4f} {base_mm / mm:8.2f}x {tf:14.4f} {base_tf / tf:8.2f}x")
+    parallel.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""
+PCA Solver Benchmark
+Times PCA(svd_solver=...) as the number of features grows, and checks each
+iterative solver against the full eigen-decomposition.
+
+Data is low-rank signal plus noise: n samples of `--rank` latent factors with
+decaying scales, mixed into d features. For each d the table shows the
+fit time of every solver, then an accuracy report against "full":
+    var err  - largest relative error of the top k explained variances
+    min |cos| - worst alignment |<component, full component>| (1.0 = same direction)
+
+"full" is O(n d^2 + d^3) while the others are roughly O(n d k), so full
+wins for small d and loses badly past a few hundred features.
+
+Usage:
+    python pca_solvers.py                        # n = 2000, k = 10
+    python pca_solvers.py --features 100 1000 4000 --max-full 2000
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+import numpy as np
+
+from linear_algebra.pca import PCA
+
+FEATURES = [50, 100, 250, 500, 1000, 2000, 4000]
+SOLVERS = ["full", "randomized", "lanczos", "power"]
+
+
+def make_data(n: int, d: int, rank: int, noise: float, rng: np.random.Generator) -> np.ndarray:
+    """n x d data: `rank` factors with scales rank..1, mixed into d features, plus noise."""
+    factors = rng.standard_normal((n, rank)) * np.linspace(rank, 1, rank)
+    return factors @ rng.standard_normal((rank, d)) + noise * rng.standard_normal((n, d))
+
+
+def timed_fit(solver: str, X: np.ndarray, k: int, repeats: int):
+    """Best fit time of `repeats` runs, and the last fitted model."""
+    best, model = float('inf'), None
+    for _ in range(repeats):
+        start = time.perf_counter()
+        model = PCA(k, svd_solver=solver, random_state=0).fit(X)
+        best = min(best, time.perf_counter() - start)
+    return best, model
+
+
+def accuracy(model: PCA, reference: PCA) -> tuple:
+    variance_error = np.max(np.abs(model.explained_variance_ - reference.explained_variance_)
+                            / reference.explained_variance_)
+    alignment = np.min(np.abs(np.sum(model.components_ * reference.components_, axis=1)))
+    return variance_error, alignment
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--features', type=int, nargs='+', default=FEATURES)
+    parser.add_argument('--samples', type=int, default=2000)
+    parser.add_argument('-k', '--components', type=int, default=10)
+    parser.add_argument('--rank', type=int, default=20, help="latent factors in the synthetic data")
+    parser.add_argument('--noise', type=float, default=0.3)
+    parser.add_argument('--max-full', type=int, default=4000, help="largest d timed with the full solver")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    header = "".join(f"{name + ' (s)':>16}" for name in SOLVERS)
+    print(f"{'d':>6}{header}{'fastest':>12}")
+    reports = []
+    for d in args.features:
+        X = make_data(args.samples, d, args.rank, args.noise, rng)
+        repeats = 3 if d <= 500 else 1
+        times, models = {}, {}
+        for solver in SOLVERS:
+            if solver == "full" and d > args.max_full:
+                continue
+            times[solver], models[solver] = timed_fit(solver, X, args.components, repeats)
+
+        def fmt(t):
+            return f"{t:16.4f}" if t is not None else f"{'-':>16}"
+        fastest = min(times, key=times.get)
+        print(f"{d:>6}" + "".join(fmt(times.get(s)) for s in SOLVERS) + f"{fastest:>12}")
+        if "full" in models:
+            reports.append((d, {s: accuracy(models[s], models["full"]) for s in SOLVERS[1:]},
+                            {s: models[s].n_iter_ for s in SOLVERS[1:]}))
+
+    print()
+    print(f"Accuracy vs full (k = {args.components})")
+    print(f"{'d':>6} {'solver':>12} {'var err':>12} {'min |cos|':>12} {'iterations':>12}")
+    for d, errors, iterations in reports:
+        for solver, (variance_error, alignment) in errors.items():
+            print(f"{d:>6} {solver:>12} {variance_error:12.2e} {alignment:12.8f} {iterations[solver]:>12}")
+
+
+if __name__ == "__main__":
+    main()
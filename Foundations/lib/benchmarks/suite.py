@@ -0,0 +1,260 @@
+"""
+Benchmark Suite
+Times every linear_algebra hot path on every backend, and flags regressions against a stored baseline.
+
+Each case builds its inputs once from a fixed seed for a given size and
+yields (name, operation) pairs; the suite runs every operation under each
+backend (via use_backend). Timing is timeit-style: the loop count is
+calibrated so one sample takes at least --min-time, then --repeats samples
+are taken and the best and median time per call are kept.
+
+Results are written as JSON ({"meta": ..., "results": {key: timing}},
+key = "case/name[n=size]@backend"). Given --baseline, every key present in
+both runs is compared on its best time; a slowdown beyond --threshold (0.10 =
+10%) is a regression and makes the script exit with status 1.
+
+Typical workflow:
+    python suite.py --output baseline.json                  # on the reference commit
+    python suite.py --baseline baseline.json --output new.json
+    python suite.py --quick --filter vector --backend python numpy
+
+Usage:
+    python suite.py [--quick] [--filter TEXT] [--backend NAME ...] [--output FILE]
+                    [--baseline FILE] [--threshold 0.10]
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import time
+from array import array
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from linear_algebra.affine import Affine3D
+from linear_algebra.backend import available_backends, numpy_or_none, use_backend
+from linear_algebra.matrix import Matrix
+from linear_algebra.matrix2D import Matrix2D
+from linear_algebra.matrix3D import Matrix3D
+from linear_algebra.quaternion import Quaternion
+from linear_algebra.vector import Vector
+from linear_algebra.Vector3D import Vector3D
+
+CASES = []
+
+
+def case(*sizes):
+    """Register a benchmark case: a function of (seeded Random, size) run at each of `sizes`."""
+    def register(fn):
+        fn.sizes = sizes
+        CASES.append(fn)
+        return fn
+    return register
+
+
+def _random_vector(rng, n, cls=Vector):
+    return cls([rng.uniform(-10, 10) for _ in range(n)])
+
+
+def _random_matrix(rng, rows, cols, cls=Matrix):
+    return cls([[rng.uniform(-10, 10) for _ in range(cols)] for _ in range(rows)])
+
+
+@case(3, 256, 4096)
+def vector(rng, n):
+    a, b = _random_vector(rng, n), _random_vector(rng, n)
+    yield "dot", lambda: a.dot(b)
+    yield "magnitude", lambda: a.magnitude()
+    yield "normalize", lambda: a.normalize()
+    yield "projection", lambda: a.projection(b)
+
+
+@case(3)
+def vector3d(rng, n):
+    a, b = _random_vector(rng, 3, Vector3D), _random_vector(rng, 3, Vector3D)
+    yield "cross", lambda: a.cross(b)
+
+
+@case(3, 64, 256)
+def multiply_vector(rng, n):
+    cls = Matrix3D if n == 3 else Matrix
+    m, v = _random_matrix(rng, n, n, cls), _random_vector(rng, n, Vector3D if n == 3 else Vector)
+    yield "multiply_vector", lambda: m.multiply_vector(v)
+
+
+@case(3, 32, 128)
+def multiply_matrix(rng, n):
+    cls = Matrix3D if n == 3 else Matrix
+    a, b = _random_matrix(rng, n, n, cls), _random_matrix(rng, n, n, cls)
+    yield "multiply_matrix", lambda: a.multiply_matrix(b)
+
+
+@case(3)
+def rotation_compose(rng, n):
+    """The same composition of two arbitrary rotations as matrices and as quaternions."""
+    axes = [[rng.gauss(0, 1) for _ in range(3)] for _ in range(2)]
+    p, q = (Quaternion.from_axis_angle(axis, rng.uniform(0, 360)) for axis in axes)
+    a, b = p.to_matrix(), q.to_matrix()
+    yield "matrix", lambda: a.multiply_matrix(b)
+    yield "quaternion", lambda: p * q
+    yield "slerp", lambda: p.slerp(q, 0.5)
+
+
+@case(1000, 100000)
+def affine_points(rng, n):
+    """Translate-rotate-scale of N packed 3D points: fused affine pass vs matrix pass plus offset."""
+    points = array('d', [rng.uniform(-10, 10) for _ in range(3 * n)])
+    transform = Affine3D.from_trs([1, 2, 3], (30, [1, 1, 0]), [2, 1, 0.5])
+    linear, offset = transform.linear, transform.offset
+
+    def separate():
+        out = linear.transform_points(points)
+        for i in range(3):
+            out[i::3] = array('d', [v + offset[i] for v in out[i::3]])
+        return out
+    yield "fused", lambda: transform.transform_points(points)
+    yield "matrix_then_offset", separate
+
+
+@case(3)
+def lerp_matrix(rng, n):
+    from visualization.Animation import lerp_matrix
+    start, end = _random_matrix(rng, 3, 3, Matrix3D), _random_matrix(rng, 3, 3, Matrix3D)
+    yield "lerp_matrix", lambda: lerp_matrix(start, end, 0.5)
+
+
+@case(9, 50, 200)
+def grid_transform(rng, n):
+    """The batched grid transform behind plot_transformation, grid_size = n."""
+    from visualization.TransformationVisualizer import grid_lines, transform_grid
+    lines = grid_lines(2, n)
+    m = Matrix2D([[rng.uniform(-2, 2) for _ in range(2)] for _ in range(2)])
+    yield "transform_grid", lambda: transform_grid(m, lines)
+
+
+def measure(operation, min_time: float, repeats: int) -> dict:
+    """Best and median seconds per call over `repeats` samples of a calibrated loop count."""
+    loops = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(loops):
+            operation()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time or loops >= 1 << 24:
+            break
+        loops *= 2 if elapsed == 0 else max(2, min(10, int(min_time / elapsed * 1.2) + 1))
+    # the calibration runs double as warm-up; every sample below uses the final loop count
+    samples = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        for _ in range(loops):
+            operation()
+        samples.append((time.perf_counter() - start) / loops)
+    return {"best": min(samples), "median": statistics.median(samples), "loops": loops}
+
+
+def run_suite(backends: list, quick: bool = False, pattern: str = None, min_time: float = 0.05,
+              repeats: int = 5, seed: int = 0, report=print) -> dict:
+    """
+    Time every case at every size under every backend.
+
+    Args:
+        backends: backend names to run under
+        quick: only each case's smallest size
+        pattern: only keys containing this text
+        min_time: seconds per timing sample
+        repeats: samples per operation
+        seed: seed for the random inputs
+        report: called with one line per result (None for silence)
+
+    Returns:
+        {key: {"best", "median", "loops"}} with key "case/name[n=size]@backend"
+    """
+    results = {}
+    for build in CASES:
+        for size in build.sizes[:1] if quick else build.sizes:
+            for name, operation in build(random.Random(seed), size):
+                for backend in backends:
+                    key = f"{build.__name__}/{name}[n={size}]@{backend}"
+                    if pattern and pattern not in key:
+                        continue
+                    with use_backend(backend):
+                        results[key] = measure(operation, min_time, repeats)
+                    if report:
+                        report(f"{key:<52} {results[key]['best'] * 1e6:12.2f} us")
+    return results
+
+
+def compare(current: dict, baseline: dict, threshold: float) -> list:
+    """
+    (key, baseline best, current best, ratio, status) for every key in both runs.
+
+    status is "regression" when current is more than `threshold` slower,
+    "improved" when it is more than `threshold` faster, otherwise "ok".
+    """
+    rows = []
+    for key in sorted(current.keys() & baseline.keys()):
+        old, new = baseline[key]["best"], current[key]["best"]
+        ratio = new / old if old else float('inf')
+        status = "regression" if ratio > 1 + threshold else "improved" if ratio < 1 / (1 + threshold) else "ok"
+        rows.append((key, old, new, ratio, status))
+    return rows
+
+
+def metadata(backends: list) -> dict:
+    np = numpy_or_none()
+    return {
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "processor": platform.processor() or platform.machine(),
+        "numpy": np.__version__ if np is not None else None,
+        "backends": backends,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--backend', nargs='+', help="backends to run (default: all available)")
+    parser.add_argument('--quick', action='store_true', help="smallest size of each case only")
+    parser.add_argument('--filter', help="only results whose key contains this text")
+    parser.add_argument('--min-time', type=float, default=0.05, help="seconds per timing sample")
+    parser.add_argument('--repeats', type=int, default=5)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', help="write results JSON here")
+    parser.add_argument('--baseline', help="results JSON to compare against")
+    parser.add_argument('--threshold', type=float, default=0.10, help="allowed slowdown (0.10 = 10%%)")
+    args = parser.parse_args()
+
+    backends = args.backend or available_backends()
+    results = run_suite(backends, args.quick, args.filter, args.min_time, args.repeats, args.seed)
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump({"meta": metadata(backends), "results": results}, f, indent=2, sort_keys=True)
+        print(f"\nWrote {len(results)} results to {args.output}")
+
+    if not args.baseline:
+        return 0
+    with open(args.baseline) as f:
+        baseline = json.load(f)["results"]
+    rows = compare(results, baseline, args.threshold)
+    print(f"\nAgainst {args.baseline} (threshold {args.threshold:.0%})")
+    print(f"{'benchmark':<52} {'baseline (us)':>14} {'current (us)':>14} {'change':>9}  status")
+    for key, old, new, ratio, status in rows:
+        print(f"{key:<52} {old * 1e6:14.2f} {new * 1e6:14.2f} {ratio - 1:+9.1%}  {status}")
+    regressions = [row for row in rows if row[4] == "regression"]
+    missing = sorted(baseline.keys() - results.keys())
+    if missing and not (args.filter or args.quick or args.backend):
+        print(f"{len(missing)} baseline benchmarks were not run: {', '.join(missing[:5])}"
+              + (" ..." if len(missing) > 5 else ""))
+    print(f"{len(regressions)} regressions, {sum(r[4] == 'improved' for r in rows)} improvements, "
+          f"{len(rows)} compared")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
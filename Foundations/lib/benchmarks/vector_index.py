@@ -0,0 +1,92 @@
+"""
+VectorIndex Benchmark
+Query latency and recall@k of exact and approximate nearest-neighbour search.
+
+Two workloads, each at every --sizes count:
+    embeddings - clustered d=64 vectors, cosine; exact blocked scan vs lsh
+    points     - clustered d=3 points, euclidean; exact blocked scan vs kdtree
+
+Queries are stored vectors plus a little noise. For each mode the table
+shows build time (add), mean latency of a single query(), and recall@k:
+the fraction of the exact top k that the mode also returned (exact is 1.0
+by definition). A last column times query_batch() for exact search, which
+scores all queries in the same block multiplies.
+
+Usage:
+    python vector_index.py                         # 100,000 vectors
+    python vector_index.py --sizes 100000 1000000  # ~0.5 GB for the d=64 index at 1M
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+import numpy as np
+
+from linear_algebra.vector_index import VectorIndex
+
+WORKLOADS = [
+    # name, dim, metric, approximate mode
+    ("embeddings", 64, "cosine", "lsh"),
+    ("points", 3, "euclidean", "kdtree"),
+]
+
+
+def make_data(n: int, d: int, clusters: int, rng: np.random.Generator) -> np.ndarray:
+    """n vectors around `clusters` random centres."""
+    centres = rng.standard_normal((clusters, d)) * 4
+    return centres[rng.integers(clusters, size=n)] + rng.standard_normal((n, d))
+
+
+def run(index: VectorIndex, queries: np.ndarray, k: int) -> tuple:
+    """Mean seconds per query() and the result id lists."""
+    start = time.perf_counter()
+    results = [[i for i, _ in index.query(q, k)] for q in queries]
+    return (time.perf_counter() - start) / len(queries), results
+
+
+def recall(found: list, truth: list) -> float:
+    return float(np.mean([len(set(f) & set(t)) / len(t) for f, t in zip(found, truth)]))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sizes', type=int, nargs='+', default=[100000])
+    parser.add_argument('--queries', type=int, default=100)
+    parser.add_argument('-k', type=int, default=10)
+    parser.add_argument('--clusters', type=int, default=1000)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    print(f"{'workload':>12}{'N':>10}{'mode':>9}{'add (s)':>10}{'query (ms)':>12}"
+          f"{'recall@' + str(args.k):>11}{'batch (ms/q)':>14}")
+    for name, dim, metric, mode in WORKLOADS:
+        for n in args.sizes:
+            data = make_data(n, dim, args.clusters, rng)
+            picks = rng.integers(n, size=args.queries)
+            queries = data[picks] + 0.1 * rng.standard_normal((args.queries, dim))
+            truth = None
+            for approximate in (None, mode):
+                start = time.perf_counter()
+                index = VectorIndex(dim, metric=metric, approximate=approximate)
+                index.add(data)
+                built = time.perf_counter() - start
+                index.query(queries[0], args.k)          # builds the k-d tree outside the timing
+                latency, found = run(index, queries, args.k)
+                if approximate is None:
+                    truth = found
+                    start = time.perf_counter()
+                    index.query_batch(queries, args.k)
+                    batch = f"{(time.perf_counter() - start) * 1e3 / args.queries:14.3f}"
+                else:
+                    batch = f"{'-':>14}"
+                print(f"{name:>12}{n:>10}{approximate or 'exact':>9}{built:10.3f}{latency * 1e3:12.3f}"
+                      f"{recall(found, truth):11.3f}{batch}")
+                del index
+
+
+if __name__ == "__main__":
+    main()
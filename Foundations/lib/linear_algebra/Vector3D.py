@@ -1,5 +1,6 @@
 import math
-from vector import Vector
+from array import array
+from .vector import Vector
 class Vector3D(Vector):
     """
     3D Vector class
@@ -13,6 +14,8 @@ class Vector3D(Vector):
     Example:
         >>> v = Vector3D([1,1,2])
     """
+    __slots__ = ()
+
     def __init__(self, components):
         if (len(components)) != 3:
             raise ValueError("Must have exactly 3 components")
@@ -45,39 +48,42 @@ class Vector3D(Vector):
             v1.cross(v2) # [0,0,1]
             v2.cross(v1) # [0,0,-1]
         """
-        x = (self.components[1]*other.components[2]) - (self.components[2]*other.components[1])
-        y = (self.components[2]*other.components[0]) - (self.components[0]*other.components[2])
-        z = (self.components[0]*other.components[1]) - (self.components[1]*other.components[0])
+        a1, a2, a3 = self.components
+        b1, b2, b3 = other.components
+        x = (a2*b3) - (a3*b2)
+        y = (a3*b1) - (a1*b3)
+        z = (a1*b2) - (a2*b1)
 
-        return Vector3D([x,y,z])
+        return Vector3D._wrap(array('d', (x, y, z)))
 
 
-# Cross Product Testing
-v1 = Vector3D([1, 2, 3])
-v2 = Vector3D([4, 5, 6])
-print(v1 + v2)
-print(v1.cross(Vector3D([0, 1, 0])))
-v1,v2 = Vector3D([2,0,0]), Vector3D([0,3,0])
-cross = v1.cross(v2)
-print(cross)
-if  ((cross.dot(v1) == 0) and (cross.dot(v2) == 0)):
-    print("perpendicular!")
-else:
-    print("not perpendicular!")
+if __name__ == "__main__":
+    # Cross Product Testing
+    v1 = Vector3D([1, 2, 3])
+    v2 = Vector3D([4, 5, 6])
+    print(v1 + v2)
+    print(v1.cross(Vector3D([0, 1, 0])))
+    v1,v2 = Vector3D([2,0,0]), Vector3D([0,3,0])
+    cross = v1.cross(v2)
+    print(cross)
+    if  ((cross.dot(v1) == 0) and (cross.dot(v2) == 0)):
+        print("perpendicular!")
+    else:
+        print("not perpendicular!")
 
-v3, v4 = Vector3D([1,2,0]), Vector3D([0,1,3])
-cross2 = v3.cross(v4)
-print(cross2)
-if  ((cross2.dot(v3) == 0) and (cross2.dot(v4) == 0)):
-    print("perpendicular!")
-else:
-    print("not perpendicular!")
+    v3, v4 = Vector3D([1,2,0]), Vector3D([0,1,3])
+    cross2 = v3.cross(v4)
+    print(cross2)
+    if  ((cross2.dot(v3) == 0) and (cross2.dot(v4) == 0)):
+        print("perpendicular!")
+    else:
+        print("not perpendicular!")
 
-#parallel
-v5,v6 = Vector3D([1,2,3]), Vector3D([2,4,6])
-cross3 = v5.cross(v6)
-print(cross3)
-if  ((cross3.dot(v5) == 0) and (cross3.dot(v6) == 0)):
-    print("perpendicular!")
-else:
-    print("not perpendicular!")
\ No newline at end of file
+    #parallel
+    v5,v6 = Vector3D([1,2,3]), Vector3D([2,4,6])
+    cross3 = v5.cross(v6)
+    print(cross3)
+    if  ((cross3.dot(v5) == 0) and (cross3.dot(v6) == 0)):
+        print("perpendicular!")
+    else:
+        print("not perpendicular!")
@@ -0,0 +1,97 @@
+"""
+linear_algebra: vectors, matrices and the backends that compute with them
+Goal: Keep `import linear_algebra` in the low milliseconds however large the package grows
+
+Nothing is imported up front. The public names below are resolved on
+first access through a module-level __getattr__ (PEP 562), which imports
+only the submodule that defines them (and whatever that submodule needs).
+NumPy in particular is only loaded by code that actually uses it: the
+numpy/auto backends, PCA, VectorIndex.
+
+Example:
+    >>> import linear_algebra as la          # no submodule loaded yet
+    >>> la.Matrix3D.rotation(90, "z")        # loads matrix3D (and vector, matrix, backend, ...)
+    >>> from linear_algebra import PCA       # loads pca, and with it numpy
+    >>> la.kernels                           # submodules are reachable as attributes too
+"""
+
+import importlib
+import sys
+import types
+
+# public name -> submodule that defines it
+_EXPORTS = {
+    "Storage": "storage",
+    "Vector": "vector",
+    "Vector3D": "Vector3D",
+    "Matrix": "matrix",
+    "Matrix2D": "matrix2D",
+    "Matrix3D": "matrix3D",
+    "FrozenMatrix": "frozen",
+    "FrozenMatrix2D": "frozen",
+    "FrozenMatrix3D": "frozen",
+    "freeze": "frozen",
+    "LUFactorization": "decompositions",
+    "EigenDecomposition": "decompositions",
+    "SparseMatrix": "sparse",
+    "VectorBatch": "vector_batch",
+    "VectorIndex": "vector_index",
+    "LazyVector": "lazy",
+    "lazy_mode": "lazy",
+    "Stage": "pipeline",
+    "TransformPipeline": "pipeline",
+    "Quaternion": "quaternion",
+    "Affine2D": "affine",
+    "Affine3D": "affine",
+    "PCA": "pca",
+    "IncrementalPCA": "pca",
+    "profile": "instrument",
+    "timer": "instrument",
+    "get_backend": "backend",
+    "set_backend": "backend",
+    "use_backend": "backend",
+    "register_backend": "backend",
+    "available_backends": "backend",
+    "set_workers": "parallel",
+    "get_workers": "parallel",
+}
+
+_SUBMODULES = (
+    "affine", "backend", "conformance", "decompositions", "frozen", "instrument", "kernels", "lazy", "matrix", "matrix2D",
+    "matrix3D", "parallel", "pca", "pipeline", "quaternion", "sparse", "storage", "vector", "Vector3D",
+    "vector_batch", "vector_index",
+)
+
+__all__ = sorted(_EXPORTS)
+
+
+def __getattr__(name: str):
+    """Import the submodule behind `name` on first use and cache the result in this module."""
+    if name in _EXPORTS:
+        value = getattr(importlib.import_module(f".{_EXPORTS[name]}", __name__), name)
+    elif name in _SUBMODULES:
+        value = importlib.import_module(f".{name}", __name__)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list:
+    return sorted(set(globals()) | set(_EXPORTS) | set(_SUBMODULES))
+
+
+class _Package(types.ModuleType):
+    """
+    Importing a submodule binds it as an attribute of the package. For
+    Vector3D the module and the class share a name, so keep the export:
+    linear_algebra.Vector3D is always the class (the module stays in sys.modules).
+    """
+
+    def __setattr__(self, name: str, value) -> None:
+        if name in _EXPORTS and isinstance(value, types.ModuleType):
+            return
+        super().__setattr__(name, value)
+
+
+sys.modules[__name__].__class__ = _Package
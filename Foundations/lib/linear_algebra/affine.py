@@ -0,0 +1,353 @@
+"""
+Affine: translation composed with linear maps, as one homogeneous transform
+Goal: Stop carrying an offset vector next to every Matrix3D; fuse translate-rotate-scale and apply it in one pass
+
+An affine map is p -> A p + t. In homogeneous coordinates it is the single
+(d+1) x (d+1) matrix
+
+    [A  t]
+    [0  1]
+
+so translations compose with rotations, scalings and shears by matrix
+multiplication. We keep the two blocks apart (A as a Matrix2D/Matrix3D, t
+as array('d')) because every operation is cheaper on the blocks:
+
+    compose     (A1, t1) after (A2, t2) = (A1 A2, A1 t2 + t1)
+    inverse     (A^-1, -A^-1 t); for rigid transforms (rotations and
+                translations only) A^-1 = A^T, so no LU is needed
+    transform   A p + t for N packed points in one backend pass
+                (affine_batch); no [x, y, z, 1] copy is built per point
+
+The full homogeneous matrix is still available as `.matrix`.
+
+Example:
+    >>> T = Affine3D.from_trs(translation=[1, 2, 3], rotation=(90, "z"), scale=[2, 2, 2])
+    >>> T.transform_points(points)              # flat array('d'), list of Vector3D or N x 3 ndarray
+    >>> camera = Affine3D.rotation(30, "y").compose(Affine3D.translation(0, 0, -5))
+    >>> camera.inverse()                        # rigid: transpose, no factorization
+"""
+
+from array import array
+
+from .backend import get_backend
+from . import kernels
+from .matrix import Matrix
+from .matrix2D import Matrix2D
+from .matrix3D import Matrix3D
+from .storage import Storage
+from .vector import Vector
+from .Vector3D import Vector3D
+
+
+def _orthogonal(linear: array, d: int, tolerance: float = 1e-9) -> bool:
+    """True when the d x d row-major block has orthonormal columns, so its inverse is its transpose."""
+    for i in range(d):
+        for j in range(i, d):
+            dot = sum(linear[r * d + i] * linear[r * d + j] for r in range(d))
+            if abs(dot - (1.0 if i == j else 0.0)) > tolerance:
+                return False
+    return True
+
+
+class Affine:
+    """
+    Affine transformation p -> linear p + offset (base of Affine2D and Affine3D).
+
+    Attributes:
+        linear: the d x d linear part (Matrix2D/Matrix3D)
+        offset: the translation, array('d') of d numbers
+        rigid: True when the linear part is known to be orthogonal (built
+            from rotations and translations, or checked), so inverse() can
+            transpose it
+    """
+    __slots__ = ('linear', 'offset', 'rigid')
+
+    dim = None
+    _matrix_cls = None
+    _vector_cls = None
+
+    def __init__(self, linear=None, offset=None, rigid: bool = False):
+        """
+        Build from a linear part and a translation.
+
+        Args:
+            linear: d x d matrix (or rows); None for the identity
+            offset: d numbers or a Vector; None for no translation
+            rigid: promise that `linear` is a rotation (enables the cheap inverse)
+
+        Raises:
+            ValueError: If the shapes don't match the dimension
+        """
+        d = self.dim
+        if linear is None:
+            linear = Matrix3D.identity(d) if d == 3 else Matrix2D([[1, 0], [0, 1]])
+        elif not isinstance(linear, Matrix):
+            linear = self._matrix_cls(linear)
+        if linear.rows != d or linear.cols != d:
+            raise ValueError(f"{type(self).__name__} needs a {d}x{d} linear part, got {linear.rows}x{linear.cols}")
+        offset = array('d', bytes(8 * d)) if offset is None else array('d', getattr(offset, 'components', offset))
+        if len(offset) != d:
+            raise ValueError(f"{type(self).__name__} needs {d} offset components, got {len(offset)}")
+        self.linear = linear
+        self.offset = offset
+        self.rigid = rigid
+
+    @classmethod
+    def _from_blocks(cls, linear: array, offset: array, rigid: bool) -> 'Affine':
+        """Wrap a row-major linear buffer and an offset buffer without copying or validating."""
+        transform = cls.__new__(cls)
+        transform.linear = cls._matrix_cls._wrap(Storage(linear, (cls.dim, cls.dim)))
+        transform.offset = offset
+        transform.rigid = rigid
+        return transform
+
+    # -- constructors ---------------------------------------------------------
+
+    @classmethod
+    def identity(cls) -> 'Affine':
+        """The transform that does nothing."""
+        return cls(rigid=True)
+
+    @classmethod
+    def translation(cls, *offset) -> 'Affine':
+        """
+        Pure translation by `offset` (one number per dimension).
+
+        Example:
+            >>> Affine2D.translation(3, -1).apply(Vector([1, 1]))  # Vector([4, 0])
+        """
+        return cls(offset=offset, rigid=True)
+
+    @classmethod
+    def scaling(cls, *scales) -> 'Affine':
+        """Scaling about the origin (same arguments as Matrix2D/Matrix3D.scaling)."""
+        return cls(cls._matrix_cls.scaling(*scales))
+
+    @classmethod
+    def shear(cls, *args, **kwargs) -> 'Affine':
+        """Shear (same arguments as Matrix2D/Matrix3D.shear)."""
+        return cls(cls._matrix_cls.shear(*args, **kwargs))
+
+    @classmethod
+    def from_matrix(cls, matrix: Matrix) -> 'Affine':
+        """
+        Split a (d+1) x (d+1) homogeneous matrix into its blocks.
+
+        The result is rigid when the linear block is orthogonal.
+
+        Raises:
+            ValueError: If the shape is wrong or the last row isn't [0 ... 0 1]
+        """
+        d = cls.dim
+        if matrix.rows != d + 1 or matrix.cols != d + 1:
+            raise ValueError(f"{cls.__name__}.from_matrix needs a {d + 1}x{d + 1} matrix")
+        buffer = matrix._storage.buffer
+        if list(buffer[d * (d + 1):]) != [0.0] * d + [1.0]:
+            raise ValueError("Not an affine matrix: the last row must be [0, ..., 0, 1]")
+        linear = array('d')
+        for i in range(d):
+            linear.extend(buffer[i * (d + 1):i * (d + 1) + d])
+        return cls._from_blocks(linear, array('d', buffer[d::d + 1][:d]), _orthogonal(linear, d))
+
+    @classmethod
+    def from_trs(cls, translation=None, rotation=None, scale=None) -> 'Affine':
+        """
+        Scale, then rotate, then translate, fused into one transform.
+
+        The linear part R diag(s) is built by scaling the columns of R, so
+        no matrix product is computed.
+
+        Args:
+            translation: d numbers or a Vector (None: no translation)
+            rotation: see Affine2D/Affine3D._rotation (None: no rotation)
+            scale: d numbers, or one number for uniform scaling (None: 1)
+
+        Returns:
+            The transform T R S; rigid when no scale is given and the
+            rotation is an angle/axis, a Quaternion, or an orthogonal matrix
+        """
+        d = cls.dim
+        rigid = scale is None
+        if rotation is None:
+            linear = array('d', [1.0 if i == j else 0.0 for i in range(d) for j in range(d)])
+        else:
+            linear = array('d', cls._rotation(rotation)._storage.buffer)
+            if rigid and isinstance(rotation, Matrix):
+                # a matrix passed in may be anything; built rotations are orthogonal by construction
+                rigid = _orthogonal(linear, d)
+        if scale is not None:
+            scales = [scale] * d if isinstance(scale, (int, float)) else list(getattr(scale, 'components', scale))
+            if len(scales) != d:
+                raise ValueError(f"{cls.__name__} needs {d} scale factors, got {len(scales)}")
+            linear = array('d', [value * scales[k % d] for k, value in enumerate(linear)])
+        offset = array('d', bytes(8 * d)) if translation is None \
+            else array('d', getattr(translation, 'components', translation))
+        if len(offset) != d:
+            raise ValueError(f"{cls.__name__} needs {d} translation components, got {len(offset)}")
+        return cls._from_blocks(linear, offset, rigid)
+
+    @staticmethod
+    def _rotation(rotation) -> Matrix:
+        raise NotImplementedError
+
+    # -- properties -------------------------------------------------------------
+
+    @property
+    def matrix(self) -> Matrix:
+        """
+        The full (d+1) x (d+1) homogeneous matrix [[A, t], [0, 1]].
+
+        Returns:
+            Matrix3D (3x3) for Affine2D, plain 4x4 Matrix for Affine3D (a 4x4
+            isn't a 3D linear map, so Matrix3D's rotation/scaling helpers don't apply)
+        """
+        d = self.dim
+        linear = self.linear._storage.buffer
+        buffer = array('d')
+        for i in range(d):
+            buffer.extend(linear[i * d:(i + 1) * d])
+            buffer.append(self.offset[i])
+        buffer.extend([0.0] * d + [1.0])
+        return (Matrix3D if d == 2 else Matrix)._wrap(Storage(buffer, (d + 1, d + 1)))
+
+    def __repr__(self) -> str:
+        rows = self.linear._storage.buffer
+        d = self.dim
+        linear = [list(rows[i * d:(i + 1) * d]) for i in range(d)]
+        return f"{type(self).__name__}(linear={linear}, offset={list(self.offset)}, rigid={self.rigid})"
+
+    # -- operations -------------------------------------------------------------
+
+    def compose(self, other: 'Affine') -> 'Affine':
+        """
+        The transform that first applies other, then self.
+
+        Math: (A1, t1) after (A2, t2) is (A1 A2, A1 t2 + t1): one d x d
+        product and one matrix-vector product, instead of a (d+1)^3 product.
+
+        Raises:
+            ValueError: If the dimensions differ
+
+        Example:
+            >>> Affine2D.translation(1, 0).compose(Affine2D.rotation(90))  # rotate, then shift
+        """
+        if other.dim != self.dim:
+            raise ValueError(f"Can't compose {type(self).__name__} with {type(other).__name__}")
+        d = self.dim
+        backend = get_backend()
+        a = self.linear._storage.buffer
+        linear = backend.matmul(a, other.linear._storage.buffer, d, d, d)
+        offset = backend.affine_batch(a, self.offset, d, d, other.offset)
+        return self._from_blocks(linear, offset, self.rigid and other.rigid)
+
+    def inverse(self) -> 'Affine':
+        """
+        The transform that undoes this one: (A^-1, -A^-1 t).
+
+        Rigid transforms use A^-1 = A^T (a transpose instead of an LU
+        factorization); everything else inverts the linear part.
+
+        Raises:
+            ValueError: If the linear part is singular
+        """
+        d = self.dim
+        backend = get_backend()
+        if self.rigid:
+            inverse = backend.transpose(self.linear._storage.buffer, d, d)
+        else:
+            inverse = self.linear.inverse()._storage.buffer
+        offset = backend.scale(backend.matvec(inverse, d, d, self.offset), -1.0)
+        return self._from_blocks(inverse, offset, self.rigid)
+
+    def apply(self, point) -> Vector:
+        """
+        Transform one point: linear p + offset.
+
+        Args:
+            point: Vector (or d numbers)
+
+        Returns:
+            Vector/Vector3D of the transformed point
+        """
+        d = self.dim
+        components = getattr(point, 'components', point)
+        if len(components) != d:
+            raise ValueError(f"Dimensions don't match ({len(components)} != {d})")
+        out = get_backend().affine_batch(self.linear._storage.buffer, self.offset, d, d, array('d', components))
+        return self._vector_cls._wrap(out)
+
+    def transform_points(self, points, workers=None):
+        """
+        Apply the transform to a whole block of points in one pass.
+
+        The linear part and the offset go to the backend together
+        (affine_batch), so each coordinate is one fused multiply-add row;
+        no homogeneous copy of the points is built.
+
+        Args:
+            points: same layouts as Matrix.transform_points (list of
+                Vectors, flat buffer of N*d numbers, N x d ndarray)
+            workers: processes for big non-NumPy blocks (see parallel.py)
+
+        Returns:
+            Transformed points in the same layout as the input
+
+        Raises:
+            ValueError: If the point dimension doesn't match
+        """
+        return kernels.transform_points(self.linear._storage, points, self._vector_cls,
+                                        get_backend(), workers, self.offset)
+
+    apply_batch = transform_points
+
+
+class Affine2D(Affine):
+    """
+    2D affine transform (3x3 homogeneous).
+
+    Example:
+        >>> T = Affine2D.from_trs(translation=[5, 0], rotation=90, scale=2)
+        >>> T.apply(Vector([1, 0]))  # Vector([5, 2])
+    """
+    __slots__ = ()
+    dim = 2
+    _matrix_cls = Matrix2D
+    _vector_cls = Vector
+
+    @classmethod
+    def rotation(cls, angle_degrees: float) -> 'Affine2D':
+        """Counterclockwise rotation about the origin (see Matrix2D.rotation)."""
+        return cls(Matrix2D.rotation(angle_degrees), rigid=True)
+
+    @staticmethod
+    def _rotation(rotation) -> Matrix:
+        """An angle in degrees, or a 2x2 rotation matrix."""
+        return rotation if isinstance(rotation, Matrix) else Matrix2D.rotation(rotation)
+
+
+class Affine3D(Affine):
+    """
+    3D affine transform (4x4 homogeneous).
+
+    Example:
+        >>> T = Affine3D.rotation(90, "z").compose(Affine3D.translation(1, 0, 0))
+        >>> T.apply(Vector3D([0, 0, 0]))  # Vector3D([0, 1, 0])
+    """
+    __slots__ = ()
+    dim = 3
+    _matrix_cls = Matrix3D
+    _vector_cls = Vector3D
+
+    @classmethod
+    def rotation(cls, angle_degrees: float, axis) -> 'Affine3D':
+        """Rotation about an axis through the origin (see Matrix3D.rotation)."""
+        return cls(Matrix3D.rotation(angle_degrees, axis), rigid=True)
+
+    @staticmethod
+    def _rotation(rotation) -> Matrix:
+        """An (angle_degrees, axis) pair, a Quaternion, or a 3x3 rotation matrix."""
+        if isinstance(rotation, Matrix):
+            return rotation
+        if hasattr(rotation, 'to_matrix'):
+            return rotation.to_matrix()
+        return Matrix3D.rotation(*rotation)
@@ -0,0 +1,524 @@
+"""
+Backend: pluggable compute engines for Vector and Matrix
+Goal: Keep the readable pure-Python math as the reference, and swap in NumPy when speed matters
+
+Every Vector/Matrix operation that does real arithmetic asks the active
+backend to do it on flat array('d') buffers (see Storage). A backend is
+just an object with the methods below; the classes never touch NumPy
+directly.
+
+Registered backends:
+    python - pure Python (kernels.py, plus parallel.py when workers > 1).
+             This is the reference implementation.
+    numpy  - NumPy views over the same buffers (zero-copy in, one copy out).
+    auto   - python for small inputs, numpy for large ones (the default
+             when NumPy is installed, otherwise python).
+
+Selecting a backend:
+    LINALG_BACKEND=numpy python script.py        # environment variable
+    set_backend("numpy")                          # for the whole process
+    with use_backend("python"): ...               # temporarily
+
+Example:
+    >>> with use_backend("numpy"):
+    ...     Matrix3D.rotation(45, "z").multiply_matrix(M)
+"""
+
+import math
+import os
+from array import array
+from contextlib import contextmanager
+from operator import add, mul, sub
+
+from . import decompositions
+from . import kernels
+from . import parallel
+
+# Below these sizes the NumPy round trip costs more than it saves, so the
+# auto backend keeps small work (3x3 transforms, 3D vectors) in pure Python.
+VECTOR_THRESHOLD = 256        # vector length
+NUMPY_THRESHOLD = 32 ** 3     # multiply-adds (m*k*n) for products and batches
+
+_numpy = None
+
+
+def numpy_or_none():
+    """Import NumPy on first use; return None if it isn't installed."""
+    global _numpy
+    if _numpy is None:
+        try:
+            import numpy
+            _numpy = numpy
+        except ImportError:
+            _numpy = False
+    return _numpy or None
+
+
+class Backend:
+    """
+    Interface every backend implements.
+
+    All inputs are flat array('d') buffers (or other float sequences) with
+    shapes passed explicitly; all vector/matrix results are array('d').
+    """
+    name = "base"
+
+    def add(self, a, b) -> array:
+        raise NotImplementedError
+
+    def sub(self, a, b) -> array:
+        raise NotImplementedError
+
+    def scale(self, a, scalar) -> array:
+        raise NotImplementedError
+
+    def dot(self, a, b) -> float:
+        raise NotImplementedError
+
+    def norm(self, a) -> float:
+        raise NotImplementedError
+
+    def matvec(self, a, rows, cols, x) -> array:
+        raise NotImplementedError
+
+    def matvec_batch(self, a, rows, cols, points, workers=None) -> array:
+        raise NotImplementedError
+
+    def affine_batch(self, a, offset, rows, cols, points, workers=None) -> array:
+        raise NotImplementedError
+
+    def matmul(self, a, b, m, k, n, workers=None) -> array:
+        raise NotImplementedError
+
+    def transpose(self, a, rows, cols) -> array:
+        raise NotImplementedError
+
+    def eigen(self, a, n, symmetric, tolerance, max_iterations):
+        raise NotImplementedError
+
+    def csr_matvec(self, values, indices, indptr, rows, x) -> array:
+        raise NotImplementedError
+
+    def csr_matmul(self, values, indices, indptr, rows, b, n) -> array:
+        raise NotImplementedError
+
+    # Row-wise operations on an n x d block of vectors (see vector_batch.py).
+    # b holds either n rows or b_rows = 1 row shared by every row of a.
+
+    def row_dots(self, a, b, n, d, b_rows) -> array:
+        raise NotImplementedError
+
+    def row_norms(self, a, n, d) -> array:
+        raise NotImplementedError
+
+    def normalize_rows(self, a, n, d) -> array:
+        raise NotImplementedError
+
+    def project_rows(self, a, b, n, d, b_rows) -> array:
+        raise NotImplementedError
+
+    def row_angles(self, a, b, n, d, b_rows) -> array:
+        raise NotImplementedError
+
+    def cross_rows(self, a, b, n, b_rows) -> array:
+        raise NotImplementedError
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__} '{self.name}'>"
+
+
+class PythonBackend(Backend):
+    """Pure-Python reference backend built on kernels.py."""
+    name = "python"
+
+    def add(self, a, b) -> array:
+        return array('d', map(add, a, b))
+
+    def sub(self, a, b) -> array:
+        return array('d', map(sub, a, b))
+
+    def scale(self, a, scalar) -> array:
+        return array('d', [scalar * x for x in a])
+
+    def dot(self, a, b) -> float:
+        return sum(map(mul, a, b))
+
+    def norm(self, a) -> float:
+        return sum(map(mul, a, a)) ** 0.5
+
+    def matvec(self, a, rows, cols, x) -> array:
+        return kernels.matvec(a, rows, cols, x)
+
+    def matvec_batch(self, a, rows, cols, points, workers=None) -> array:
+        workers = parallel.resolve_workers(workers)
+        if workers > 1 and cols and len(points) // cols >= parallel.TRANSFORM_THRESHOLD:
+            return parallel.matvec_batch(a, rows, cols, points, workers)
+        return kernels.matvec_batch(a, rows, cols, points)
+
+    def affine_batch(self, a, offset, rows, cols, points, workers=None) -> array:
+        workers = parallel.resolve_workers(workers)
+        if workers > 1 and cols and len(points) // cols >= parallel.TRANSFORM_THRESHOLD:
+            return parallel.matvec_batch(a, rows, cols, points, workers, offset)
+        return kernels.affine_batch(a, offset, rows, cols, points)
+
+    def matmul(self, a, b, m, k, n, workers=None) -> array:
+        workers = parallel.resolve_workers(workers)
+        if workers > 1 and m * k * n >= parallel.MATMUL_THRESHOLD:
+            return parallel.multiply(a, b, m, k, n, workers)
+        return kernels.gemm(a, b, m, k, n)
+
+    def transpose(self, a, rows, cols) -> array:
+        return kernels.transpose(a, rows, cols)
+
+    def eigen(self, a, n, symmetric, tolerance, max_iterations):
+        return decompositions.eigen(a, n, symmetric, tolerance, max_iterations)
+
+    def csr_matvec(self, values, indices, indptr, rows, x) -> array:
+        return kernels.csr_matvec(values, indices, indptr, rows, x)
+
+    def csr_matmul(self, values, indices, indptr, rows, b, n) -> array:
+        return kernels.csr_matmul(values, indices, indptr, rows, b, n)
+
+    def row_dots(self, a, b, n, d, b_rows) -> array:
+        return kernels.row_dots(a, b, n, d, b_rows)
+
+    def row_norms(self, a, n, d) -> array:
+        return array('d', [x ** 0.5 for x in kernels.row_dots(a, a, n, d)])
+
+    def normalize_rows(self, a, n, d) -> array:
+        # zero rows have no direction and stay zero
+        return kernels.scale_rows(a, [1.0 / x if x else 0.0 for x in self.row_norms(a, n, d)], n, d)
+
+    def project_rows(self, a, b, n, d, b_rows) -> array:
+        dots = kernels.row_dots(a, b, n, d, b_rows)
+        lengths = kernels.row_dots(b, b, b_rows, d)
+        if b_rows == 1:
+            factors = [x / lengths[0] if lengths[0] else 0.0 for x in dots]
+        else:
+            factors = [x / y if y else 0.0 for x, y in zip(dots, lengths)]
+        return kernels.scale_rows(b, factors, n, d)
+
+    def row_angles(self, a, b, n, d, b_rows) -> array:
+        dots = kernels.row_dots(a, b, n, d, b_rows)
+        norms_a = self.row_norms(a, n, d)
+        norms_b = self.row_norms(b, b_rows, d)
+        if b_rows == 1:
+            norms_b = [norms_b[0]] * n
+        angles = array('d')
+        for dot, x, y in zip(dots, norms_a, norms_b):
+            if x and y:
+                angles.append(math.degrees(math.acos(max(-1.0, min(1.0, dot / (x * y))))))
+            else:
+                angles.append(math.nan)   # no angle with a zero vector
+        return angles
+
+    def cross_rows(self, a, b, n, b_rows) -> array:
+        return kernels.cross_rows(a, b, n, b_rows)
+
+
+class NumpyBackend(Backend):
+    """
+    NumPy backend: wraps the same buffers with np.frombuffer (no copy) and
+    copies only the result back into an array('d').
+    """
+    name = "numpy"
+
+    def __init__(self):
+        np = numpy_or_none()
+        if np is None:
+            raise ImportError("The numpy backend needs NumPy installed")
+        self.np = np
+
+    def _view(self, values, shape=None):
+        np = self.np
+        if isinstance(values, array) and values.typecode == 'd':
+            view = np.frombuffer(values, dtype=float)
+        else:
+            view = np.asarray(values, dtype=float)
+        return view.reshape(shape) if shape is not None else view
+
+    @staticmethod
+    def _out(result) -> array:
+        out = array('d')
+        out.frombytes(result.tobytes())
+        return out
+
+    def add(self, a, b) -> array:
+        return self._out(self._view(a) + self._view(b))
+
+    def sub(self, a, b) -> array:
+        return self._out(self._view(a) - self._view(b))
+
+    def scale(self, a, scalar) -> array:
+        return self._out(self._view(a) * scalar)
+
+    def dot(self, a, b) -> float:
+        return float(self._view(a) @ self._view(b))
+
+    def norm(self, a) -> float:
+        return float(self.np.linalg.norm(self._view(a)))
+
+    def matvec(self, a, rows, cols, x) -> array:
+        return self._out(self._view(a, (rows, cols)) @ self._view(x))
+
+    def matvec_batch(self, a, rows, cols, points, workers=None) -> array:
+        if cols == 0 or len(points) % cols:
+            raise ValueError(f"Point buffer length {len(points)} isn't a multiple of dimension {cols}")
+        pts = self._view(points, (len(points) // cols, cols))
+        return self._out(pts @ self._view(a, (rows, cols)).T)
+
+    def affine_batch(self, a, offset, rows, cols, points, workers=None) -> array:
+        if cols == 0 or len(points) % cols:
+            raise ValueError(f"Point buffer length {len(points)} isn't a multiple of dimension {cols}")
+        pts = self._view(points, (len(points) // cols, cols))
+        result = pts @ self._view(a, (rows, cols)).T
+        result += self._view(offset)
+        return self._out(result)
+
+    def matmul(self, a, b, m, k, n, workers=None) -> array:
+        return self._out(self._view(a, (m, k)) @ self._view(b, (k, n)))
+
+    def transpose(self, a, rows, cols) -> array:
+        return self._out(self._view(a, (rows, cols)).T)
+
+    def eigen(self, a, n, symmetric, tolerance, max_iterations):
+        # LAPACK (eigh / eig) runs its own QR iterations and doesn't report
+        # them, so tolerance and max_iterations don't apply here
+        np = self.np
+        matrix = self._view(a, (n, n))
+        values, vectors = (np.linalg.eigh if symmetric else np.linalg.eig)(matrix)
+        values, vectors = decompositions.pack_eigenpairs(values.tolist(), vectors.T.tolist(), n,
+                                                         float(np.abs(matrix).max(initial=0.0)))
+        return decompositions.EigenDecomposition(values, vectors, None, True, "lapack")
+
+    def _csr_sum(self, contributions, indptr, rows):
+        """Sum the per-entry contributions of each CSR row (rows are contiguous runs)."""
+        np = self.np
+        starts = np.frombuffer(indptr, dtype=np.int64)
+        out = np.zeros((rows,) + contributions.shape[1:])
+        filled = starts[1:] > starts[:-1]   # reduceat can't express an empty run
+        if filled.any():
+            out[filled] = np.add.reduceat(contributions, starts[:-1][filled], axis=0)
+        return self._out(out)
+
+    def csr_matvec(self, values, indices, indptr, rows, x) -> array:
+        np = self.np
+        columns = np.frombuffer(indices, dtype=np.int64)
+        return self._csr_sum(self._view(values) * self._view(x)[columns], indptr, rows)
+
+    def row_dots(self, a, b, n, d, b_rows) -> array:
+        rows, other = self._view(a, (n, d)), self._view(b, (b_rows, d))
+        if b_rows == 1:
+            return self._out(rows @ other[0])
+        return self._out(self.np.einsum('ij,ij->i', rows, other))
+
+    def row_norms(self, a, n, d) -> array:
+        return self._out(self.np.linalg.norm(self._view(a, (n, d)), axis=1))
+
+    def normalize_rows(self, a, n, d) -> array:
+        np = self.np
+        rows = self._view(a, (n, d))
+        norms = np.linalg.norm(rows, axis=1, keepdims=True)
+        return self._out(np.divide(rows, norms, out=np.zeros_like(rows), where=norms != 0))
+
+    def project_rows(self, a, b, n, d, b_rows) -> array:
+        np = self.np
+        rows, other = self._view(a, (n, d)), self._view(b, (b_rows, d))
+        dots = np.einsum('ij,ij->i', rows, np.broadcast_to(other, (n, d)))
+        lengths = np.einsum('ij,ij->i', other, other)
+        factors = np.divide(dots, lengths, out=np.zeros(n), where=np.broadcast_to(lengths != 0, (n,)))
+        return self._out(factors[:, None] * other)
+
+    def row_angles(self, a, b, n, d, b_rows) -> array:
+        np = self.np
+        rows, other = self._view(a, (n, d)), self._view(b, (b_rows, d))
+        dots = np.einsum('ij,ij->i', rows, np.broadcast_to(other, (n, d)))
+        norms = np.linalg.norm(rows, axis=1) * np.linalg.norm(other, axis=1)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            cosines = np.where(norms != 0, dots / norms, np.nan)
+        return self._out(np.degrees(np.arccos(np.clip(cosines, -1.0, 1.0))))
+
+    def cross_rows(self, a, b, n, b_rows) -> array:
+        return self._out(self.np.cross(self._view(a, (n, 3)), self._view(b, (b_rows, 3))))
+
+    def csr_matmul(self, values, indices, indptr, rows, b, n) -> array:
+        np = self.np
+        columns = np.frombuffer(indices, dtype=np.int64)
+        b = self._view(b, (len(b) // n if n else 0, n))
+        return self._csr_sum(self._view(values)[:, None] * b[columns], indptr, rows)
+
+
+class AutoBackend(Backend):
+    """
+    Size-based dispatch: pure Python for small work, NumPy for large work.
+
+    Process-pool parallelism (workers > 1) is a pure-Python feature, so a
+    product with workers > 1 always goes to the python backend.
+    """
+    name = "auto"
+
+    def __init__(self):
+        self.python = PythonBackend()
+        self._numpy = None
+
+    def _fast(self) -> Backend:
+        """NumPy backend, created only once some input is big enough to want it."""
+        if self._numpy is None:
+            self._numpy = NumpyBackend() if numpy_or_none() is not None else self.python
+        return self._numpy
+
+    def _pick(self, work: int) -> Backend:
+        return self._fast() if work >= NUMPY_THRESHOLD else self.python
+
+    def _pick_vector(self, a) -> Backend:
+        return self._fast() if len(a) >= VECTOR_THRESHOLD else self.python
+
+    def add(self, a, b) -> array:
+        return self._pick_vector(a).add(a, b)
+
+    def sub(self, a, b) -> array:
+        return self._pick_vector(a).sub(a, b)
+
+    def scale(self, a, scalar) -> array:
+        return self._pick_vector(a).scale(a, scalar)
+
+    def dot(self, a, b) -> float:
+        return self._pick_vector(a).dot(a, b)
+
+    def norm(self, a) -> float:
+        return self._pick_vector(a).norm(a)
+
+    def matvec(self, a, rows, cols, x) -> array:
+        return self._pick_vector(a).matvec(a, rows, cols, x)
+
+    def matvec_batch(self, a, rows, cols, points, workers=None) -> array:
+        if parallel.resolve_workers(workers) > 1:
+            return self.python.matvec_batch(a, rows, cols, points, workers)
+        return self._pick(len(points) * rows).matvec_batch(a, rows, cols, points)
+
+    def affine_batch(self, a, offset, rows, cols, points, workers=None) -> array:
+        if parallel.resolve_workers(workers) > 1:
+            return self.python.affine_batch(a, offset, rows, cols, points, workers)
+        return self._pick(len(points) * rows).affine_batch(a, offset, rows, cols, points)
+
+    def matmul(self, a, b, m, k, n, workers=None) -> array:
+        if parallel.resolve_workers(workers) > 1:
+            return self.python.matmul(a, b, m, k, n, workers)
+        return self._pick(m * k * n).matmul(a, b, m, k, n)
+
+    def transpose(self, a, rows, cols) -> array:
+        return self.python.transpose(a, rows, cols)
+
+    def eigen(self, a, n, symmetric, tolerance, max_iterations):
+        return self._pick(n * n * n).eigen(a, n, symmetric, tolerance, max_iterations)
+
+    def csr_matvec(self, values, indices, indptr, rows, x) -> array:
+        return self._pick_vector(values).csr_matvec(values, indices, indptr, rows, x)
+
+    def csr_matmul(self, values, indices, indptr, rows, b, n) -> array:
+        return self._pick(len(values) * n).csr_matmul(values, indices, indptr, rows, b, n)
+
+    def row_dots(self, a, b, n, d, b_rows) -> array:
+        return self._pick_vector(a).row_dots(a, b, n, d, b_rows)
+
+    def row_norms(self, a, n, d) -> array:
+        return self._pick_vector(a).row_norms(a, n, d)
+
+    def normalize_rows(self, a, n, d) -> array:
+        return self._pick_vector(a).normalize_rows(a, n, d)
+
+    def project_rows(self, a, b, n, d, b_rows) -> array:
+        return self._pick_vector(a).project_rows(a, b, n, d, b_rows)
+
+    def row_angles(self, a, b, n, d, b_rows) -> array:
+        return self._pick_vector(a).row_angles(a, b, n, d, b_rows)
+
+    def cross_rows(self, a, b, n, b_rows) -> array:
+        return self._pick_vector(a).cross_rows(a, b, n, b_rows)
+
+
+_factories = {}
+_instances = {}
+_active = None
+
+# Set by instrument.Profile while profiling: wraps the backend handed out by
+# get_backend() in a call-counting proxy.
+_observer = None
+
+
+def register_backend(name: str, factory) -> None:
+    """
+    Register a backend under a name.
+
+    Args:
+        name: name used by get_backend/set_backend/LINALG_BACKEND
+        factory: zero-argument callable returning a Backend (called lazily,
+            so optional dependencies are only imported when selected)
+    """
+    _factories[name] = factory
+    _instances.pop(name, None)
+
+
+def get_backend(name: str = None) -> Backend:
+    """
+    Return a backend instance.
+
+    Args:
+        name: registered backend name, or None for the active backend
+
+    Raises:
+        ValueError: If no backend is registered under that name
+        ImportError: If the backend's dependency isn't installed
+    """
+    global _active
+    if name is None:
+        if _active is None:
+            _active = get_backend(os.environ.get("LINALG_BACKEND", "auto"))
+        return _active if _observer is None else _observer(_active)
+    if name not in _instances:
+        if name not in _factories:
+            raise ValueError(f"Unknown backend '{name}'. Registered: {sorted(_factories)}")
+        _instances[name] = _factories[name]()
+    return _instances[name]
+
+
+def set_backend(name: str) -> Backend:
+    """Make `name` the active backend for the rest of the process."""
+    global _active
+    _active = get_backend(name)
+    return _active
+
+
+@contextmanager
+def use_backend(name: str):
+    """
+    Temporarily switch the active backend.
+
+    Example:
+        >>> with use_backend("python"):
+        ...     reference = A.multiply_matrix(B)
+    """
+    global _active
+    previous = _active
+    _active = get_backend(name)
+    try:
+        yield get_backend()
+    finally:
+        _active = previous
+
+
+def available_backends() -> list:
+    """Names of registered backends whose dependencies are installed."""
+    names = []
+    for name in _factories:
+        try:
+            get_backend(name)
+            names.append(name)
+        except ImportError:
+            pass
+    return names
+
+
+register_backend("python", PythonBackend)
+register_backend("numpy", NumpyBackend)
+register_backend("auto", AutoBackend)
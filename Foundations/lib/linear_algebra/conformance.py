@@ -0,0 +1,256 @@
+"""
+Backend Conformance Suite
+Checks that every backend gives the same answers as the pure-Python reference.
+
+Each case builds its inputs once from a fixed seed, runs the same public
+Vector/Matrix operation under each backend (via use_backend), and compares
+the results element by element with a relative tolerance.
+
+Usage:
+    python -m linear_algebra.conformance       # from lib/: python vs every other backend
+    python -m linear_algebra.conformance --candidate numpy --tolerance 1e-12
+    python -m pytest tests                     # the same cases, one test per case and backend
+"""
+
+import argparse
+import random
+import sys
+from array import array
+
+from .affine import Affine2D, Affine3D
+from .backend import available_backends, use_backend
+from .lazy import lazy_mode
+from .matrix import Matrix
+from .matrix2D import Matrix2D
+from .matrix3D import Matrix3D
+from .sparse import SparseMatrix
+from .vector import Vector
+from .vector_batch import VectorBatch
+from .Vector3D import Vector3D
+
+CASES = []
+
+
+def case(fn):
+    """Register a conformance case (a function of a seeded Random)."""
+    CASES.append(fn)
+    return fn
+
+
+def _random_vector(rng, n):
+    return Vector([rng.uniform(-10, 10) for _ in range(n)])
+
+
+def _random_matrix(rng, rows, cols, cls=Matrix):
+    return cls([[rng.uniform(-10, 10) for _ in range(cols)] for _ in range(rows)])
+
+
+def _flatten(result):
+    """Reduce any operation result to a flat list of floats for comparison."""
+    if isinstance(result, (int, float)):
+        return [float(result)]
+    if isinstance(result, complex):
+        return [result.real, result.imag]
+    if isinstance(result, Vector):
+        return list(result.components)
+    if isinstance(result, Matrix):
+        return list(result._storage.buffer)
+    if isinstance(result, (list, tuple)):
+        values = []
+        for item in result:
+            values.extend(_flatten(item))
+        return values
+    return [float(x) for x in result]
+
+
+@case
+def vector_arithmetic(rng):
+    for n in (3, 300, 5000):
+        a, b = _random_vector(rng, n), _random_vector(rng, n)
+        yield f"add n={n}", lambda: a + b
+        yield f"sub n={n}", lambda: a - b
+        yield f"scale n={n}", lambda: a * 2.5
+        yield f"chain n={n}", lambda: a * 2 + b - a * 3
+
+
+@case
+def lazy_arithmetic(rng):
+    for n in (3, 300, 5000):
+        a, b, c = _random_vector(rng, n), _random_vector(rng, n), _random_vector(rng, n)
+
+        def chain():
+            with lazy_mode():
+                shared = a * 2 + b
+                return shared * 0.5 + shared - c * 3
+        yield f"lazy components n={n}", lambda: chain().components
+        yield f"lazy dot n={n}", lambda: chain().dot(b)
+        yield f"lazy magnitude n={n}", lambda: chain().magnitude()
+
+
+@case
+def vector_geometry(rng):
+    for n in (3, 300, 5000):
+        a, b = _random_vector(rng, n), _random_vector(rng, n)
+        yield f"dot n={n}", lambda: a.dot(b)
+        yield f"magnitude n={n}", lambda: a.magnitude()
+        yield f"normalize n={n}", lambda: a.normalize()
+        yield f"angle_between n={n}", lambda: a.angle_between(b)
+        yield f"projection n={n}", lambda: a.projection(b)
+    u = Vector3D([rng.uniform(-1, 1) for _ in range(3)])
+    v = Vector3D([rng.uniform(-1, 1) for _ in range(3)])
+    yield "cross", lambda: u.cross(v)
+
+
+@case
+def vector_batch(rng):
+    for n, d in ((10, 2), (500, 3), (2000, 64)):
+        a = VectorBatch([[rng.uniform(-10, 10) for _ in range(d)] for _ in range(n)])
+        b = VectorBatch([[rng.uniform(-10, 10) for _ in range(d)] for _ in range(n)])
+        v = _random_vector(rng, d)
+        yield f"batch dot {n}x{d}", lambda: a.dot(b)
+        yield f"batch dot vector {n}x{d}", lambda: a.dot(v)
+        yield f"batch pairwise_dots {n}x{d}", lambda: a.pairwise_dots(VectorBatch(list(b)[:20]))
+        yield f"batch norms {n}x{d}", lambda: a.norms()
+        yield f"batch normalize {n}x{d}", lambda: a.normalize().buffer
+        yield f"batch angle_between {n}x{d}", lambda: a.angle_between(b)
+        yield f"batch project_onto {n}x{d}", lambda: a.project_onto(b).buffer
+        yield f"batch project_onto vector {n}x{d}", lambda: a.project_onto(v).buffer
+        if d == 3:
+            yield f"batch cross {n}", lambda: a.cross(b).buffer
+            yield f"batch cross vector {n}", lambda: a.cross(Vector3D(v.components)).buffer
+
+
+@case
+def matrix_vector(rng):
+    for rows, cols in ((2, 2), (3, 3), (5, 7), (64, 64)):
+        m = _random_matrix(rng, rows, cols)
+        v = _random_vector(rng, cols)
+        yield f"multiply_vector {rows}x{cols}", lambda: m.multiply_vector(v)
+    r = Matrix3D.rotation(rng.uniform(0, 360), "y")
+    yield "Matrix3D.multiply_vector", lambda: r.multiply_vector(Vector3D([1, 2, 3]))
+    yield "Matrix2D.multiply_vector", lambda: Matrix2D.shear(0.5).multiply_vector(Vector([1, 2]))
+
+
+@case
+def batch_transform(rng):
+    for rows, cols, n in ((2, 2, 100), (3, 3, 20000), (4, 6, 500)):
+        m = _random_matrix(rng, rows, cols)
+        flat = array('d', [rng.uniform(-5, 5) for _ in range(n * cols)])
+        vectors = [Vector(flat[i:i + cols]) for i in range(0, min(len(flat), 50 * cols), cols)]
+        yield f"transform_points buffer {rows}x{cols} N={n}", lambda: m.transform_points(flat)
+        yield f"transform_points vectors {rows}x{cols}", lambda: m.transform_points(vectors)
+
+
+@case
+def affine_transform(rng):
+    t3 = Affine3D.from_trs([rng.uniform(-5, 5) for _ in range(3)], (rng.uniform(0, 360), [1, 2, 3]), [2, 1, 3])
+    t2 = Affine2D.translation(1, -2).compose(Affine2D.shear(0.5))
+    for t, n in ((t2, 100), (t3, 20000)):
+        d = t.dim
+        flat = array('d', [rng.uniform(-5, 5) for _ in range(n * d)])
+        yield f"Affine{d}D transform_points buffer N={n}", lambda: t.transform_points(flat)
+        yield f"Affine{d}D compose", lambda: t.compose(t).matrix
+        yield f"Affine{d}D inverse", lambda: t.inverse().matrix
+    yield "Affine3D rigid inverse", lambda: Affine3D.rotation(40, "x").compose(Affine3D.translation(1, 2, 3)).inverse().matrix
+
+
+@case
+def matrix_matrix(rng):
+    for m, k, n in ((2, 2, 2), (3, 3, 3), (4, 9, 2), (17, 33, 9), (70, 70, 70), (40, 130, 25)):
+        a, b = _random_matrix(rng, m, k), _random_matrix(rng, k, n)
+        yield f"multiply_matrix {m}x{k} @ {k}x{n}", lambda: a.multiply_matrix(b)
+        yield f"transpose {m}x{k}", lambda: a.transpose()
+    r = Matrix3D.rotation(30, "x")
+    s = Matrix3D.scaling(1, 2, 3)
+    yield "Matrix3D compose", lambda: r.multiply_matrix(s)
+    yield "Matrix2D compose", lambda: Matrix2D.rotation(30).multiply_Matrix2D(Matrix2D.scaling(2, 1))
+
+
+@case
+def eigen(rng):
+    for n in (2, 3, 8, 40):
+        a = _random_matrix(rng, n, n)
+        s = a.multiply_matrix(a.transpose())
+        yield f"eigen symmetric {n}x{n}", lambda: tuple(s.eigen())
+        yield f"eigen general {n}x{n}", lambda: tuple(a.eigen())
+        yield f"top_k_eigen lanczos {n}x{n}", lambda: tuple(s.top_k_eigen(2))
+        yield f"top_k_eigen power {n}x{n}", lambda: tuple(s.top_k_eigen(2, method="power", max_iterations=5000))
+    r = Matrix3D.rotation(rng.uniform(0, 360), "x")
+    yield "Matrix3D.rotation eigen", lambda: r.eigen().values
+
+
+@case
+def sparse(rng):
+    for rows, cols, nnz in ((3, 3, 4), (50, 40, 120), (400, 400, 2000)):
+        cells = rng.sample(range(rows * cols), nnz)
+        s = SparseMatrix.from_coo([c // cols for c in cells], [c % cols for c in cells],
+                                  [rng.uniform(-10, 10) for _ in cells], (rows, cols))
+        v = _random_vector(rng, cols)
+        b = _random_matrix(rng, cols, 7)
+        yield f"sparse multiply_vector {rows}x{cols} nnz={nnz}", lambda: s.multiply_vector(v)
+        yield f"sparse multiply_matrix {rows}x{cols} @ {cols}x7", lambda: s.multiply_matrix(b)
+    empty_rows = SparseMatrix.from_coo([0, 4], [1, 2], [1.0, 2.0], (6, 3))
+    yield "sparse empty rows", lambda: empty_rows.multiply_matrix(Matrix3D.rotation(30, "z"))
+
+
+def _close(expected, actual, tolerance):
+    if len(expected) != len(actual):
+        return False
+    for e, a in zip(expected, actual):
+        if abs(e - a) > tolerance * max(1.0, abs(e), abs(a)):
+            return False
+    return True
+
+
+def check_conformance(reference: str = "python", candidate: str = "numpy",
+                      tolerance: float = 1e-9, seed: int = 0, cases: list = None) -> list:
+    """
+    Run every registered case under two backends and compare.
+
+    Args:
+        reference: backend treated as the source of truth
+        candidate: backend being checked
+        tolerance: allowed relative difference per element
+        seed: seed for the random inputs
+        cases: registered cases to run (default: all of CASES)
+
+    Returns:
+        List of failure messages (empty when the backends agree)
+    """
+    failures = []
+    for build in CASES if cases is None else cases:
+        for name, operation in build(random.Random(seed)):
+            with use_backend(reference):
+                expected = _flatten(operation())
+            with use_backend(candidate):
+                actual = _flatten(operation())
+            if not _close(expected, actual, tolerance):
+                worst = max((abs(e - a) for e, a in zip(expected, actual)), default=float('nan'))
+                failures.append(f"{build.__name__}: {name} (max abs diff {worst:.3g})")
+    return failures
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--reference', default="python")
+    parser.add_argument('--candidate', nargs='*', help="backends to check (default: all others)")
+    parser.add_argument('--tolerance', type=float, default=1e-9)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    candidates = args.candidate or [b for b in available_backends() if b != args.reference]
+    status = 0
+    for candidate in candidates:
+        failures = check_conformance(args.reference, candidate, args.tolerance, args.seed)
+        if failures:
+            status = 1
+            print(f"{candidate} vs {args.reference}: {len(failures)} mismatches")
+            for failure in failures:
+                print(f"  {failure}")
+        else:
+            print(f"{candidate} vs {args.reference}: all cases match")
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
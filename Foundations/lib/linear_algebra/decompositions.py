@@ -0,0 +1,763 @@
+"""
+Decompositions: LU, QR and eigen factorizations on flat Storage buffers
+Goal: Factor a matrix once, then reuse the pieces for cheap solves, inverses and determinants
+
+Factoring is the O(n^3) part of almost every "hard" matrix question:
+    - LU (with partial pivoting): PA = LU, so Ax = b becomes two triangular
+      solves (O(n^2) each), det(A) is the product of U's diagonal.
+    - QR: A = QR with Q orthonormal and R upper triangular.
+    - Eigen: A v = lambda v. All eigenpairs come from Hessenberg reduction
+      plus the shifted QR algorithm; a few dominant ones of a symmetric
+      matrix come from power or Lanczos iteration, which only need A @ v.
+"""
+
+import cmath
+import math
+import random
+from array import array
+from operator import mul
+
+# A pivot smaller than this (relative to the largest entry) is treated as zero.
+SINGULAR_TOLERANCE = 1e-12
+
+# Eigen defaults. EIGEN_TOLERANCE is relative: a subdiagonal entry of the QR
+# iterate (or a power/Lanczos residual) below tolerance * scale counts as zero.
+EIGEN_TOLERANCE = 1e-12
+EIGEN_ITERATIONS_PER_VALUE = 50     # QR sweeps allowed per eigenvalue
+IMAGINARY_TOLERANCE = 1e-10         # |Im(lambda)| below this * scale is a real eigenvalue
+
+
+class LUFactorization:
+    """
+    LU factorization with partial pivoting: P A = L U.
+
+    L (unit lower triangular) and U (upper triangular) are packed into one
+    n x n row-major buffer: U on and above the diagonal, the multipliers of
+    L below it (L's ones on the diagonal are implied). The row swaps are
+    kept as a permutation list.
+
+    Attributes:
+        n: size of the (square) matrix
+        lu: array('d') holding L and U packed together
+        perm: perm[i] is the original row that ended up in row i
+        sign: +1 or -1, the parity of the row swaps (for the determinant)
+        singular: True if some pivot was (numerically) zero
+
+    Example:
+        >>> lu = LUFactorization(Matrix([[4, 3], [6, 3]])._storage)
+        >>> lu.determinant()     # -6.0
+        >>> lu.solve([10, 12])   # array('d', [1.0, 2.0])
+    """
+    __slots__ = ('n', 'lu', 'perm', 'sign', 'singular')
+
+    def __init__(self, storage):
+        """
+        Factor a square matrix.
+
+        Args:
+            storage: 2D Storage of a square matrix (it is copied, not modified)
+
+        Raises:
+            ValueError: If the matrix isn't square
+        """
+        rows, cols = storage.shape
+        if rows != cols:
+            raise ValueError(f"LU needs a square matrix, got {rows}x{cols}")
+        n = rows
+        lu = array('d', storage.buffer)
+        perm = list(range(n))
+        sign = 1
+        singular = False
+        scale = max(map(abs, lu), default=0.0)
+        tiny = SINGULAR_TOLERANCE * scale
+
+        for k in range(n):
+            # Partial pivoting: bring the largest |entry| in column k up to row k.
+            p = max(range(k, n), key=lambda i: abs(lu[i * n + k]))
+            if p != k:
+                lu[k * n:(k + 1) * n], lu[p * n:(p + 1) * n] = lu[p * n:(p + 1) * n], lu[k * n:(k + 1) * n]
+                perm[k], perm[p] = perm[p], perm[k]
+                sign = -sign
+            pivot = lu[k * n + k]
+            if abs(pivot) <= tiny:
+                singular = True
+                continue
+            pivot_row = lu[k * n + k + 1:(k + 1) * n]
+            for i in range(k + 1, n):
+                factor = lu[i * n + k] / pivot
+                lu[i * n + k] = factor
+                if factor:
+                    # row_i -= factor * row_k, done on the slice right of the pivot
+                    start, end = i * n + k + 1, (i + 1) * n
+                    lu[start:end] = array('d', [x - factor * y for x, y in zip(lu[start:end], pivot_row)])
+
+        self.n = n
+        self.lu = lu
+        self.perm = perm
+        self.sign = sign
+        self.singular = singular
+
+    def determinant(self) -> float:
+        """
+        det(A) = sign * product of U's diagonal.
+
+        Returns:
+            Float determinant (0.0 for a singular matrix)
+        """
+        if self.singular:
+            return 0.0
+        n, lu = self.n, self.lu
+        return self.sign * math.prod(lu[i * n + i] for i in range(n))
+
+    def solve(self, b) -> array:
+        """
+        Solve A x = b with one forward and one back substitution (O(n^2)).
+
+        Args:
+            b: sequence of n numbers
+
+        Returns:
+            array('d') x
+
+        Raises:
+            ValueError: If the matrix is singular or b has the wrong length
+        """
+        n, lu = self.n, self.lu
+        if len(b) != n:
+            raise ValueError(f"Right-hand side has {len(b)} entries, expected {n}")
+        if self.singular:
+            raise ValueError("Matrix is singular")
+        # L y = P b  (L has an implied unit diagonal)
+        x = array('d', [b[p] for p in self.perm])
+        for i in range(1, n):
+            x[i] -= sum(map(mul, lu[i * n:i * n + i], x[:i]))
+        # U x = y
+        for i in range(n - 1, -1, -1):
+            x[i] = (x[i] - sum(map(mul, lu[i * n + i + 1:(i + 1) * n], x[i + 1:]))) / lu[i * n + i]
+        return x
+
+    def solve_many(self, b, k: int) -> array:
+        """
+        Solve A X = B for k right-hand sides at once.
+
+        B is n x k row-major (column j is one right-hand side). The
+        substitutions run on whole rows of B, so each step is one row
+        operation of length k instead of k separate scalar updates.
+
+        Args:
+            b: n*k numbers, row-major
+            k: number of right-hand sides (columns of B)
+
+        Returns:
+            array('d') X, n x k row-major
+
+        Raises:
+            ValueError: If the matrix is singular or b has the wrong length
+        """
+        n, lu = self.n, self.lu
+        if len(b) != n * k:
+            raise ValueError(f"Right-hand side has {len(b)} entries, expected {n}x{k}")
+        if self.singular:
+            raise ValueError("Matrix is singular")
+        x = array('d')
+        for p in self.perm:
+            x.extend(b[p * k:(p + 1) * k])
+        # L Y = P B: row_i -= l_ij * row_j for j < i
+        for i in range(1, n):
+            row = x[i * k:(i + 1) * k]
+            for j in range(i):
+                factor = lu[i * n + j]
+                if factor:
+                    row = array('d', [r - factor * y for r, y in zip(row, x[j * k:(j + 1) * k])])
+            x[i * k:(i + 1) * k] = row
+        # U X = Y: row_i = (row_i - sum u_ij * row_j) / u_ii for j > i
+        for i in range(n - 1, -1, -1):
+            row = x[i * k:(i + 1) * k]
+            for j in range(i + 1, n):
+                factor = lu[i * n + j]
+                if factor:
+                    row = array('d', [r - factor * y for r, y in zip(row, x[j * k:(j + 1) * k])])
+            pivot = lu[i * n + i]
+            x[i * k:(i + 1) * k] = array('d', [r / pivot for r in row])
+        return x
+
+    def inverse(self) -> array:
+        """
+        A^-1 as a row-major array: solve A X = I with all n columns at once.
+
+        Raises:
+            ValueError: If the matrix is singular
+        """
+        n = self.n
+        identity = array('d', bytes(8 * n * n))
+        identity[::n + 1] = array('d', [1.0] * n)
+        return self.solve_many(identity, n)
+
+    def lower(self) -> array:
+        """L as a row-major n x n array (unit diagonal)."""
+        n, lu = self.n, self.lu
+        out = array('d', bytes(8 * n * n))
+        for i in range(n):
+            out[i * n:i * n + i] = lu[i * n:i * n + i]
+            out[i * n + i] = 1.0
+        return out
+
+    def upper(self) -> array:
+        """U as a row-major n x n array."""
+        n, lu = self.n, self.lu
+        out = array('d', bytes(8 * n * n))
+        for i in range(n):
+            out[i * n + i:(i + 1) * n] = lu[i * n + i:(i + 1) * n]
+        return out
+
+    def permutation(self) -> array:
+        """P as a row-major n x n array, so that P A = L U."""
+        n = self.n
+        out = array('d', bytes(8 * n * n))
+        for i, p in enumerate(self.perm):
+            out[i * n + p] = 1.0
+        return out
+
+
+def qr(storage):
+    """
+    Householder QR: A = Q R.
+
+    Each step reflects the remaining part of one column onto a multiple of
+    a unit vector, zeroing everything below the diagonal. The reflections
+    are accumulated into Q.
+
+    Args:
+        storage: 2D Storage of an m x n matrix
+
+    Returns:
+        (q, r, k): q is m x k row-major with orthonormal columns, r is
+        k x n upper triangular, k = min(m, n)
+    """
+    m, n = storage.shape
+    a = storage.buffer
+    r = [list(a[i * n:(i + 1) * n]) for i in range(m)]
+    q = [[1.0 if i == j else 0.0 for j in range(m)] for i in range(m)]
+
+    for k in range(min(m - 1, n)):
+        x = [r[i][k] for i in range(k, m)]
+        norm_x = math.sqrt(sum(v * v for v in x))
+        if norm_x == 0.0:
+            continue
+        alpha = -math.copysign(norm_x, x[0])
+        v = x
+        v[0] -= alpha
+        v_norm2 = sum(t * t for t in v)
+        if v_norm2 == 0.0:
+            continue
+        # R <- H R, H = I - 2 v v^T / (v^T v), applied to rows k..m
+        for j in range(k, n):
+            s = 2.0 * sum(v[i] * r[k + i][j] for i in range(len(v))) / v_norm2
+            if s:
+                for i in range(len(v)):
+                    r[k + i][j] -= s * v[i]
+        # Q <- Q H
+        for row in q:
+            s = 2.0 * sum(v[i] * row[k + i] for i in range(len(v))) / v_norm2
+            if s:
+                for i in range(len(v)):
+                    row[k + i] -= s * v[i]
+
+    k = min(m, n)
+    q_out = array('d')
+    for row in q:
+        q_out.extend(row[:k])
+    r_out = array('d')
+    for i in range(k):
+        r_out.extend([0.0] * i + r[i][i:])
+    return q_out, r_out, k
+
+
+class EigenDecomposition:
+    """
+    Eigenvalues and eigenvectors, plus how much work it took to find them.
+
+    Complex eigenvalues of a real matrix come in conjugate pairs and are
+    stored next to each other, a + bi first. Their eigenvectors are stored
+    the LAPACK way, as two real columns: column j holds the real part and
+    column j + 1 the imaginary part of the eigenvector for a + bi (the one
+    for a - bi is its conjugate). eigenvector(i) unpacks either case.
+
+    Unpacks as (values, vectors), so `values, vectors = M.eigen()` works.
+
+    Attributes:
+        values: tuple of eigenvalues (floats, or complex for conjugate pairs)
+        vectors: n x k eigenvectors as columns (array('d') row-major here,
+            a Matrix when returned by Matrix.eigen/top_k_eigen)
+        iterations: QR sweeps, or matrix-vector products for power/Lanczos
+            (None when a LAPACK backend did the work and doesn't report it)
+        converged: False if max_iterations ran out first
+        method: "qr", "power", "lanczos" or "lapack"
+    """
+    __slots__ = ('values', 'vectors', 'iterations', 'converged', 'method')
+
+    def __init__(self, values, vectors, iterations, converged: bool, method: str):
+        self.values = tuple(values)
+        self.vectors = vectors
+        self.iterations = iterations
+        self.converged = converged
+        self.method = method
+
+    def __iter__(self):
+        return iter((self.values, self.vectors))
+
+    def __repr__(self) -> str:
+        return (f"EigenDecomposition(values={self.values}, iterations={self.iterations}, "
+                f"converged={self.converged}, method='{self.method}')")
+
+    def eigenvector(self, i: int) -> list:
+        """
+        Eigenvector for values[i] as a list (of complex numbers for a complex eigenvalue).
+        """
+        vectors = self.vectors
+        if hasattr(vectors, '_storage'):
+            vectors = vectors._storage.buffer
+        k = len(self.values)
+        column = list(vectors[i::k])
+        value = self.values[i]
+        if not isinstance(value, complex):
+            return column
+        if value.imag > 0:
+            return [complex(re, im) for re, im in zip(column, vectors[i + 1::k])]
+        return [complex(re, -im) for re, im in zip(vectors[i - 1::k], column)]
+
+
+def is_symmetric(a, n: int, tolerance: float = EIGEN_TOLERANCE) -> bool:
+    """Whether an n x n row-major buffer equals its transpose (up to tolerance * largest entry)."""
+    tiny = tolerance * max(map(abs, a), default=0.0)
+    return all(abs(a[i * n + j] - a[j * n + i]) <= tiny for i in range(n) for j in range(i + 1, n))
+
+
+def hessenberg(a, n: int):
+    """
+    Householder reduction to upper Hessenberg form: A = Q H Q^T.
+
+    H is zero below the first subdiagonal (tridiagonal when A is
+    symmetric). It has the same eigenvalues as A, and a QR step on it
+    costs O(n^2) instead of O(n^3).
+
+    Args:
+        a: n x n row-major buffer
+        n: size
+
+    Returns:
+        (h, q) as lists of row lists
+    """
+    h = [list(a[i * n:(i + 1) * n]) for i in range(n)]
+    q = [[1.0 if i == j else 0.0 for j in range(n)] for i in range(n)]
+    for k in range(n - 2):
+        x = [h[i][k] for i in range(k + 1, n)]
+        norm_x = math.sqrt(sum(v * v for v in x))
+        if norm_x == 0.0:
+            continue
+        v = x
+        v[0] += math.copysign(norm_x, x[0])
+        v_norm2 = sum(t * t for t in v)
+        # H <- P H P with P = I - 2 v v^T / (v^T v) acting on rows/columns k+1..n-1
+        for j in range(n):
+            s = 2.0 * sum(v[i] * h[k + 1 + i][j] for i in range(len(v))) / v_norm2
+            if s:
+                for i in range(len(v)):
+                    h[k + 1 + i][j] -= s * v[i]
+        for row in h + q:
+            s = 2.0 * sum(v[i] * row[k + 1 + i] for i in range(len(v))) / v_norm2
+            if s:
+                for i in range(len(v)):
+                    row[k + 1 + i] -= s * v[i]
+        for i in range(k + 2, n):
+            h[i][k] = 0.0
+    return h, q
+
+
+def _wilkinson_shift(h, hi: int, symmetric: bool):
+    """Eigenvalue of the trailing 2x2 block of the active window closest to its last diagonal entry."""
+    a, b = h[hi - 1][hi - 1], h[hi - 1][hi]
+    c, d = h[hi][hi - 1], h[hi][hi]
+    if symmetric:
+        # stable form for a symmetric 2x2 (always real)
+        delta = (a - d) / 2
+        if c == 0.0:
+            return d
+        return d - c * c / (delta + math.copysign(math.hypot(delta, c), delta))
+    half_trace = (a + d) / 2
+    root = cmath.sqrt(half_trace * half_trace - (a * d - b * c))
+    mu1, mu2 = half_trace + root, half_trace - root
+    return mu1 if abs(mu1 - d) <= abs(mu2 - d) else mu2
+
+
+def _shifted_qr(h, z, n: int, symmetric: bool, tolerance: float, max_iterations: int):
+    """
+    Shifted QR iteration on a Hessenberg matrix, in place: H -> Schur form T.
+
+    Each sweep factors (H - mu I) = QR with n - 1 Givens rotations and
+    forms RQ + mu I. With the Wilkinson shift mu the last subdiagonal entry
+    shrinks quadratically (cubically when symmetric); once it is below
+    tolerance the trailing eigenvalue is split off ("deflated") and the
+    window shrinks. A non-symmetric matrix is iterated in complex
+    arithmetic, so complex eigenvalues end up on the diagonal of T.
+
+    Args:
+        h: n x n Hessenberg matrix (list of row lists), overwritten by T
+        z: n x n list of rows, overwritten by z @ (product of rotations)
+
+    Returns:
+        (sweeps, converged)
+    """
+    scale = max((abs(x) for row in h for x in row), default=0.0) or 1.0
+    hi = n - 1
+    sweeps = 0
+    stalled = 0
+    while hi > 0:
+        # find the start of the active (unreduced) window [lo, hi]
+        lo = hi
+        while lo > 0:
+            neighbours = abs(h[lo][lo]) + abs(h[lo - 1][lo - 1])
+            if abs(h[lo][lo - 1]) <= tolerance * (neighbours or scale):
+                h[lo][lo - 1] = 0.0
+                break
+            lo -= 1
+        if lo == hi:
+            hi -= 1
+            stalled = 0
+            continue
+        if sweeps >= max_iterations:
+            return sweeps, False
+
+        mu = _wilkinson_shift(h, hi, symmetric)
+        stalled += 1
+        if stalled % 10 == 0:
+            # exceptional shift: break a cycle the Wilkinson shift can't
+            mu += 0.75 * abs(h[hi][hi - 1])
+        for k in range(lo, hi + 1):
+            h[k][k] -= mu
+
+        # H - mu I = Q R: rotation k zeroes h[k+1][k]; rows span columns k..n-1
+        rotations = []
+        for k in range(lo, hi):
+            x, y = h[k][k], h[k + 1][k]
+            r = math.hypot(abs(x), abs(y))
+            if r == 0.0:
+                c, s = 1.0, 0.0
+            else:
+                c, s = x / r, y / r
+            cc, sc = c.conjugate(), s.conjugate()
+            row_k, row_k1 = h[k], h[k + 1]
+            for j in range(k, n):
+                u, w = row_k[j], row_k1[j]
+                row_k[j] = cc * u + sc * w
+                row_k1[j] = c * w - s * u
+            rotations.append((k, c, s))
+        # R Q: apply each rotation's conjugate transpose to columns k, k+1
+        for k, c, s in rotations:
+            cc, sc = c.conjugate(), s.conjugate()
+            for row in h[:k + 2]:
+                u, w = row[k], row[k + 1]
+                row[k] = u * c + w * s
+                row[k + 1] = w * cc - u * sc
+            for row in z:
+                u, w = row[k], row[k + 1]
+                row[k] = u * c + w * s
+                row[k + 1] = w * cc - u * sc
+        for k in range(lo, hi + 1):
+            h[k][k] += mu
+        sweeps += 1
+    return sweeps, True
+
+
+def _triangular_eigenvectors(t, n: int):
+    """
+    Eigenvectors of an upper triangular T (columns of the returned row lists).
+
+    For eigenvalue t_ii, solve (T - t_ii I) y = 0 with y_i = 1 and y_j = 0
+    for j > i by back substitution. A zero divisor (repeated eigenvalue) is
+    nudged to a tiny number, which yields the shared eigenvector direction.
+    """
+    scale = max((abs(x) for row in t for x in row), default=0.0) or 1.0
+    tiny = 1e-15 * scale
+    columns = []
+    for i in range(n):
+        value = t[i][i]
+        y = [0.0] * n
+        y[i] = 1.0
+        for j in range(i - 1, -1, -1):
+            s = sum(t[j][k] * y[k] for k in range(j + 1, i + 1))
+            divisor = t[j][j] - value
+            if abs(divisor) < tiny:
+                divisor = tiny
+            y[j] = -s / divisor
+        columns.append(y)
+    return [[columns[j][i] for j in range(n)] for i in range(n)]
+
+
+def _normalized(column):
+    """Unit length, with the largest component made real and positive (fixes sign/phase)."""
+    peak = max(column, key=abs)
+    if peak == 0:
+        return column
+    phase = abs(peak) / peak
+    norm = math.sqrt(sum(abs(x) ** 2 for x in column))
+    return [x * phase / norm for x in column]
+
+
+def pack_eigenpairs(values, columns, n: int, scale: float) -> tuple:
+    """
+    Order eigenpairs and pack them into real storage.
+
+    Real eigenvalues (|Im| <= IMAGINARY_TOLERANCE * scale) become floats
+    with real unit eigenvectors; complex ones are matched into conjugate
+    pairs packed as (real part, imaginary part) columns. Groups are sorted
+    by real part, largest first (for symmetric matrices: values descending).
+
+    Args:
+        values: n eigenvalues (float or complex)
+        columns: n eigenvectors, one list of n components each
+        n: size
+        scale: magnitude of the matrix, for the real/complex test
+
+    Returns:
+        (values list, n x n row-major array('d') of eigenvector columns)
+    """
+    cutoff = IMAGINARY_TOLERANCE * (scale or 1.0)
+    groups = []
+    upper, lower = [], []
+    for value, column in zip(values, columns):
+        if abs(complex(value).imag) <= cutoff:
+            column = _normalized(column)
+            groups.append((complex(value).real, [complex(value).real], [[complex(x).real for x in column]]))
+        elif value.imag > 0:
+            upper.append((value, column))
+        else:
+            lower.append(value)
+    upper.sort(key=lambda pair: (pair[0].real, pair[0].imag))
+    lower.sort(key=lambda value: (value.real, -value.imag))
+    for (value, column), partner in zip(upper, lower):
+        value = complex((value.real + partner.real) / 2, (value.imag - partner.imag) / 2)
+        column = _normalized(column)
+        groups.append((value.real, [value, value.conjugate()],
+                       [[x.real for x in column], [complex(x).imag for x in column]]))
+    groups.sort(key=lambda group: group[0], reverse=True)
+
+    ordered, packed = [], []
+    for _, group_values, group_columns in groups:
+        ordered.extend(group_values)
+        packed.extend(group_columns)
+    vectors = array('d')
+    for i in range(n):
+        vectors.extend([column[i] for column in packed])
+    return ordered, vectors
+
+
+def eigen(a, n: int, symmetric: bool = None, tolerance: float = EIGEN_TOLERANCE,
+          max_iterations: int = None) -> EigenDecomposition:
+    """
+    All eigenvalues and eigenvectors of a square matrix (pure Python).
+
+    1. Reduce A to Hessenberg form H = Q^T A Q (tridiagonal if symmetric).
+    2. Run the shifted QR algorithm on H until it is upper triangular
+       (diagonal if symmetric): T = Z^T H Z.
+    3. Eigenvalues are T's diagonal. Eigenvectors are Q Z times those of
+       T (for a symmetric matrix, simply the columns of Q Z).
+
+    Args:
+        a: n x n row-major buffer
+        n: size
+        symmetric: use the real symmetric path; None detects it
+        tolerance: relative size of a subdiagonal entry treated as zero
+        max_iterations: cap on QR sweeps (default EIGEN_ITERATIONS_PER_VALUE * n)
+
+    Returns:
+        EigenDecomposition with vectors as an n x n row-major array('d')
+    """
+    if symmetric is None:
+        symmetric = is_symmetric(a, n)
+    if max_iterations is None:
+        max_iterations = EIGEN_ITERATIONS_PER_VALUE * max(n, 1)
+    h, q = hessenberg(a, n)
+    if not symmetric:
+        h = [[complex(x) for x in row] for row in h]
+    sweeps, converged = _shifted_qr(h, q, n, symmetric, tolerance, max_iterations)
+
+    values = [h[i][i] for i in range(n)]
+    if symmetric:
+        columns = [[row[i] for row in q] for i in range(n)]
+    else:
+        y = _triangular_eigenvectors(h, n)
+        # eigenvectors of A = (Q Z) y, one column per eigenvalue
+        columns = [[sum(q_row[k] * y[k][i] for k in range(n)) for q_row in q] for i in range(n)]
+    scale = max(map(abs, a), default=0.0)
+    values, vectors = pack_eigenpairs(values, columns, n, scale)
+    return EigenDecomposition(values, vectors, sweeps, converged, "qr")
+
+
+def _start_vector(n: int, rng: random.Random) -> array:
+    return array('d', [rng.uniform(-1.0, 1.0) for _ in range(n)])
+
+
+def power_iteration(a, n: int, k: int, backend, tolerance: float = 1e-10,
+                    max_iterations: int = 1000, seed=0) -> EigenDecomposition:
+    """
+    Top k eigenpairs of a symmetric matrix by power iteration with deflation.
+
+    v <- A v / |A v| converges to the eigenvector of the largest |lambda|
+    at the rate |lambda_2 / lambda_1|. Each later eigenvector is iterated
+    orthogonal to the ones already found, which removes them from A.
+
+    Args:
+        a: n x n symmetric row-major buffer
+        n: size
+        k: number of eigenpairs
+        backend: Backend doing matvec/dot/norm/scale/sub
+        tolerance: stop once |A v - lambda v| <= tolerance * |lambda|
+        max_iterations: cap on matrix-vector products per eigenpair
+        seed: seed for the starting vectors
+
+    Returns:
+        EigenDecomposition (largest |lambda| first); iterations counts
+        matrix-vector products
+    """
+    rng = random.Random(seed)
+    found, values = [], []
+    products = 0
+    converged = True
+    for _ in range(k):
+        v = _start_vector(n, rng)
+        for u in found:
+            v = backend.sub(v, backend.scale(u, backend.dot(u, v)))
+        v = backend.scale(v, 1.0 / backend.norm(v))
+        value = 0.0
+        for _ in range(max_iterations):
+            w = backend.matvec(a, n, n, v)
+            products += 1
+            # deflate: (I - U U^T) A v, so the pairs already found drop out
+            for u in found:
+                w = backend.sub(w, backend.scale(u, backend.dot(u, w)))
+            value = backend.dot(v, w)
+            residual = backend.norm(backend.sub(w, backend.scale(v, value)))
+            if residual <= tolerance * max(abs(value), 1e-300):
+                break
+            norm = backend.norm(w)
+            if norm == 0.0:
+                break
+            v = backend.scale(w, 1.0 / norm)
+        else:
+            converged = False
+        found.append(v)
+        values.append(value)
+    order = sorted(range(k), key=lambda i: abs(values[i]), reverse=True)
+    columns = [_normalized(list(found[i])) for i in order]
+    vectors = array('d')
+    for i in range(n):
+        vectors.extend([column[i] for column in columns])
+    return EigenDecomposition([values[i] for i in order], vectors, products, converged, "power")
+
+
+def _orthogonalize(w, basis: array, m: int, n: int, backend):
+    """
+    Remove every component along the m x n row basis from w, twice (Kahan's "twice is enough").
+
+    Each pass is one block product each way, w - V^T (V w), rather than
+    m separate projections.
+    """
+    for _ in range(2):
+        w = backend.sub(w, backend.matmul(backend.matvec(basis, m, n, w), basis, 1, m, n))
+    return w
+
+
+def lanczos(a, n: int, k: int, backend, tolerance: float = 1e-10,
+            max_iterations: int = 1000, seed=0) -> EigenDecomposition:
+    """
+    Top k eigenpairs of a symmetric matrix by the Lanczos method.
+
+    m steps of the three-term recurrence build an orthonormal basis V in
+    which A is the m x m tridiagonal T (V^T A V = T); the eigenpairs of T
+    (Ritz pairs, found with backend.eigen) approximate A's extreme ones after far
+    fewer than n steps. V is fully re-orthogonalized each step. The
+    residual of a Ritz pair is |beta_m * (last entry of its eigenvector
+    of T)|; if the top k aren't below tolerance, restart with twice as many
+    steps from the sum of the current top k Ritz vectors, so each restart
+    begins closer to the wanted subspace instead of repeating the last one.
+
+    If the recurrence breaks down (beta ~ 0: the basis spans an invariant
+    subspace, as with repeated eigenvalues or the identity), it continues
+    from a fresh random vector orthogonal to the basis, with a zero
+    coupling in T. So exactly k pairs always come back, and eigenvalues
+    the first Krylov space can't see are still found.
+
+    Args:
+        a: n x n symmetric row-major buffer, or a callable v -> A v for a
+            matrix that is only available implicitly (PCA's X^T X / (n - 1))
+        n: size
+        k: number of eigenpairs
+        backend: Backend doing matvec/matmul/eigen/dot/norm/scale/sub/add
+        tolerance: relative residual at which a Ritz pair is accepted
+        max_iterations: cap on matrix-vector products over all restarts,
+            checked every step (at least k are made, to have k Ritz pairs)
+        seed: seed for the starting and breakdown vectors
+
+    Returns:
+        EigenDecomposition (largest |lambda| first); iterations counts
+        matrix-vector products
+    """
+    apply = a if callable(a) else (lambda v: backend.matvec(a, n, n, v))
+    rng = random.Random(seed)
+    start = _start_vector(n, rng)
+    steps = min(n, max(2 * k + 1, 20))
+    products = 0
+    while True:
+        basis, alphas, betas = array('d'), [], []   # basis: the Lanczos vectors as rows
+        v = backend.scale(start, 1.0 / backend.norm(start))
+        size = 0.0   # largest |alpha| so far, the scale breakdown is judged against
+        for j in range(steps):
+            basis.extend(v)
+            w = apply(v)
+            products += 1
+            alphas.append(backend.dot(w, v))
+            size = max(size, abs(alphas[-1]))
+            w = _orthogonalize(w, basis, j + 1, n, backend)
+            beta = backend.norm(w)
+            betas.append(beta)
+            if j + 1 == steps or (products >= max_iterations and j + 1 >= k):
+                break
+            if beta <= 1e-14 * size:
+                # invariant subspace: carry on from a new direction, decoupled in T
+                betas[-1] = 0.0
+                w = _orthogonalize(_start_vector(n, rng), basis, j + 1, n, backend)
+            v = backend.scale(w, 1.0 / (betas[-1] or backend.norm(w)))
+        m = len(alphas)
+        t = array('d', bytes(8 * m * m))
+        for i in range(m):
+            t[i * m + i] = alphas[i]
+            if i + 1 < m:
+                t[i * m + i + 1] = t[(i + 1) * m + i] = betas[i]
+        ritz = backend.eigen(t, m, True, EIGEN_TOLERANCE, None)
+        order = sorted(range(m), key=lambda i: abs(ritz.values[i]), reverse=True)[:k]
+        top = abs(ritz.values[order[0]]) or 1.0
+        residuals = [abs(betas[-1] * ritz.vectors[(m - 1) * m + i]) for i in order]
+        converged = all(r <= tolerance * top for r in residuals)
+
+        # eigenvector i of A ~ V^T y_i: all k of them as the rows of Y^T V
+        y = array('d')
+        for i in order:
+            y.extend(ritz.vectors[i::m])
+        ritz_rows = backend.matmul(y, basis, k, m, n)
+        if converged or m >= n or products >= max_iterations:
+            break
+        start = ritz_rows[:n]
+        for i in range(1, k):
+            start = backend.add(start, ritz_rows[i * n:(i + 1) * n])
+        steps = min(n, 2 * steps)
+
+    vectors = array('d')
+    columns = [_normalized(ritz_rows[i * n:(i + 1) * n]) for i in range(k)]
+    for row in range(n):
+        vectors.extend([column[row] for column in columns])
+    converged = converged or m == n   # a full basis makes T similar to A: the pairs are exact
+    return EigenDecomposition([ritz.values[i] for i in order], vectors, products, converged, "lanczos")
+
+
+TOP_K_METHODS = {"power": power_iteration, "lanczos": lanczos}
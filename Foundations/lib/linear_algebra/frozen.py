@@ -0,0 +1,213 @@
+"""
+Frozen matrices: immutable, hashable matrices that remember their decompositions
+Goal: Pay for a factorization once per transform instead of once per use
+
+A transform like Matrix3D.rotation(30, "x") is typically built once and then
+applied, inverted or solved against thousands of times. A FrozenMatrix can't
+change after it is built, so anything derived from it (determinant, inverse,
+transpose, LU/QR factors, eigen-decomposition) is computed on first use and
+cached on the instance. Being immutable also makes it safe to hash, so frozen
+matrices can be dict keys and set members.
+
+Example:
+    >>> R = Matrix3D.rotation(30, "x").freeze()     # FrozenMatrix3D
+    >>> R.solve(Vector3D([1, 2, 3]))                 # factors R once (LU)...
+    >>> R.solve(Vector3D([4, 5, 6]))                 # ...then only back-substitutes
+    >>> R.det(), R.inverse()                         # reuse the same LU
+"""
+
+from .decompositions import EIGEN_TOLERANCE, EigenDecomposition, LUFactorization, qr
+from .matrix import Matrix
+from .matrix2D import Matrix2D
+from .matrix3D import Matrix3D
+from .storage import Storage
+
+
+class FrozenMatrix(Matrix):
+    """
+    Immutable Matrix with lazily computed, cached derived values.
+
+    The entries are copied on construction and never change: data returns
+    read-only row views and assigning to data raises. Results of arithmetic
+    on a frozen matrix (products, transpose, inverse) are frozen too.
+
+    solve() and solve_many() are inherited from Matrix; because lu() is
+    cached here, only the first solve pays for the factorization.
+
+    Attributes:
+        data: Rows as read-only zero-copy views into contiguous storage
+        rows: Number of rows in the matrix
+        cols: Number of columns in the matrix
+
+    Example:
+        >>> A = FrozenMatrix([[4, 3], [6, 3]])
+        >>> A.det()                       # -6.0 (LU computed and cached)
+        >>> A.solve(Vector([10, 12]))     # Vector([1.0, 2.0]) (reuses the LU)
+        >>> {A: "cached"}                 # hashable
+    """
+    __slots__ = ('_hash', '_cache')
+
+    def __init__(self, data):
+        """
+        Initialize a frozen matrix from a 2D list.
+
+        Args:
+            data: 2D list where each inner list is a row
+
+        Raises:
+            ValueError: If the rows are not all the same length
+        """
+        super().__init__(data)
+        self._hash = None
+        self._cache = {}
+
+    @classmethod
+    def _wrap(cls, storage: Storage):
+        matrix = super()._wrap(storage)
+        matrix._hash = None
+        matrix._cache = {}
+        return matrix
+
+    def _like(self, storage: Storage) -> 'FrozenMatrix':
+        # results of frozen arithmetic stay frozen, even when the shape
+        # forces a fall back to the general class
+        cls = type(self) if type(self)._accepts(storage.shape) else FrozenMatrix
+        return cls._wrap(storage)
+
+    @property
+    def data(self):
+        """Rows as read-only zero-copy views."""
+        return [row.toreadonly() for row in self._storage.rows()]
+
+    @data.setter
+    def data(self, data) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable; use thaw() for an editable copy")
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, FrozenMatrix):
+            return NotImplemented
+        return self._storage.shape == other._storage.shape and self._storage.buffer == other._storage.buffer
+
+    def __hash__(self) -> int:
+        if self._hash is None:
+            self._hash = hash((self._storage.shape, tuple(self._storage.buffer)))
+        return self._hash
+
+    def _cached(self, key, compute):
+        """Return cache[key], computing and storing it on first use."""
+        try:
+            return self._cache[key]
+        except KeyError:
+            value = self._cache[key] = compute()
+            return value
+
+    def freeze(self) -> 'FrozenMatrix':
+        """Already frozen: return self."""
+        return self
+
+    def thaw(self) -> Matrix:
+        """
+        Return an editable copy as the matching mutable class.
+
+        Returns:
+            Matrix, Matrix2D or Matrix3D with the same entries
+        """
+        cls = next(base for base in type(self).__mro__ if not issubclass(base, FrozenMatrix))
+        return cls._wrap(self._storage.copy())
+
+    def lu(self) -> LUFactorization:
+        """
+        LU factorization with partial pivoting (cached).
+
+        Returns:
+            LUFactorization with P A = L U
+
+        Raises:
+            ValueError: If the matrix isn't square
+        """
+        return self._cached('lu', lambda: LUFactorization(self._storage))
+
+    def det(self) -> float:
+        """
+        Determinant from the cached LU factors (cached).
+
+        Geometric: how much the transformation scales area/volume; 0 means
+        space is flattened.
+
+        Returns:
+            Float determinant
+        """
+        return self._cached('det', lambda: self.lu().determinant())
+
+    determinant = det
+
+    def inverse(self) -> 'FrozenMatrix':
+        """
+        Inverse transformation from the cached LU factors (cached).
+
+        Returns:
+            Frozen n x n inverse, same class as self
+
+        Raises:
+            ValueError: If the matrix is singular
+        """
+        return self._cached('inverse', lambda: self._like(Storage(self.lu().inverse(), self._storage.shape)))
+
+    def transpose(self) -> 'FrozenMatrix':
+        """Transpose (cached)."""
+        return self._cached('transpose', super().transpose)
+
+    def qr(self) -> tuple:
+        """
+        Householder QR factors (cached).
+
+        Returns:
+            (Q, R) as frozen matrices: Q is rows x k with orthonormal
+            columns, R is k x cols upper triangular, k = min(rows, cols)
+        """
+        def compute():
+            q, r, k = qr(self._storage)
+            return (self._like(Storage(q, (self.rows, k))), self._like(Storage(r, (k, self.cols))))
+        return self._cached('qr', compute)
+
+    def eigen(self, tolerance: float = EIGEN_TOLERANCE, max_iterations: int = None) -> EigenDecomposition:
+        """
+        Eigen-decomposition (cached per tolerance/max_iterations).
+
+        Returns:
+            EigenDecomposition whose vectors are a frozen matrix (see Matrix.eigen)
+
+        Raises:
+            ValueError: If the matrix isn't square
+        """
+        compute = super().eigen
+        return self._cached(('eigen', tolerance, max_iterations), lambda: compute(tolerance, max_iterations))
+
+
+class FrozenMatrix2D(FrozenMatrix, Matrix2D):
+    """Immutable Matrix2D with cached derived values (see FrozenMatrix)."""
+    __slots__ = ()
+
+
+class FrozenMatrix3D(FrozenMatrix, Matrix3D):
+    """Immutable Matrix3D with cached derived values (see FrozenMatrix)."""
+    __slots__ = ()
+
+
+_FROZEN = {Matrix: FrozenMatrix, Matrix2D: FrozenMatrix2D, Matrix3D: FrozenMatrix3D}
+
+
+def freeze(matrix: Matrix) -> FrozenMatrix:
+    """
+    Return an immutable copy of a matrix.
+
+    Args:
+        matrix: Matrix, Matrix2D or Matrix3D (a frozen matrix is returned as is)
+
+    Returns:
+        FrozenMatrix, FrozenMatrix2D or FrozenMatrix3D with copied entries
+    """
+    if isinstance(matrix, FrozenMatrix):
+        return matrix
+    cls = next(_FROZEN[base] for base in type(matrix).__mro__ if base in _FROZEN)
+    return cls._wrap(matrix._storage.copy())
@@ -0,0 +1,344 @@
+"""
+Instrument: opt-in operation counters, timers and allocation tracing
+Goal: See what a call really costs (backend operations, FLOPs, objects created, memory) without paying for it in production
+
+Everything is off by default. While a Profile is active:
+
+    operations - every call into the active backend (add, dot, matmul, ...)
+                 is counted with its estimated FLOPs, the bytes of the
+                 array it returns and the time it took
+    objects    - every Vector, Matrix and Storage constructed (including
+                 subclasses, counted under their own class names)
+    timers     - `with timer("name"):` blocks accumulate call count and
+                 total/min/max time
+    memory     - with memory=True, tracemalloc records peak traced memory
+                 and the source lines in this package that allocated most
+
+When no profile is active the cost is one `is None` check per
+get_backend() call, and timer() hands back a shared no-op context, so the
+hooks can stay in production code. Object counting patches the
+constructors only while a profile runs.
+
+Example:
+    >>> with profile() as p:
+    ...     A.multiply_matrix(B)
+    >>> print(p.report())
+    >>> p.objects["Vector3D"], p.operations["matmul"].flops
+
+    >>> with profile(memory=True) as p:              # long-running sampling
+    ...     for frame in range(60):
+    ...         with timer("frame"):
+    ...             update(frame)
+    >>> p.timers["frame"].mean
+"""
+
+import time
+import tracemalloc
+from contextlib import contextmanager, nullcontext
+
+from . import backend as _backend
+
+_active = None      # the running Profile, if any
+_NULL_TIMER = nullcontext()
+
+
+def _flops(op: str, args: tuple) -> int:
+    """Estimated floating-point operations of one backend call (multiply-add = 2)."""
+    if op in ("add", "sub", "scale"):
+        return len(args[0])
+    if op in ("dot", "norm"):
+        return 2 * len(args[0])
+    if op == "matvec":
+        return 2 * args[1] * args[2]
+    if op == "matvec_batch":
+        rows, cols, points = args[1], args[2], args[3]
+        return 2 * rows * len(points) if cols else 0
+    if op == "affine_batch":
+        rows, cols, points = args[2], args[3], args[4]
+        return (2 * rows * len(points) + rows * (len(points) // cols)) if cols else 0
+    if op == "matmul":
+        m, k, n = args[2], args[3], args[4]
+        return 2 * m * k * n
+    if op == "eigen":
+        return 10 * args[1] ** 3      # Hessenberg reduction + QR sweeps, order of magnitude
+    if op == "csr_matvec":
+        return 2 * len(args[0])
+    if op == "csr_matmul":
+        return 2 * len(args[0]) * args[5]
+    if op == "row_dots":
+        return 2 * args[2] * args[3]
+    if op == "row_norms":
+        return 2 * args[1] * args[2]
+    if op == "normalize_rows":
+        return 3 * args[1] * args[2]
+    if op in ("project_rows", "row_angles"):
+        return 6 * args[2] * args[3]
+    if op == "cross_rows":
+        return 9 * args[2]
+    return 0
+
+
+class OperationStats:
+    """Totals for one backend operation."""
+    __slots__ = ('calls', 'flops', 'bytes', 'seconds')
+
+    def __init__(self):
+        self.calls = 0
+        self.flops = 0
+        self.bytes = 0
+        self.seconds = 0.0
+
+    def __repr__(self) -> str:
+        return f"OperationStats(calls={self.calls}, flops={self.flops}, bytes={self.bytes}, seconds={self.seconds:.6f})"
+
+
+class TimerStats:
+    """Totals for one named timer."""
+    __slots__ = ('calls', 'total', 'min', 'max')
+
+    def __init__(self):
+        self.calls = 0
+        self.total = 0.0
+        self.min = float('inf')
+        self.max = 0.0
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.calls if self.calls else 0.0
+
+    def add(self, seconds: float) -> None:
+        self.calls += 1
+        self.total += seconds
+        self.min = min(self.min, seconds)
+        self.max = max(self.max, seconds)
+
+    def __repr__(self) -> str:
+        return f"TimerStats(calls={self.calls}, total={self.total:.6f}, mean={self.mean:.6f})"
+
+
+class _CountingBackend:
+    """Proxy in front of a backend that records every call into a Profile."""
+
+    def __init__(self, inner, profile: 'Profile'):
+        self._inner = inner
+        self._profile = profile
+        self.name = inner.name
+
+    def __getattr__(self, op: str):
+        method = getattr(self._inner, op)
+        if not callable(method) or op.startswith('_'):
+            return method
+        operations = self._profile.operations
+
+        def counted(*args, **kwargs):
+            start = time.perf_counter()
+            result = method(*args, **kwargs)
+            elapsed = time.perf_counter() - start
+            stats = operations.get(op)
+            if stats is None:
+                stats = operations[op] = OperationStats()
+            stats.calls += 1
+            stats.flops += _flops(op, args)
+            stats.seconds += elapsed
+            itemsize = getattr(result, 'itemsize', None)
+            if itemsize is not None:
+                stats.bytes += len(result) * itemsize
+            return result
+        counted.__name__ = op
+        return counted
+
+    def __repr__(self) -> str:
+        return f"<counting {self._inner!r}>"
+
+
+class Profile:
+    """
+    What happened while profiling was on.
+
+    Attributes:
+        operations: {backend operation: OperationStats}
+        objects: {class name: instances constructed}
+        timers: {timer name: TimerStats}
+        seconds: wall time between start and stop
+        memory_peak: peak traced bytes (memory=True only)
+        memory_top: [(file:line, bytes, allocations)] largest allocation
+            sites in linear_algebra (memory=True only)
+    """
+
+    def __init__(self, memory: bool = False, memory_limit: int = 10):
+        self.operations = {}
+        self.objects = {}
+        self.timers = {}
+        self.seconds = 0.0
+        self.memory = memory
+        self.memory_limit = memory_limit
+        self.memory_peak = None
+        self.memory_top = []
+        self._proxies = {}
+        self._patches = []
+        self._started = None
+        self._owns_tracemalloc = False
+
+    # -- hooks ----------------------------------------------------------------
+
+    def _wrap_backend(self, inner):
+        proxy = self._proxies.get(id(inner))
+        if proxy is None:
+            proxy = self._proxies[id(inner)] = _CountingBackend(inner, self)
+        return proxy
+
+    def _count_constructors(self) -> None:
+        """Patch __init__ and _wrap of the value types to count instances (undone by stop)."""
+        from .matrix import Matrix
+        from .storage import Storage
+        from .vector import Vector
+        objects = self.objects
+
+        def note(cls):
+            name = cls.__name__
+            objects[name] = objects.get(name, 0) + 1
+
+        for cls in (Vector, Matrix, Storage):
+            init = cls.__dict__['__init__']
+
+            def counted_init(self, *args, _init=init, **kwargs):
+                note(type(self))
+                _init(self, *args, **kwargs)
+            self._patches.append((cls, '__init__', init))
+            cls.__init__ = counted_init
+
+            wrap = cls.__dict__.get('_wrap')
+            if wrap is not None:
+                def counted_wrap(klass, *args, _wrap=wrap.__func__, **kwargs):
+                    note(klass)
+                    return _wrap(klass, *args, **kwargs)
+                self._patches.append((cls, '_wrap', wrap))
+                cls._wrap = classmethod(counted_wrap)
+
+    # -- lifecycle --------------------------------------------------------------
+
+    def start(self) -> 'Profile':
+        """Turn the hooks on. Only one profile can run at a time."""
+        global _active
+        if _active is not None:
+            raise RuntimeError("A profile is already running")
+        if self.memory:
+            self._owns_tracemalloc = not tracemalloc.is_tracing()
+            if self._owns_tracemalloc:
+                tracemalloc.start()
+            tracemalloc.reset_peak()
+        self._count_constructors()
+        _backend._observer = self._wrap_backend
+        _active = self
+        self._started = time.perf_counter()
+        return self
+
+    def stop(self) -> 'Profile':
+        """Turn the hooks off and collect the memory report."""
+        global _active
+        if _active is not self:
+            return self
+        self.seconds += time.perf_counter() - self._started
+        _active = None
+        _backend._observer = None
+        for cls, name, original in reversed(self._patches):
+            setattr(cls, name, original)
+        self._patches = []
+        if self.memory:
+            self.memory_peak = tracemalloc.get_traced_memory()[1]
+            package = _backend.__file__.rsplit('/', 1)[0].rsplit('\\', 1)[0]
+            snapshot = tracemalloc.take_snapshot().filter_traces([tracemalloc.Filter(True, package + '*'),
+                                                                  tracemalloc.Filter(False, __file__)])
+            self.memory_top = [(f"{stat.traceback[0].filename.rsplit('/', 1)[-1]}:{stat.traceback[0].lineno}",
+                                stat.size, stat.count)
+                               for stat in snapshot.statistics('lineno')[:self.memory_limit]]
+            if self._owns_tracemalloc:
+                tracemalloc.stop()
+        return self
+
+    @contextmanager
+    def timer(self, name: str):
+        """Accumulate the time spent in the block under `name`."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            stats = self.timers.get(name)
+            if stats is None:
+                stats = self.timers[name] = TimerStats()
+            stats.add(time.perf_counter() - start)
+
+    # -- results ------------------------------------------------------------
+
+    @property
+    def total_flops(self) -> int:
+        return sum(stats.flops for stats in self.operations.values())
+
+    @property
+    def total_allocations(self) -> int:
+        """Objects constructed plus result buffers returned by the backend."""
+        return sum(self.objects.values()) + sum(stats.calls for stats in self.operations.values())
+
+    def report(self) -> str:
+        """A plain-text table of everything recorded."""
+        lines = [f"Profile: {self.seconds * 1e3:.3f} ms, {self.total_flops:,} flops"]
+        if self.operations:
+            lines.append(f"{'operation':<16}{'calls':>10}{'flops':>16}{'bytes out':>14}{'ms':>12}")
+            for op, s in sorted(self.operations.items(), key=lambda item: -item[1].seconds):
+                lines.append(f"{op:<16}{s.calls:>10}{s.flops:>16,}{s.bytes:>14,}{s.seconds * 1e3:>12.3f}")
+        if self.objects:
+            lines.append(f"{'objects':<16}{'created':>10}")
+            for name, count in sorted(self.objects.items(), key=lambda item: -item[1]):
+                lines.append(f"{name:<16}{count:>10}")
+        if self.timers:
+            lines.append(f"{'timer':<24}{'calls':>8}{'total ms':>12}{'mean ms':>12}{'max ms':>12}")
+            for name, t in sorted(self.timers.items(), key=lambda item: -item[1].total):
+                lines.append(f"{name:<24}{t.calls:>8}{t.total * 1e3:>12.3f}{t.mean * 1e3:>12.3f}{t.max * 1e3:>12.3f}")
+        if self.memory_peak is not None:
+            lines.append(f"peak traced memory: {self.memory_peak:,} bytes")
+            for site, size, count in self.memory_top:
+                lines.append(f"  {site:<30}{size:>12,} B in {count} blocks")
+        return "\n".join(lines)
+
+    def __repr__(self) -> str:
+        return (f"Profile(operations={len(self.operations)}, objects={sum(self.objects.values())}, "
+                f"timers={len(self.timers)})")
+
+
+@contextmanager
+def profile(memory: bool = False, memory_limit: int = 10):
+    """
+    Record operations, object creation and timers for the duration of the block.
+
+    Args:
+        memory: also trace allocations with tracemalloc (slower)
+        memory_limit: allocation sites kept in memory_top
+
+    Example:
+        >>> with profile() as p:
+        ...     Matrix3D.rotation(30, "x").multiply_matrix(Matrix3D.rotation(60, "y"))
+        >>> p.objects          # {'Matrix3D': 3, 'Storage': 3}
+    """
+    p = Profile(memory, memory_limit).start()
+    try:
+        yield p
+    finally:
+        p.stop()
+
+
+def active() -> Profile:
+    """The running Profile, or None."""
+    return _active
+
+
+def timer(name: str):
+    """
+    Time a block into the running profile; a shared no-op when none is running.
+
+    Example:
+        >>> with timer("animation.update"):
+        ...     update(frame)
+    """
+    if _active is None:
+        return _NULL_TIMER
+    return _active.timer(name)
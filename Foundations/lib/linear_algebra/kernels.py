@@ -0,0 +1,399 @@
+"""
+Kernels: tight loops over flat Storage buffers
+Goal: Do the arithmetic for many points in one call instead of one Python call per point
+"""
+
+from array import array
+from operator import add, mul
+
+# Edge length (in elements) of the square tiles used by gemm. 64 doubles is
+# 512 bytes per tile row, so an A tile row plus a panel of B^T rows stays
+# resident in L1/L2 while it is reused.
+BLOCK_SIZE = 64
+
+def matvec(a: array, rows: int, cols: int, x) -> array:
+    """
+    Multiply a row-major rows x cols matrix by one vector.
+
+    Each output component is the dot product of one contiguous row slice
+    with x, done with sum(map(mul, ...)) so the loop runs in C.
+
+    Args:
+        a: array('d') of matrix entries, row-major
+        rows: number of matrix rows
+        cols: number of matrix columns
+        x: sequence of cols numbers
+
+    Returns:
+        array('d') of length rows
+    """
+    return array('d', [sum(map(mul, a[i:i + cols], x)) for i in range(0, rows * cols, cols)])
+
+
+def transpose(a: array, rows: int, cols: int) -> array:
+    """Row-major transpose of a rows x cols block (one strided slice per column)."""
+    out = array('d')
+    for j in range(cols):
+        out.extend(a[j::cols])
+    return out
+
+
+def gemm(a: array, b: array, m: int, k: int, n: int, block: int = BLOCK_SIZE) -> array:
+    """
+    General matrix multiply C = A @ B on flat row-major buffers.
+
+    Works for any m x k times k x n shapes. Three things make it fast in
+    pure Python compared to "extract a column, wrap it in a Vector, dot it
+    with a row Vector, transpose the result by hand":
+
+        1. B is transposed once up front, so every inner product reads two
+           contiguous runs (a row of A, a row of B^T) instead of striding
+           down a column of B.
+        2. The loop order is k-panel -> i -> j. A panel of B^T (block
+           columns of the shared dimension) is sliced once and reused for
+           every row of A, and each row of C is produced by one
+           comprehension whose inner loop, sum(map(mul, ...)), runs in C.
+        3. The shared dimension is tiled into blocks of `block` elements,
+           so the working set of one panel stays cache-sized even at
+           1024 x 1024. Partial sums from each panel are accumulated into C.
+
+    Args:
+        a: array('d') of A entries (m x k, row-major)
+        b: array('d') of B entries (k x n, row-major)
+        m: rows of A
+        k: columns of A / rows of B
+        n: columns of B
+        block: tile edge length along the shared dimension
+
+    Returns:
+        array('d') of C entries (m x n, row-major)
+    """
+    return gemm_bt(a, transpose(b, k, n), m, k, n, block)
+
+
+def gemm_bt(a: array, bt: array, m: int, k: int, n: int, block: int = BLOCK_SIZE) -> array:
+    """
+    Same as gemm, but takes B already transposed (n x k, row-major).
+
+    Split out so callers that multiply many row blocks of A against the
+    same B (see parallel.multiply) transpose B only once.
+    """
+    if k <= block:
+        # One panel covers everything: write rows of C directly.
+        out = array('d')
+        columns = [bt[j:j + k] for j in range(0, n * k, k)]
+        for i in range(0, m * k, k):
+            row = a[i:i + k]
+            out.extend([sum(map(mul, row, column)) for column in columns])
+        return out
+
+    out = array('d', bytes(8 * m * n))
+    for kk in range(0, k, block):
+        k_end = min(kk + block, k)
+        panel = [bt[j * k + kk:j * k + k_end] for j in range(n)]
+        for i in range(m):
+            row = a[i * k + kk:i * k + k_end]
+            partial = [sum(map(mul, row, column)) for column in panel]
+            start = i * n
+            out[start:start + n] = array('d', map(add, out[start:start + n], partial))
+    return out
+
+
+def matvec_batch(a: array, rows: int, cols: int, points: array) -> array:
+    """
+    Multiply a row-major rows x cols matrix by N packed points at once.
+
+    The points are stored back to back ([x0, y0, x1, y1, ...]), so column j
+    of the point block is the strided slice points[j::cols]. Each output
+    coordinate is computed for all N points in one comprehension and
+    written back with a strided slice assignment; no per-point Vector
+    objects are created.
+
+    Args:
+        a: array('d') of matrix entries, row-major
+        rows: number of matrix rows (output dimension)
+        cols: number of matrix columns (input dimension)
+        points: array('d') of N*cols packed point coordinates
+
+    Returns:
+        array('d') of N*rows packed transformed coordinates
+
+    Raises:
+        ValueError: If the point block isn't a whole number of points
+    """
+    if cols == 0 or len(points) % cols:
+        raise ValueError(f"Point buffer length {len(points)} isn't a multiple of dimension {cols}")
+    n = len(points) // cols
+    out = array('d', bytes(8 * n * rows))
+    coords = [points[j::cols] for j in range(cols)]
+
+    if cols == 2:
+        xs, ys = coords
+        for i in range(rows):
+            m0, m1 = a[i * 2:i * 2 + 2]
+            out[i::rows] = array('d', [m0 * x + m1 * y for x, y in zip(xs, ys)])
+    elif cols == 3:
+        xs, ys, zs = coords
+        for i in range(rows):
+            m0, m1, m2 = a[i * 3:i * 3 + 3]
+            out[i::rows] = array('d', [m0 * x + m1 * y + m2 * z for x, y, z in zip(xs, ys, zs)])
+    else:
+        packed = list(zip(*coords))
+        for i in range(rows):
+            row = a[i * cols:(i + 1) * cols]
+            out[i::rows] = array('d', [sum(map(mul, row, p)) for p in packed])
+    return out
+
+
+def affine_batch(a: array, offset, rows: int, cols: int, points: array) -> array:
+    """
+    matvec_batch plus a translation: out = A p + t for N packed points.
+
+    The offset is added inside the same comprehension as the products, so
+    an affine map costs one pass over the points and no homogeneous
+    [x, y, z, 1] copies are built.
+
+    Args:
+        a: array('d') of the linear part, row-major rows x cols
+        offset: `rows` numbers added to every transformed point
+        rows: output dimension
+        cols: input dimension
+        points: array('d') of N*cols packed point coordinates
+
+    Returns:
+        array('d') of N*rows packed transformed coordinates
+
+    Raises:
+        ValueError: If the point block isn't a whole number of points
+    """
+    if cols == 0 or len(points) % cols:
+        raise ValueError(f"Point buffer length {len(points)} isn't a multiple of dimension {cols}")
+    n = len(points) // cols
+    out = array('d', bytes(8 * n * rows))
+    coords = [points[j::cols] for j in range(cols)]
+
+    if cols == 2:
+        xs, ys = coords
+        for i in range(rows):
+            m0, m1 = a[i * 2:i * 2 + 2]
+            t = offset[i]
+            out[i::rows] = array('d', [m0 * x + m1 * y + t for x, y in zip(xs, ys)])
+    elif cols == 3:
+        xs, ys, zs = coords
+        for i in range(rows):
+            m0, m1, m2 = a[i * 3:i * 3 + 3]
+            t = offset[i]
+            out[i::rows] = array('d', [m0 * x + m1 * y + m2 * z + t for x, y, z in zip(xs, ys, zs)])
+    else:
+        packed = list(zip(*coords))
+        for i in range(rows):
+            row = a[i * cols:(i + 1) * cols]
+            t = offset[i]
+            out[i::rows] = array('d', [sum(map(mul, row, p)) + t for p in packed])
+    return out
+
+
+def csr_matvec(values: array, indices: array, indptr: array, rows: int, x) -> array:
+    """
+    Multiply a CSR sparse matrix by one dense vector in O(nnz + rows).
+
+    Row i's nonzeros are values[indptr[i]:indptr[i+1]] in the columns
+    indices[indptr[i]:indptr[i+1]]; each output component is the dot product
+    of that run with the matching entries of x. Zeros are never visited.
+
+    Args:
+        values: array('d') of the nonzero entries, row by row
+        indices: column index of each entry
+        indptr: rows + 1 offsets into values/indices
+        rows: number of matrix rows
+        x: sequence of cols numbers
+
+    Returns:
+        array('d') of length rows
+    """
+    out = array('d', bytes(8 * rows))
+    pick = x.__getitem__
+    for i in range(rows):
+        start, end = indptr[i], indptr[i + 1]
+        if start != end:
+            out[i] = sum(map(mul, values[start:end], map(pick, indices[start:end])))
+    return out
+
+
+def csr_matmul(values: array, indices: array, indptr: array, rows: int, b: array, n: int) -> array:
+    """
+    Multiply a CSR sparse matrix by a dense row-major k x n matrix in O(nnz * n).
+
+    Row i of the result is the sum of value * (row `column` of B) over row
+    i's nonzeros, accumulated a whole row at a time.
+
+    Args:
+        values, indices, indptr: the CSR arrays (see csr_matvec)
+        rows: number of sparse matrix rows
+        b: array('d') of B entries, row-major
+        n: columns of B
+
+    Returns:
+        array('d') of the rows x n product, row-major
+    """
+    out = array('d', bytes(8 * rows * n))
+    for i in range(rows):
+        start, end = indptr[i], indptr[i + 1]
+        if start == end:
+            continue
+        acc = [0.0] * n
+        for value, column in zip(values[start:end], indices[start:end]):
+            acc = [s + value * y for s, y in zip(acc, b[column * n:(column + 1) * n])]
+        out[i * n:(i + 1) * n] = array('d', acc)
+    return out
+
+
+def _row_operand(b: array, rows: int, n: int, d: int):
+    """Row i of b, where b holds either n rows or one row shared by all."""
+    if rows == 1:
+        shared = b[:d]
+        return lambda i: shared
+    return lambda i: b[i * d:(i + 1) * d]
+
+
+def row_dots(a: array, b: array, n: int, d: int, b_rows: int = None) -> array:
+    """
+    Dot product of each row of an n x d block with the matching row of b.
+
+    Args:
+        a: array('d') of n*d entries, row-major
+        b: array('d') of n*d entries, or d entries shared by every row
+        n: number of rows
+        d: row length
+        b_rows: rows in b (n or 1; defaults to n)
+
+    Returns:
+        array('d') of n dots
+    """
+    row_b = _row_operand(b, b_rows or n, n, d)
+    return array('d', [sum(map(mul, a[i * d:(i + 1) * d], row_b(i))) for i in range(n)])
+
+
+def scale_rows(a: array, factors, n: int, d: int) -> array:
+    """Multiply row i of an n x d block (or of a single shared row when len(a) == d) by factors[i]."""
+    out = array('d', bytes(8 * n * d))
+    if len(a) == d and n != 1:
+        for j in range(d):
+            x = a[j]
+            out[j::d] = array('d', [f * x for f in factors])
+        return out
+    for j in range(d):
+        out[j::d] = array('d', map(mul, a[j::d], factors))
+    return out
+
+
+def cross_rows(a: array, b: array, n: int, b_rows: int = None) -> array:
+    """Cross product of each row of an n x 3 block with the matching (or one shared) row of b."""
+    ax, ay, az = a[0::3], a[1::3], a[2::3]
+    if (b_rows or n) == 1:
+        bx, by, bz = b[0], b[1], b[2]
+        xs = [y * bz - z * by for y, z in zip(ay, az)]
+        ys = [z * bx - x * bz for x, z in zip(ax, az)]
+        zs = [x * by - y * bx for x, y in zip(ax, ay)]
+    else:
+        bx, by, bz = b[0::3], b[1::3], b[2::3]
+        xs = [y * w - z * v for y, z, v, w in zip(ay, az, by, bz)]
+        ys = [z * u - x * w for x, z, u, w in zip(ax, az, bx, bz)]
+        zs = [x * v - y * u for x, y, u, v in zip(ax, ay, bx, by)]
+    out = array('d', bytes(8 * 3 * n))
+    out[0::3], out[1::3], out[2::3] = array('d', xs), array('d', ys), array('d', zs)
+    return out
+
+
+# struct formats converted element by element (besides 'd' and raw 'B')
+_NUMERIC_FORMATS = frozenset('bhilqfHILQ')
+
+
+def _as_doubles(points) -> array:
+    """
+    A flat buffer as array('d'), honouring its item format.
+
+    Doubles (array('d'), format 'd' memoryviews) and untyped bytes
+    (bytes, bytearray, format 'B' views) are copied as packed doubles;
+    other numeric formats (float32, ints, ...) are converted element by
+    element.
+
+    Raises:
+        ValueError: If the bytes aren't whole doubles or the format isn't numeric
+    """
+    if isinstance(points, array):
+        return points if points.typecode == 'd' else array('d', points)
+    view = memoryview(points)
+    if view.ndim > 1:
+        view = view.cast('B').cast(view.format)
+    if view.format in ('d', 'B'):
+        if view.nbytes % 8:
+            raise ValueError(f"A buffer of {view.nbytes} bytes isn't a whole number of doubles")
+        flat = array('d')
+        flat.frombytes(view.cast('B'))
+        return flat
+    if view.format.lstrip('@=<>!') not in _NUMERIC_FORMATS:
+        raise ValueError(f"Unsupported buffer format '{view.format}'")
+    return array('d', view)
+
+
+def _batch(storage, flat: array, backend, workers, offset) -> array:
+    """One backend call for a packed block: matvec_batch, or affine_batch when there is an offset."""
+    rows, cols = storage.shape
+    if offset is None:
+        return backend.matvec_batch(storage.buffer, rows, cols, flat, workers)
+    return backend.affine_batch(storage.buffer, offset, rows, cols, flat, workers)
+
+
+def transform_points(storage, points, vector_cls, backend, workers=None, offset=None):
+    """
+    Apply the matrix held in `storage` (plus an optional offset) to a whole block of points.
+
+    Accepts the three layouts we pass around and hands back the same kind:
+        - list of Vectors       -> list of vector_cls
+        - flat buffer (array('d'), memoryview, bytes-like) of N*cols values
+                                -> array('d') of N*rows values
+        - NumPy ndarray (N x cols) -> ndarray (N x rows), done as one matmul
+
+    Args:
+        storage: 2D Storage of the matrix
+        points: the point block
+        vector_cls: Vector class used to wrap results for list input
+        backend: compute backend whose matvec_batch does the packed math
+        workers: process count for big non-NumPy blocks (None -> default)
+        offset: `rows` numbers added to every result (affine maps); the
+            backend's affine_batch fuses it into the same pass
+
+    Returns:
+        Transformed points in the same layout as the input
+
+    Raises:
+        ValueError: If the point dimension doesn't match the matrix columns
+    """
+    rows, cols = storage.shape
+
+    if hasattr(points, '__array_interface__') and hasattr(points, 'ndim'):
+        # NumPy input: let BLAS do the whole block (lazily imported)
+        import numpy as np
+        pts = np.asarray(points, dtype=float)
+        if pts.ndim != 2 or pts.shape[1] != cols:
+            raise ValueError(f"Expected an N x {cols} array, got shape {pts.shape}")
+        m = np.frombuffer(storage.buffer, dtype=float).reshape(rows, cols)
+        if offset is None:
+            return pts @ m.T
+        result = pts @ m.T
+        result += np.frombuffer(offset, dtype=float)
+        return result
+
+    if isinstance(points, (array, memoryview, bytes, bytearray)):
+        flat = _as_doubles(points)
+        return _batch(storage, flat, backend, workers, offset)
+
+    flat = array('d')
+    for p in points:
+        components = p.components
+        if len(components) != cols:
+            raise ValueError(f"Dimensions don't match columns ({len(components)} != {cols})")
+        flat.extend(components)
+    out = _batch(storage, flat, backend, workers, offset)
+    return [vector_cls._wrap(out[k:k + rows]) for k in range(0, len(out), rows)]
@@ -0,0 +1,310 @@
+"""
+Lazy: expression graphs for chained vector arithmetic, evaluated in one fused pass
+Goal: Make `a*2 + b - c*3` read each input once and allocate one result, not four temporaries
+
+Eagerly, every +, - and * on a Vector builds a full intermediate vector, so
+a chain of k operations walks memory k times. Inside lazy_mode() the same
+operators only record what was asked for: the result is a LazyVector
+holding a small expression graph. The graph is evaluated when a value is
+actually needed:
+
+    .components        - one pass over the inputs, one output array
+    .dot(other)        - fused with the dot product, no result array at all
+    .magnitude()       - fused with the sum of squares
+
+Evaluation compiles the graph into a single comprehension over zip(inputs)
+(pure Python) or a short sequence of in-place NumPy ufunc calls into one
+buffer (numpy backend, or auto for large vectors). Subexpressions that
+appear more than once (same operation on the same inputs and scalars) are
+computed once per element and reused, and an evaluated LazyVector keeps
+its result, so later expressions treat it as a plain input.
+
+Example:
+    >>> with lazy_mode():
+    ...     r = a * 2 + b - c * 3     # nothing computed yet
+    >>> r.magnitude()                 # one fused pass
+    >>> r.components                  # one more pass, result kept from now on
+"""
+
+from array import array
+from contextlib import contextmanager
+
+from . import backend
+from . import vector
+from .vector import Vector
+
+# Compiled pure-Python kernels, keyed by their source (i.e. by graph shape)
+_kernels = {}
+
+
+class Node:
+    """
+    One operation in an expression graph.
+
+    Attributes:
+        op: "leaf", "add", "sub" or "scale"
+        args: (buffer,) for a leaf, child Nodes otherwise
+        scalar: the factor of a "scale" node
+        size: length of the vector this node produces
+        key: structural identity, equal for equal subexpressions
+    """
+    __slots__ = ('op', 'args', 'scalar', 'size', 'key')
+
+    def __init__(self, op: str, args: tuple, size: int, scalar: float = None):
+        self.op = op
+        self.args = args
+        self.scalar = scalar
+        self.size = size
+        if op == "leaf":
+            self.key = ("leaf", id(args[0]))
+        else:
+            self.key = (op, scalar) + tuple(child.key for child in args)
+
+    def __repr__(self) -> str:
+        if self.op == "leaf":
+            return f"leaf[{self.size}]"
+        if self.op == "scale":
+            return f"({self.args[0]!r} * {self.scalar!r})"
+        return f"({self.args[0]!r} {'+' if self.op == 'add' else '-'} {self.args[1]!r})"
+
+
+def _node(v: Vector) -> Node:
+    if isinstance(v, LazyVector) and v._node is not None:
+        return v._node
+    return Node("leaf", (v.components,), len(v.components))
+
+
+class LazyVector(Vector):
+    """
+    A Vector whose components are computed on first use from an expression graph.
+
+    Behaves like any Vector; reading components, dot or magnitude triggers
+    the fused evaluation. After components are computed once, the graph is
+    dropped and the result is kept.
+    """
+    __slots__ = ('_node',)
+
+    @classmethod
+    def _wrap(cls, buffer):
+        lazy = super()._wrap(buffer)
+        lazy._node = None
+        return lazy
+
+    @classmethod
+    def _from_node(cls, node: Node) -> 'LazyVector':
+        lazy = cls.__new__(cls)
+        lazy._components = None
+        lazy._node = node
+        return lazy
+
+    @property
+    def components(self):
+        if self._components is None:
+            self._components = evaluate(self._node)
+            self._node = None
+        return self._components
+
+    @components.setter
+    def components(self, components):
+        self._components = array('d', components)
+        self._node = None
+
+    def __len__(self) -> int:
+        return self._node.size if self._node is not None else len(self._components)
+
+    def __repr__(self) -> str:
+        if self._node is not None:
+            return f"LazyVector({self._node!r})"
+        return f"LazyVector({self._components.tolist()})"
+
+    def dot(self, other):
+        """Dot product, fused with the evaluation when still lazy."""
+        if self._node is None:
+            return super().dot(other)
+        if self._node.size != len(other.components):
+            raise ValueError("Vectors must be the same dimension")
+        return evaluate(self._node, "dot", other.components)
+
+    def magnitude(self):
+        """Length, fused with the evaluation (sum of squares) when still lazy."""
+        if self._node is None:
+            return super().magnitude()
+        return evaluate(self._node, "norm") ** 0.5
+
+
+def _build(op: str, left: Vector, right) -> LazyVector:
+    """Operator hook installed by lazy_mode(): record the operation instead of doing it."""
+    a = _node(left)
+    if op == "scale":
+        return LazyVector._from_node(Node("scale", (a,), a.size, float(right)))
+    b = _node(right)
+    if a.size != b.size:
+        raise ValueError("Vectors must be the same dimension" if op == "add" else "Vectors are of different dimension!")
+    return LazyVector._from_node(Node(op, (a, b), a.size))
+
+
+@contextmanager
+def lazy_mode():
+    """
+    Build expression graphs instead of computing, for Vector +, - and * in this block.
+
+    The LazyVectors created inside stay lazy after the block ends; they are
+    evaluated whenever their value is first needed.
+
+    Example:
+        >>> with lazy_mode():
+        ...     blended = a * 0.25 + b * 0.75
+        >>> blended.components
+    """
+    previous = vector._lazy_builder
+    vector._lazy_builder = _build
+    try:
+        yield
+    finally:
+        vector._lazy_builder = previous
+
+
+def _plan(root: Node):
+    """
+    Flatten a graph into evaluation order.
+
+    Returns:
+        (order, leaves, shared): order lists each distinct subexpression once,
+        children first; leaves maps leaf key -> input position; shared is
+        the set of keys used by more than one parent
+    """
+    order, leaves, seen, shared = [], {}, set(), set()
+
+    def visit(node):
+        if node.key in seen:
+            shared.add(node.key)
+            return
+        seen.add(node.key)
+        if node.op == "leaf":
+            leaves[node.key] = (len(leaves), node.args[0])
+        else:
+            for child in node.args:
+                visit(child)
+        order.append(node)
+
+    visit(root)
+    return order, leaves, shared
+
+
+def _compile(source: str):
+    kernel = _kernels.get(source)
+    if kernel is None:
+        namespace = {}
+        exec(source, namespace)
+        kernel = _kernels[source] = namespace["kernel"]
+    return kernel
+
+
+def _evaluate_python(root: Node, mode: str, other):
+    """One comprehension over all inputs; shared subexpressions bound with := once per element."""
+    order, leaves, shared = _plan(root)
+    position = {node.key: i for i, node in enumerate(order)}
+    scalars = []
+    emitted = set()
+
+    def emit(node) -> str:
+        if node.op == "leaf":
+            return f"x{leaves[node.key][0]}"
+        name = f"t{position[node.key]}"
+        if node.key in emitted:
+            return name
+        if node.op == "scale":
+            child = emit(node.args[0])
+            scalars.append(node.scalar)
+            text = f"{child} * s{len(scalars) - 1}"
+        else:
+            text = f"{emit(node.args[0])} {'+' if node.op == 'add' else '-'} {emit(node.args[1])}"
+        if node.key in shared:
+            emitted.add(node.key)
+            return f"({name} := {text})"
+        return f"({text})"
+
+    body = emit(root)
+    inputs = [f"x{i}" for i in range(len(leaves))]
+    if mode == "dot":
+        inputs.append("y")
+    # the 1-tuple trailing comma lets a single input unpack from zip
+    targets = ", ".join(inputs) + ("," if len(inputs) == 1 else "")
+    sources = ", ".join(f"L{i}" for i in range(len(inputs)))
+    loop = f"for {targets} in zip({sources})"
+    if mode == "values":
+        expression = f"array('d', [{body} {loop}])"
+    elif mode == "dot":
+        expression = f"sum([{body} * y {loop}])"
+    else:
+        expression = f"sum([(r := {body}) * r {loop}])"
+    params = ", ".join([f"L{i}" for i in range(len(inputs))] + [f"s{i}" for i in range(len(scalars))])
+    kernel = _compile(f"from array import array\ndef kernel({params}):\n    return {expression}\n")
+
+    buffers = [buffer for _, buffer in sorted(leaves.values(), key=lambda item: item[0])]
+    if mode == "dot":
+        buffers.append(other)
+    return kernel(*buffers, *scalars)
+
+
+def _evaluate_numpy(root: Node, mode: str, other, np):
+    """
+    In-place ufuncs into as few buffers as possible.
+
+    Inputs are zero-copy views. An intermediate used only once is
+    overwritten by its parent (out=), so a chain like a*2 + b - c*3 needs
+    one result buffer plus one scratch buffer; shared intermediates are
+    computed once and kept.
+    """
+    order, leaves, shared = _plan(root)
+    values = {}
+    owned = set()   # keys whose array is a temporary this evaluation may overwrite
+    for node in order:
+        if node.op == "leaf":
+            values[node.key] = np.frombuffer(node.args[0], dtype=float)
+            continue
+        if node.op == "scale":
+            child = node.args[0].key
+            out = values[child] if child in owned and child not in shared else None
+            values[node.key] = np.multiply(values[child], node.scalar, out=out)
+        else:
+            left, right = (child.key for child in node.args)
+            ufunc = np.add if node.op == "add" else np.subtract
+            if left in owned and left not in shared:
+                out = values[left]
+            elif right in owned and right not in shared:
+                out = values[right]
+            else:
+                out = None
+            values[node.key] = ufunc(values[left], values[right], out=out)
+        owned.add(node.key)
+
+    result = values[root.key]
+    if mode == "dot":
+        return float(result @ np.frombuffer(other, dtype=float))
+    if mode == "norm":
+        return float(result @ result)
+    out = array('d')
+    out.frombytes(result.tobytes())
+    return out
+
+
+def evaluate(root: Node, mode: str = "values", other=None):
+    """
+    Evaluate an expression graph in one fused pass.
+
+    Args:
+        root: graph to evaluate
+        mode: "values" (the components), "dot" (with other) or "norm"
+            (sum of squares)
+        other: the second vector's buffer for "dot"
+
+    Returns:
+        array('d') for "values", float otherwise
+    """
+    active = backend.get_backend().name
+    if active == "numpy" or (active == "auto" and root.size >= backend.VECTOR_THRESHOLD):
+        np = backend.numpy_or_none()
+        if np is not None:
+            return _evaluate_numpy(root, mode, other, np)
+    return _evaluate_python(root, mode, other)
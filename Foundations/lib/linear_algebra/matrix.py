@@ -1,6 +1,11 @@
 import math
 from typing import List, Union
-from Vector3D import Vector3D
+from .vector import Vector
+from .storage import Storage
+from .backend import get_backend
+from . import kernels
+from . import decompositions
+from .decompositions import EigenDecomposition, LUFactorization
 
 class Matrix:
     """
@@ -11,7 +16,7 @@ class Matrix:
     This class provides a flexible implementation for matrices of arbitrary dimensions.
 
     Attributes:
-        data: 2D list of numbers representing the matrix, where each inner list is a row
+        data: Rows of the matrix, each a zero-copy view into contiguous storage
         rows: Number of rows in the matrix
         cols: Number of columns in the matrix
 
@@ -29,24 +34,74 @@ class Matrix:
         For specialized 2D and 3D operations with additional geometric methods
         (rotation, scaling, shear), see Matrix2D and Matrix3D classes.
     """
+    __slots__ = ('_storage',)
 
     def __init__(self, data):
         """
         Initialize matrix from nD list.
 
+        The rows are packed into one flat, row-major block of doubles
+        (see Storage) instead of being kept as nested lists.
+
         Args:
             data: nD list where each inner list is a row
                 ex: [[1,2], [3,4]] represents a 2x2 matrix.
+
+        Raises:
+            ValueError: If the rows are not all the same length
         """
-        for row in data:
-            if len(row) != len(data[0]):
-                raise ValueError("Jagged Array! All rows must be the same length.")
+        self._storage = Storage.from_rows(data)
 
-        self.data = data
-        self.rows = len(data)
-        self.cols = len(data[0]) if data else 0
+    @classmethod
+    def _wrap(cls, storage: Storage):
+        """Build a matrix around existing storage without copying or validating."""
+        matrix = cls.__new__(cls)
+        matrix._storage = storage
+        return matrix
+
+    @property
+    def data(self) -> List[memoryview]:
+        """Rows as zero-copy views (indexable and unpackable like lists)."""
+        return self._storage.rows()
+
+    @data.setter
+    def data(self, data) -> None:
+        self._storage = Storage.from_rows(data)
+
+    @property
+    def rows(self) -> int:
+        return self._storage.shape[0]
+
+    @property
+    def cols(self) -> int:
+        return self._storage.shape[1]
+
+    @classmethod
+    def _accepts(cls, shape) -> bool:
+        """Whether a result of this shape can stay this class (subclasses narrow it)."""
+        return True
+
+    def _like(self, storage: Storage) -> 'Matrix':
+        """
+        Wrap a computed result as this matrix's class when the shape allows it,
+        otherwise as a general Matrix (e.g. a rectangular product of Matrix3D).
+        """
+        cls = type(self) if type(self)._accepts(storage.shape) else Matrix
+        return cls._wrap(storage)
+
+    def _vector_type(self) -> type:
+        """Vector class used for results of multiply_vector/transform_points."""
+        return Vector
+
+    def __repr__(self) -> str:
+        """
+        Return string representation for debugging.
+
+        Returns:
+            String like "Matrix([[1.0, 2.0], [3.0, 4.0]])"
+        """
+        return f"{type(self).__name__}({self._storage.tolist()})"
 
-    
     def __str__(self) -> str:
         """
 
@@ -65,7 +120,7 @@ class Matrix:
 
         return "\n".join(rowstrings)
     
-    def get_column(self, col_index: int) -> Vector3D:
+    def get_column(self, col_index: int) -> Vector:
         """
         Extract a column as a vector.
 
@@ -75,8 +130,322 @@ class Matrix:
         Args:
             col_index: Which column to extract (0-indexed)
         Returns:
-            Vector3D containing the column values
+            Vector containing the column values
+        """
+        return Vector._wrap(self._storage.column(col_index))
+
+    def multiply_vector(self, vector: Vector) -> Vector:
+        """
+        Apply this transformation to a vector (matrix-vector multiplication).
+
+        Geometric: Where does this vector land after the transformation
+        represented by this matrix?
+
+        Math: Each component of result is a dot product of a matrix row
+        with the input vector.
+
+        Args:
+            vector: Vector with `cols` components
+
+        Returns:
+            Vector with `rows` components (Vector3D for 3-row Matrix3D)
+
+        Raises:
+            ValueError: If matrix columns don't match vector dimension
+
+        Example:
+            >>> M = Matrix([[1, 2, 3], [4, 5, 6]])
+            >>> M.multiply_vector(Vector([1, 1, 1]))  # Vector([6.0, 15.0])
+        """
+        if self.cols != len(vector.components):
+            raise ValueError(f"Matrix columns ({self.cols}) must match vector dimension ({len(vector.components)})")
+        result = get_backend().matvec(self._storage.buffer, self.rows, self.cols, vector.components)
+        return self._vector_type()._wrap(result)
+
+    def multiply_matrix(self, other: 'Matrix', use_numpy=None, workers=None) -> 'Matrix':
+        """
+        Compose two transformations (general matrix multiply, GEMM).
+
+        Geometric: The returned matrix first applies other, then applies self.
+
+        Math: Entry (i, j) is the dot product of row i of self with column j
+        of other. Any m x k times k x n shapes work; the result is m x n.
+        The work is done by the active backend (see backend.py): kernels.gemm
+        (transposed-B, k-panel tiled) in pure Python, or NumPy.
+
+        Order: Order matters here. self * other != other * self.
+
+        Args:
+            other: Matrix (or Matrix2D/Matrix3D) with `cols` rows
+            use_numpy: True/False to force the numpy/python backend,
+                None to use the active backend
+            workers: processes for the parallel backend (see parallel.py);
+                None uses parallel.get_workers(), which defaults to 1 (serial)
+
+        Returns:
+            Product as this matrix's class when the shape allows it,
+            otherwise as a general Matrix
+
+        Raises:
+            ValueError: If inner dimensions don't match: mxn nxp works, mxn mxn does not.
+
+        Example:
+            >>> A = Matrix([[1, 2, 3], [4, 5, 6]])       # 2x3
+            >>> B = Matrix([[1, 0], [0, 1], [1, 1]])     # 3x2
+            >>> A.multiply_matrix(B)  # [[4, 5], [10, 11]]
+        """
+        if self.cols != other.rows:
+            raise ValueError("Inner dimensions don't match")
+        if use_numpy is None:
+            backend = get_backend()
+        else:
+            backend = get_backend("numpy" if use_numpy else "python")
+        product = backend.matmul(self._storage.buffer, other._storage.buffer,
+                                 self.rows, self.cols, other.cols, workers)
+        return self._like(Storage(product, (self.rows, other.cols)))
+
+    def transpose(self) -> 'Matrix':
+        """
+        Flip rows and columns.
+
+        Returns:
+            cols x rows matrix (same class when the shape allows it)
+        """
+        transposed = get_backend().transpose(self._storage.buffer, self.rows, self.cols)
+        return self._like(Storage(transposed, (self.cols, self.rows)))
+
+    def transform_points(self, points, workers=None):
+        """
+        Apply this transformation to many points in one call.
+
+        Instead of calling multiply_vector once per point (and building a
+        Vector per row per call), the whole N x d block is packed and pushed
+        through a single batched kernel.
+
+        Args:
+            points: list of Vectors, a flat buffer of N*cols numbers
+                (array('d'), memoryview, bytes), or an N x cols ndarray
+            workers: processes for big non-NumPy blocks (see parallel.py);
+                None uses parallel.get_workers()
+
+        Returns:
+            Transformed points in the same layout as the input:
+            list of Vectors, array('d'), or ndarray
+
+        Raises:
+            ValueError: If the point dimension doesn't match the columns
+
+        Example:
+            >>> M = Matrix([[1, 2, 3], [4, 5, 6]])
+            >>> M.transform_points(array('d', [1, 0, 0, 0, 1, 0]))
+            # array('d', [1.0, 4.0, 2.0, 5.0])
+        """
+        return kernels.transform_points(self._storage, points, self._vector_type(), get_backend(), workers)
+
+    apply_batch = transform_points
+
+    def lu(self) -> LUFactorization:
+        """
+        LU factorization with partial pivoting: P A = L U.
+
+        Factoring is the O(n^3) step; keep the result and call its solve /
+        solve_many to answer many systems for O(n^2) each. (A frozen matrix
+        caches this for you, see freeze().)
+
+        Returns:
+            LUFactorization (see decompositions.py)
+
+        Raises:
+            ValueError: If the matrix isn't square
+        """
+        return LUFactorization(self._storage)
+
+    def det(self) -> float:
+        """
+        Determinant of a square matrix of any size.
+
+        Geometric: how much the transformation scales area (2D) or volume
+        (3D and up). det = 0 means space is flattened; a negative det means
+        orientation is flipped.
+
+        Math: Computed from the LU factors as sign(P) * prod(diag(U)),
+        O(n^3) instead of the O(n!) cofactor expansion.
+
+        Returns:
+            Float determinant
+
+        Raises:
+            ValueError: If the matrix isn't square
+
+        Example:
+            >>> Matrix3D.scaling(2, 3, 4).det()  # 24.0
+        """
+        return self.lu().determinant()
+
+    determinant = det
+
+    def inverse(self) -> 'Matrix':
+        """
+        Inverse transformation: undoes what this matrix does.
+
+        Math: Solves A X = I for all n columns at once from one LU.
+
+        Returns:
+            n x n inverse (same class as self)
+
+        Raises:
+            ValueError: If the matrix isn't square or is singular
+
+        Example:
+            >>> R = Matrix3D.rotation(30, "z")
+            >>> R.inverse()  # same as Matrix3D.rotation(-30, "z")
+        """
+        return self._like(Storage(self.lu().inverse(), self._storage.shape))
+
+    def solve(self, b: Vector) -> Vector:
+        """
+        Solve self @ x = b: which vector lands on b?
+
+        Args:
+            b: Vector with `rows` components
+
+        Returns:
+            Vector x (Vector3D for a 3x3 Matrix3D)
+
+        Raises:
+            ValueError: If the matrix isn't square, is singular, or b has the
+                wrong dimension
+
+        Example:
+            >>> Matrix([[2, 1], [1, 3]]).solve(Vector([3, 5]))  # Vector([0.8, 1.4])
+        """
+        return self._vector_type()._wrap(self.lu().solve(b.components))
+
+    def solve_many(self, b):
+        """
+        Solve self @ X = B for many right-hand sides with one factorization.
+
+        Args:
+            b: Matrix with `rows` rows (each column is one right-hand side),
+                or a list of Vectors
+
+        Returns:
+            Matrix X (rows x k) for Matrix input, list of Vectors for list input
+
+        Raises:
+            ValueError: If the matrix isn't square, is singular, or the
+                right-hand sides have the wrong dimension
+
+        Example:
+            >>> A.solve_many([Vector([1, 0]), Vector([0, 1])])  # columns of A^-1
+        """
+        factors = self.lu()
+        if isinstance(b, Matrix):
+            k = b.cols
+            if b.rows != self.rows:
+                raise ValueError(f"Right-hand side has {b.rows} rows, expected {self.rows}")
+            x = factors.solve_many(b._storage.buffer, k)
+            return self._like(Storage(x, (self.rows, k)))
+        vector_cls = self._vector_type()
+        return [vector_cls._wrap(factors.solve(v.components)) for v in b]
+
+    def eigen(self, tolerance: float = decompositions.EIGEN_TOLERANCE,
+              max_iterations: int = None) -> EigenDecomposition:
+        """
+        All eigenvalues and eigenvectors: the directions this transformation
+        only stretches (A v = lambda v), and by how much.
+
+        Math: Householder reduction to Hessenberg form, then the QR
+        algorithm with Wilkinson shifts and deflation (see
+        decompositions.eigen). Symmetric matrices take a real path and get
+        orthonormal eigenvectors. The numpy backend hands the same problem
+        to LAPACK instead.
+
+        Args:
+            tolerance: relative size at which a subdiagonal entry counts as zero
+            max_iterations: cap on QR sweeps (default 50 per eigenvalue)
+
+        Returns:
+            EigenDecomposition: values sorted by real part, largest first;
+            vectors as a matrix whose column i belongs to values[i]
+            (complex pairs packed as real/imaginary columns); iterations
+            and converged for profiling. Unpacks as (values, vectors).
+
+        Raises:
+            ValueError: If the matrix isn't square
+
+        Example:
+            >>> values, vectors = Matrix([[2, 1], [1, 2]]).eigen()
+            >>> values   # (3.0, 1.0)
+            >>> Matrix2D.rotation(90).eigen().values   # (1j, -1j)
+        """
+        n, cols = self._storage.shape
+        if n != cols:
+            raise ValueError(f"Eigen-decomposition needs a square matrix, got {n}x{cols}")
+        a = self._storage.buffer
+        result = get_backend().eigen(a, n, decompositions.is_symmetric(a, n), tolerance, max_iterations)
+        result.vectors = self._like(Storage(result.vectors, (n, n)))
+        return result
+
+    def top_k_eigen(self, k: int, method: str = "lanczos", tolerance: float = 1e-10,
+                    max_iterations: int = 1000, seed: int = 0) -> EigenDecomposition:
+        """
+        The k largest-magnitude eigenpairs of a symmetric matrix, without
+        computing the rest.
+
+        Only matrix-vector products with this matrix are needed, so for
+        k << n this is much cheaper than eigen(). The products go through the
+        active backend.
+
+        Args:
+            k: number of eigenpairs
+            method: "lanczos" (fewer products) or "power" (power iteration
+                with deflation; slow when eigenvalues are close)
+            tolerance: relative residual |A v - lambda v| / |lambda| to accept
+            max_iterations: cap on matrix-vector products (per eigenpair for power)
+            seed: seed for the random starting vectors
+
+        Returns:
+            EigenDecomposition with k values (largest |lambda| first) and an
+            n x k vectors matrix; iterations counts matrix-vector products
+
+        Raises:
+            ValueError: If the matrix isn't square and symmetric, k is out
+                of range or the method is unknown
+
+        Example:
+            >>> covariance.top_k_eigen(3).values   # 3 largest variances
+        """
+        n, cols = self._storage.shape
+        a = self._storage.buffer
+        if n != cols or not decompositions.is_symmetric(a, n):
+            raise ValueError("top_k_eigen needs a square symmetric matrix")
+        if not 1 <= k <= n:
+            raise ValueError(f"k must be between 1 and {n}, got {k}")
+        if method not in decompositions.TOP_K_METHODS:
+            raise ValueError(f"Unknown method '{method}'. Supported: {sorted(decompositions.TOP_K_METHODS)}")
+        result = decompositions.TOP_K_METHODS[method](a, n, k, get_backend(), tolerance, max_iterations, seed)
+        result.vectors = self._like(Storage(result.vectors, (n, k)))
+        return result
+
+    def freeze(self) -> 'Matrix':
+        """
+        Immutable, hashable copy that caches its determinant, inverse,
+        transpose and LU/QR/eigen factors (see frozen.py).
+
+        Example:
+            >>> R = Matrix3D.rotation(30, "x").freeze()
+            >>> R.solve(v1), R.solve(v2)   # one factorization, two cheap solves
+        """
+        from .frozen import freeze  # frozen.py imports this module
+        return freeze(self)
+
+    def to_sparse(self, tolerance: float = 0.0):
+        """
+        Sparse (CSR) copy keeping only entries with |x| > tolerance (see sparse.py).
+
+        Example:
+            >>> Matrix3D.scaling(*scales).to_sparse().nnz   # len(scales)
         """
-        column = [row[col_index] for row in self.data]
-        return Vector3D(column)
-    
\ No newline at end of file
+        from .sparse import SparseMatrix  # sparse.py imports this module
+        return SparseMatrix.from_matrix(self, tolerance)
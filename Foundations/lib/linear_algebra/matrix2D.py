@@ -5,10 +5,11 @@ Goal: Understand matrices as transformations
 
 import math
 from typing import List
-from vector import Vector
+from .vector import Vector
+from .matrix import Matrix
 
 
-class Matrix2D:
+class Matrix2D(Matrix):
     """
     Matrix2D class representing linear transformations.
 
@@ -17,7 +18,7 @@ class Matrix2D:
     after the transformation.
 
     Attributes:
-        data: 2D list of numbers representing the Matrix2D
+        data: Rows of the Matrix2D, each a zero-copy view into contiguous storage
         rows: Number of rows in the Matrix2D
         cols: Number of columns in the Matrix2D
 
@@ -26,27 +27,7 @@ class Matrix2D:
         >>> v = Vector([1, 1])
         >>> result = M.multiply_vector(v)  # Should give Vector([2, 3])
     """
-
-    def __init__(self, data: List[List[float]]):
-        """
-        Initialize Matrix2D from 2D list.
-
-        Args:
-            data: 2D list where each inner list is a row
-                  Example: [[1, 2], [3, 4]] represents a 2x2 Matrix2D
-        """
-        self.data = data
-        self.rows = len(data)
-        self.cols = len(data[0]) if data else 0
-
-    def __repr__(self) -> str:
-        """
-        Return string representation for debugging.
-
-        Returns:
-            String like "Matrix2D([[1, 2], [3, 4]])"
-        """
-        return f"Matrix2D({self.data})"
+    __slots__ = ()
 
     def __str__(self) -> str:
         """
@@ -65,52 +46,6 @@ class Matrix2D:
 
         return "\n".join(rowstrings)
 
-    def get_column(self, col_index: int) -> Vector:
-        """
-        Extract a column as a Vector.
-
-        Geometric meaning: The i-th column shows where the i-th basis
-        vector lands after this transformation.
-
-        Args:
-            col_index: Which column to extract (0-indexed)
-
-        Returns:
-            Vector containing the column values
-        """
-        column = [row[col_index] for row in self.data]
-        return Vector(column)
-
-    def multiply_vector(self, vector: Vector) -> Vector:
-        """
-        Apply this transformation to a vector (Matrix2D-vector multiplication).
-
-        Geometric interpretation: Where does this vector land after
-        the transformation represented by this Matrix2D?
-
-        Mathematical: Each component of result is the dot product of
-        a Matrix2D row with the input vector.
-
-        Args:
-            vector: The vector to transform
-
-        Returns:
-            Transformed vector
-
-        Raises:
-            ValueError: If Matrix2D columns don't match vector dimension
-
-        Example:
-            >>> M = Matrix2D([[2, 0], [0, 3]])  # Scale x by 2, y by 3
-            >>> v = Vector([1, 1])
-            >>> M.multiply_vector(v)  # Returns Vector([2, 3])
-        """
-        if self.cols != len(vector.components):
-            raise ValueError(f"Matrix2D columns ({self.cols}) must match vector dimension ({len(vector.components)})")
-
-        result = [vector.dot(Vector(row)) for row in self.data]
-        return Vector(result)
-    
     def multiply_Matrix2D(self, other: 'Matrix2D') -> 'Matrix2D':
         """ 
         Applies a transformation to the Matrix2D.
@@ -134,16 +69,7 @@ class Matrix2D:
         """
         if (self.cols != other.rows):
             raise ValueError("Inner dimensions don't match")
-        product = []
-        for i in range(other.cols):
-            product.append(self.multiply_vector(Vector(other.get_column(i))).components)
-        toReturn = []
-        for row_index in range(len(product[0])):
-            new_row = []
-            for column in product:
-                new_row.append(column[row_index])
-            toReturn.append(new_row)
-        return Matrix2D(toReturn)
+        return self.multiply_matrix(other)
 
     @staticmethod
     def rotation(angle_degrees: float) -> 'Matrix2D':
@@ -1,8 +1,10 @@
 import math
 from typing import List, Union
-from Vector3D import Vector3D
+from .vector import Vector
+from .Vector3D import Vector3D
+from .matrix import Matrix
 
-class Matrix3D:
+class Matrix3D(Matrix):
     """
     Matrix3D Class representing linear transformations.
 
@@ -11,7 +13,7 @@ class Matrix3D:
     after the transformation. Matrices should be 3D or higher and square.
 
     Attributes:
-        data: 2D list of numbers representing the matrix
+        data: rows of the matrix, each a zero-copy view into contiguous storage
         rows: number of rows in the matrix
         cols: number of columns in the matrix
         
@@ -20,6 +22,8 @@ class Matrix3D:
         >>> v = Vector3D([1,2,3])
         >>> result = M.multiply_vector(v) # should give Vector3D([2,6,15])
     """
+    __slots__ = ()
+
     def __init__(self, data: List[List[float]]):
         """
         Initialize matrix from 2D list.
@@ -28,40 +32,20 @@ class Matrix3D:
             data: 2D list where each inner list is a row
                 ex: [[1,2], [3,4]] represents a 2x2 matrix.
         """
-        self.data = data
-        self.rows = len(data) #counts number of inner lists (rows)
-        self.cols = len(data[0]) if data else 0 # counts how many elements are in first row (columns). checks for empty matrix
+        super().__init__(data) # packs rows into one flat block, shape = (rows, cols)
         if (self.rows < 3 or self.cols < 3):
             raise ValueError("Matrix must at least be 3x3.")
         if (self.rows != self.cols):
             raise ValueError("Matrix not square")
 
-    def __repr__(self) -> str:
-        """
-        Return string representation for debugging.
-
-        Returns:
-            String like "Matrix3D([[1,2], [3,4])"
-        """
-        return f"Matrix3D({self.data})"
-    
-    def __str__(self) -> str:
-        """
-
-        Pretty print the matrix in readable format.
-
-        Returns:
-         Multi-line string with formatted matrix
-         Example:
-             [1.00, 2.00, 3.00]
-             [4.00, 5.00, 6.00]
-        """
-        rowstrings = []
-        for row in self.data:
-            rstring = ", ".join(f"{num:.2f}" for num in row)
-            rowstrings.append(rstring)
+    @classmethod
+    def _accepts(cls, shape) -> bool:
+        # products with rectangular matrices fall back to a general Matrix
+        rows, cols = shape
+        return rows >= 3 and rows == cols
 
-        return "\n".join(rowstrings)
+    def _vector_type(self) -> type:
+        return Vector3D if self.rows == 3 else Vector
 
     def get_column(self, col_index: int) -> Vector3D:
         """
@@ -75,37 +59,10 @@ class Matrix3D:
         Returns:
             Vector3D containing the column values
         """
-        column = [row[col_index] for row in self.data]
+        column = self._storage.column(col_index)
         return Vector3D(column)
 
-    def multiply_vector(self, vector: Vector3D) -> Vector3D:
-        """
-        Apply this transformation to a vector (matrix-vector multiplication
-
-        Geometric: Where does this vector land after the transformation 
-        represented by this matrix?
-
-        Math: Each component of result is a dot product of a matrix row
-        with the input vector.
-
-        Args:
-            vector: Vector3D
-        
-        Returns:
-            Vector3D
-        
-        Raises: ValueError: If matrix columns don't match vector dimension
-
-        Example:
-            >>>M = Matrix3D([[2,0, 0], [0,3, 0], [0,0,4)] #scale x by 2, y by 3, z by 4)
-            >>>v = Vector3D([1,1,1]) # returns Vector3D([2,3,4])
-        """
-        if (len(vector.components) != self.cols):
-            raise ValueError("Dimensions don't match columns")
-        result = [vector.dot(Vector3D(row)) for row in self.data]
-        return Vector3D(result)
-
-    def multiply_matrix(self, other: 'Matrix3D') -> 'Matrix3D':
+    def multiply_matrix(self, other: 'Matrix', use_numpy=None, workers=None) -> 'Matrix3D':
         """ 
         Applies a transformation to the matrix.
 
@@ -117,24 +74,15 @@ class Matrix3D:
 
         Order: Order matters here. self * other != other * self.
 
+        Rectangular: other may be any k x n Matrix; if the product isn't square
+        it comes back as a general Matrix instead of a Matrix3D.
+
         Raises: ValueError: If Matrix Inner Dimensions don't match: mxn nxm works, nxm nxm does not.
 
         """
         if (self.cols != other.rows):
             raise ValueError("Inner dimensions don't match")
-        product = []
-        for i in range(other.cols):
-            product.append(self.multiply_vector(other.get_column(i)).components)
-        toReturn = []
-        for row_index in range(len(product[0])):
-            new_row = []
-            for column in product:
-                new_row.append(column[row_index])
-            toReturn.append(new_row)
-        return Matrix3D(toReturn)
-                
-            
-        
+        return super().multiply_matrix(other, use_numpy, workers)
 
     @staticmethod
     def rotation(angle_degrees: float, axis: str) -> 'Matrix3D':
@@ -143,10 +91,14 @@ class Matrix3D:
 
         Args:
             angle_degrees: Rotation angle in degrees
-            axis: which axis to rotate around("x", "y", or "z")
+            axis: which axis to rotate around("x", "y", or "z"), or any
+                3D direction (Vector3D or 3 numbers), built via Quaternion
         
         Returns:
             3x3 rotation matrix
+
+        Raises:
+            ValueError: If the axis isn't x/y/z or a nonzero 3D vector
         """
         radians = math.radians(angle_degrees)
         cos = math.cos(radians)
@@ -166,8 +118,11 @@ class Matrix3D:
                 r1 = [cos, negSin, 0]
                 r2 = [sin, cos, 0]
                 r3 = [0, 0, 1]
+            case str():
+                raise ValueError("Axis mismatch: Only x, y, z or a 3D vector is supported")
             case _:
-                raise ValueError("Axis mismatch: Only x, y, or z is supported")
+                from .quaternion import Quaternion  # quaternion.py imports this module
+                return Quaternion.from_axis_angle(axis, angle_degrees).to_matrix()
         return Matrix3D([r1,r2,r3])
                 
         
@@ -202,6 +157,31 @@ class Matrix3D:
             rows.append(row_n)
         return Matrix3D(rows)
 
+    @staticmethod
+    def shear(xy: float = 0, xz: float = 0, yx: float = 0, yz: float = 0, zx: float = 0, zy: float = 0) -> 'Matrix3D':
+        """
+        Create a 3D shear matrix.
+
+        Each factor moves one coordinate in proportion to another: xy
+        shifts x by xy * y, zx shifts z by zx * x, and so on.
+
+        Args:
+            xy, xz, yx, yz, zx, zy: shear factors (0 means no shear)
+
+        Returns:
+            3x3 shear matrix
+
+        Mathematical formula:
+            [1   xy  xz]
+            [yx  1   yz]
+            [zx  zy  1 ]
+
+        Example:
+            >>> Sh = Matrix3D.shear(xy=1)
+            >>> Sh.multiply_vector(Vector3D([0, 1, 0]))  # Vector3D([1, 1, 0])
+        """
+        return Matrix3D([[1, xy, xz], [yx, 1, yz], [zx, zy, 1]])
+
     @staticmethod
     def identity(size=3) -> 'Matrix3D':
         """
@@ -216,46 +196,42 @@ class Matrix3D:
         identity = [[1 if i == j else 0 for j in range(size)] for i in range(size)]
 
         return Matrix3D(identity)
-    
-
-   
-
-m = Matrix3D([[1,0,0], [0,2,0],[0,0,3]])
-print(m)
-col1 = m.get_column(0)
-print(col1)
-v = Vector3D([1,2,3])
-m2 = m.multiply_vector(v)
-print(m2)
-m3 = m.multiply_matrix(m)
-print(m3)
-# Test rotation around z-axis by 90 degrees
-# Should rotate (1, 0, 0) to approximately (0, 1, 0)
-Rz = Matrix3D.rotation(90, "z")
-v = Vector3D([1, 0, 0])
-result = Rz.multiply_vector(v)
-print(result)  # Should be approximately [0, 1, 0
-Rx = Matrix3D.rotation(90, "x")
-result = Rx.multiply_vector(v)
-print(result)
-Ry = Matrix3D.rotation(90, "y")
-result = Ry.multiply_vector(v)
-print(result)
-
-# 3D scaling (what you originally wanted)
-S3 = Matrix3D.scaling(2, 3, 4)
-print(S3)
-print()
-
-# 4D scaling (just because you can!)
-S4 = Matrix3D.scaling(2, 3, 4, 5)
-print(S4)
-print()
-
-# Test it with a vector
-v = Vector3D([1, 1, 1])
-result = S3.multiply_vector(v)
-print(result)  # Should be [2, 3, 4]
-
 
 
+if __name__ == "__main__":
+    m = Matrix3D([[1,0,0], [0,2,0],[0,0,3]])
+    print(m)
+    col1 = m.get_column(0)
+    print(col1)
+    v = Vector3D([1,2,3])
+    m2 = m.multiply_vector(v)
+    print(m2)
+    m3 = m.multiply_matrix(m)
+    print(m3)
+    # Test rotation around z-axis by 90 degrees
+    # Should rotate (1, 0, 0) to approximately (0, 1, 0)
+    Rz = Matrix3D.rotation(90, "z")
+    v = Vector3D([1, 0, 0])
+    result = Rz.multiply_vector(v)
+    print(result)  # Should be approximately [0, 1, 0
+    Rx = Matrix3D.rotation(90, "x")
+    result = Rx.multiply_vector(v)
+    print(result)
+    Ry = Matrix3D.rotation(90, "y")
+    result = Ry.multiply_vector(v)
+    print(result)
+
+    # 3D scaling (what you originally wanted)
+    S3 = Matrix3D.scaling(2, 3, 4)
+    print(S3)
+    print()
+
+    # 4D scaling (just because you can!)
+    S4 = Matrix3D.scaling(2, 3, 4, 5)
+    print(S4)
+    print()
+
+    # Test it with a vector
+    v = Vector3D([1, 1, 1])
+    result = S3.multiply_vector(v)
+    print(result)  # Should be [2, 3, 4]
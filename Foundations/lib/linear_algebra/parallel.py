@@ -0,0 +1,233 @@
+"""
+Parallel: multi-core matrix multiply and batch transform
+Goal: Use every core for big products by splitting the work into row blocks
+
+Pure Python runs one thread at a time (the GIL), so the only way to use
+more than one core is more than one process. Pickling a 1024 x 1024
+operand to every worker would cost more than the multiply, so operands
+and results live in multiprocessing.shared_memory blocks instead: each
+worker attaches by name, reads its slice of the inputs and writes its
+slice of the output in place.
+
+Parallelism is opt-in. Nothing here runs unless a worker count > 1 is
+configured with set_workers(n), the LINALG_WORKERS environment variable,
+or a workers=n argument on multiply_matrix / transform_points.
+"""
+
+import atexit
+import os
+from array import array
+
+from . import kernels
+
+# Below these sizes, process start-up and scheduling cost more than they save.
+MATMUL_THRESHOLD = 96 ** 3     # multiply-adds (m*k*n)
+TRANSFORM_THRESHOLD = 200_000  # points
+
+_workers = int(os.environ.get("LINALG_WORKERS", "1") or 1)
+_pool = None
+_pool_size = 0
+
+
+def set_workers(workers) -> None:
+    """
+    Set the default worker count used when no workers= argument is given.
+
+    Args:
+        workers: number of processes; None or 1 turns parallelism off,
+            0 means "one per CPU"
+    """
+    global _workers
+    if workers == 0:
+        workers = os.cpu_count() or 1
+    _workers = workers or 1
+
+
+def get_workers() -> int:
+    """Return the default worker count (1 means serial)."""
+    return _workers
+
+
+def resolve_workers(workers) -> int:
+    """Turn a workers= argument (None -> default) into a process count."""
+    if workers is None:
+        return _workers
+    if workers == 0:
+        return os.cpu_count() or 1
+    return workers
+
+
+def _get_pool(workers: int) -> 'ProcessPoolExecutor':
+    """Reuse one process pool across calls; rebuild it only if the size changes."""
+    global _pool, _pool_size
+    if _pool is None or _pool_size != workers:
+        shutdown()
+        from concurrent.futures import ProcessPoolExecutor
+        _pool = ProcessPoolExecutor(max_workers=workers)
+        _pool_size = workers
+    return _pool
+
+
+def shutdown() -> None:
+    """Stop the worker processes (they are restarted on the next parallel call)."""
+    global _pool, _pool_size
+    if _pool is not None:
+        _pool.shutdown()
+    _pool = None
+    _pool_size = 0
+
+
+atexit.register(shutdown)
+
+
+def _allocate(doubles: int) -> 'SharedMemory':
+    """New shared memory block with room for `doubles` values."""
+    # imported here: multiprocessing.shared_memory alone adds ~10 ms to startup
+    from multiprocessing.shared_memory import SharedMemory
+    return SharedMemory(create=True, size=max(doubles * 8, 8))
+
+
+def _share(values: array) -> 'SharedMemory':
+    """Copy an array('d') into a new shared memory block."""
+    shm = _allocate(len(values))
+    shm.buf[:len(values) * 8] = memoryview(values).cast('B')
+    return shm
+
+
+def _read(shm: 'SharedMemory', start: int, end: int) -> array:
+    """Copy doubles [start, end) of a shared block into an array('d')."""
+    values = array('d')
+    values.frombytes(shm.buf[start * 8:end * 8])
+    return values
+
+
+def _attach(name: str) -> 'SharedMemory':
+    """
+    Attach to a block created by the parent.
+
+    Pool workers share the parent's resource tracker, so attaching just
+    re-registers a name the parent already owns; the parent unlinks it.
+    """
+    from multiprocessing.shared_memory import SharedMemory
+    return SharedMemory(name=name)
+
+
+def _release(*blocks) -> None:
+    for shm in blocks:
+        shm.close()
+        shm.unlink()
+
+
+def _split(total: int, parts: int):
+    """Split range(total) into `parts` contiguous (start, end) blocks."""
+    step, extra = divmod(total, parts)
+    start = 0
+    for p in range(parts):
+        end = start + step + (1 if p < extra else 0)
+        if end > start:
+            yield start, end
+        start = end
+
+
+def _gemm_rows(a_name, bt_name, c_name, k, n, row_start, row_end) -> None:
+    """Worker: C[row_start:row_end] = A[row_start:row_end] @ B."""
+    a_shm, bt_shm, c_shm = _attach(a_name), _attach(bt_name), _attach(c_name)
+    try:
+        a = _read(a_shm, row_start * k, row_end * k)
+        bt = _read(bt_shm, 0, n * k)
+        block = kernels.gemm_bt(a, bt, row_end - row_start, k, n)
+        c_shm.buf[row_start * n * 8:row_end * n * 8] = memoryview(block).cast('B')
+    finally:
+        for shm in (a_shm, bt_shm, c_shm):
+            shm.close()
+
+
+def _transform_chunk(m_name, p_name, o_name, rows, cols, start, end, offset=None) -> None:
+    """Worker: transform points[start:end] into out[start:end] (plus offset, if given)."""
+    m_shm, p_shm, o_shm = _attach(m_name), _attach(p_name), _attach(o_name)
+    try:
+        matrix = _read(m_shm, 0, rows * cols)
+        points = _read(p_shm, start * cols, end * cols)
+        if offset is None:
+            out = kernels.matvec_batch(matrix, rows, cols, points)
+        else:
+            out = kernels.affine_batch(matrix, offset, rows, cols, points)
+        o_shm.buf[start * rows * 8:end * rows * 8] = memoryview(out).cast('B')
+    finally:
+        for shm in (m_shm, p_shm, o_shm):
+            shm.close()
+
+
+def multiply(a: array, b: array, m: int, k: int, n: int, workers=None) -> array:
+    """
+    C = A @ B with the rows of A split across worker processes.
+
+    A, B^T and C are placed in shared memory; each worker computes a
+    contiguous block of rows of C with kernels.gemm_bt and writes it back
+    in place. Nothing but block names and row ranges is pickled.
+
+    Args:
+        a: array('d') of A entries (m x k, row-major)
+        b: array('d') of B entries (k x n, row-major)
+        m, k, n: shapes
+        workers: process count (None -> get_workers())
+
+    Returns:
+        array('d') of C entries (m x n, row-major)
+    """
+    workers = min(resolve_workers(workers), m)
+    if workers <= 1:
+        return kernels.gemm(a, b, m, k, n)
+
+    a_shm = _share(a)
+    bt_shm = _share(kernels.transpose(b, k, n))
+    c_shm = _allocate(m * n)
+    try:
+        pool = _get_pool(workers)
+        futures = [pool.submit(_gemm_rows, a_shm.name, bt_shm.name, c_shm.name, k, n, start, end)
+                   for start, end in _split(m, workers)]
+        for future in futures:
+            future.result()
+        return _read(c_shm, 0, m * n)
+    finally:
+        _release(a_shm, bt_shm, c_shm)
+
+
+def matvec_batch(matrix: array, rows: int, cols: int, points: array, workers=None, offset=None) -> array:
+    """
+    kernels.matvec_batch (or affine_batch, given an offset) with the points split into chunks across workers.
+
+    Args:
+        matrix: array('d') of matrix entries (rows x cols, row-major)
+        rows, cols: matrix shape
+        points: array('d') of N*cols packed coordinates
+        workers: process count (None -> get_workers())
+        offset: optional `rows` numbers added to every transformed point
+
+    Returns:
+        array('d') of N*rows packed transformed coordinates
+
+    Raises:
+        ValueError: If the point block isn't a whole number of points
+    """
+    if cols == 0 or len(points) % cols:
+        raise ValueError(f"Point buffer length {len(points)} isn't a multiple of dimension {cols}")
+    n = len(points) // cols
+    workers = min(resolve_workers(workers), n)
+    if workers <= 1:
+        if offset is None:
+            return kernels.matvec_batch(matrix, rows, cols, points)
+        return kernels.affine_batch(matrix, offset, rows, cols, points)
+
+    m_shm, p_shm = _share(matrix), _share(points)
+    o_shm = _allocate(n * rows)
+    try:
+        pool = _get_pool(workers)
+        futures = [pool.submit(_transform_chunk, m_shm.name, p_shm.name, o_shm.name, rows, cols, start, end,
+                               None if offset is None else tuple(offset))
+                   for start, end in _split(n, workers)]
+        for future in futures:
+            future.result()
+        return _read(o_shm, 0, n * rows)
+    finally:
+        _release(m_shm, p_shm, o_shm)
@@ -0,0 +1,475 @@
+"""
+PCA: principal component analysis, in memory and streaming
+Goal: Find the directions of maximum variance, even for data that doesn't fit in RAM
+
+PCA is the Day 3 notebook's class, finished and moved into the library.
+Its svd_solver picks how the top components are found:
+    full       - form the d x d covariance and eigen-decompose all of it
+                 (the notebook's algorithm). O(n d^2 + d^3).
+    randomized - project the centered data onto k + oversample random
+                 directions, sharpen with a few power iterations, and take
+                 an exact SVD of that small (k + p) x d problem (Halko et al.).
+                 O(n d k).
+    lanczos    - Lanczos iteration on the covariance, applied implicitly as
+                 X^T (X v) so it is never formed; restarts with more steps
+                 until the top k Ritz pairs converge (ARPACK-style).
+    power      - block power (subspace) iteration, the simplest of the three.
+    auto       - randomized when d > 500 and k is under 80% of min(n, d),
+                 otherwise full.
+
+IncrementalPCA never holds more than one chunk of rows. Each chunk is
+folded into a running SVD: the directions kept so far (scaled by their
+singular values, plus a few spare ones), the centered chunk, and one row
+correcting for the shift of the mean are stacked and re-decomposed. The
+stack is (n_components + n_oversamples + chunk rows + 1) x d, so peak
+memory depends on the chunk size and the number of features, never on
+the number of samples.
+
+Data sources accepted by IncrementalPCA.fit / transform:
+    - ndarray or np.memmap (sliced into batch_size rows)
+    - path to a .npy file (opened with mmap_mode='r', never fully loaded)
+    - iterable/generator of (rows x d) chunks
+    - zero-argument callable returning such an iterable (re-iterable
+      source, needed by fit_transform, which reads the data twice)
+
+Example:
+    >>> ipca = IncrementalPCA(n_components=10, batch_size=5000)
+    >>> ipca.fit("features.npy")                       # memory-mapped, chunk by chunk
+    >>> for chunk in ipca.transform_chunks("features.npy"):
+    ...     write(chunk)                               # (rows x 10) per chunk
+"""
+
+from array import array
+
+import numpy as np
+
+
+def _flip_signs(components: np.ndarray) -> np.ndarray:
+    """
+    Make each component's largest-magnitude entry positive.
+
+    An eigenvector is only defined up to sign; fixing it keeps results
+    comparable between runs, solvers and chunkings.
+    """
+    signs = np.sign(components[np.arange(len(components)), np.argmax(np.abs(components), axis=1)])
+    signs[signs == 0] = 1
+    return components * signs[:, None]
+
+
+def _random(pca) -> np.random.Generator:
+    state = pca.random_state
+    return state if isinstance(state, np.random.Generator) else np.random.default_rng(state)
+
+
+def _full_solver(X_centered: np.ndarray, k: int, pca):
+    """Eigen-decompose the whole d x d covariance, keep the top k."""
+    covariance = X_centered.T @ X_centered / (len(X_centered) - 1)
+    # covariance is symmetric, so eigh (real, ascending) applies
+    eigenvalues, eigenvectors = np.linalg.eigh(covariance)
+    order = np.argsort(eigenvalues)[::-1][:k]
+    return eigenvalues[order], eigenvectors[:, order].T, 0
+
+
+def _randomized_solver(X_centered: np.ndarray, k: int, pca):
+    """
+    Randomized range finder + small exact SVD (Halko, Martinsson, Tropp).
+
+    Q spans (approximately) the top k + p column directions of X; the SVD of
+    the small matrix Q^T X gives the components. Each power iteration
+    multiplies by X X^T, which widens the gap between kept and dropped
+    singular values; re-orthonormalizing (QR) in between keeps it stable.
+    """
+    n_samples, n_features = X_centered.shape
+    rank = min(k + pca.n_oversamples, n_samples, n_features)
+    q = X_centered @ _random(pca).standard_normal((n_features, rank))
+    q, _ = np.linalg.qr(q)
+    for _ in range(pca.n_iter):
+        z, _ = np.linalg.qr(X_centered.T @ q)
+        q, _ = np.linalg.qr(X_centered @ z)
+    _, singular_values, vt = np.linalg.svd(q.T @ X_centered, full_matrices=False)
+    return singular_values[:k] ** 2 / (n_samples - 1), vt[:k], pca.n_iter
+
+
+def _lanczos_solver(X_centered: np.ndarray, k: int, pca):
+    """
+    decompositions.lanczos on C = X^T X / (n - 1), applied as two matrix-vector products.
+
+    C is never formed: lanczos only asks for C v, which is X^T (X v) scaled.
+    Restarts, breakdown handling and the max_iter cap on products are all
+    lanczos's; the vectors it works on stay array('d') buffers handled by
+    the numpy backend.
+    """
+    from .backend import get_backend
+    from .decompositions import lanczos
+    n_samples, n_features = X_centered.shape
+    scale = 1.0 / (n_samples - 1)
+    backend = get_backend("numpy")
+
+    def covariance_times(v):
+        out = array('d')
+        out.frombytes((scale * (X_centered.T @ (X_centered @ np.frombuffer(v, dtype=float)))).tobytes())
+        return out
+
+    seed = int(_random(pca).integers(2 ** 63))
+    result = lanczos(covariance_times, n_features, k, backend, tolerance=pca.tol,
+                     max_iterations=pca.max_iter, seed=seed)
+    components = np.frombuffer(result.vectors, dtype=float).reshape(n_features, k).T
+    return np.array(result.values), components, result.iterations
+
+
+def _power_solver(X_centered: np.ndarray, k: int, pca):
+    """
+    Block power iteration: V <- orth(C V) until the top k subspace stops moving.
+
+    Converges at the rate lambda_{k+1} / lambda_k, so it is slow when those
+    are close; a few spare columns help.
+    """
+    n_samples, n_features = X_centered.shape
+    scale = 1.0 / (n_samples - 1)
+    rank = min(k + min(pca.n_oversamples, 5), n_features)
+    v, _ = np.linalg.qr(_random(pca).standard_normal((n_features, rank)))
+    values = np.zeros(rank)
+    iterations = 0
+    for iterations in range(1, pca.max_iter + 1):
+        w = scale * (X_centered.T @ (X_centered @ v))
+        # Rayleigh-Ritz on the current subspace
+        small = v.T @ w
+        ritz_values, ritz_vectors = np.linalg.eigh((small + small.T) / 2)
+        order = np.argsort(ritz_values)[::-1]
+        previous, values = values, ritz_values[order]
+        v, _ = np.linalg.qr(w @ ritz_vectors[:, order])
+        if np.all(np.abs(values[:k] - previous[:k]) <= pca.tol * values[0]):
+            break
+    return values[:k], v[:, :k].T, iterations
+
+
+SOLVERS = {
+    "full": _full_solver,
+    "randomized": _randomized_solver,
+    "lanczos": _lanczos_solver,
+    "power": _power_solver,
+}
+
+
+class PCA:
+    """
+    Principal Component Analysis (PCA) for dimensionality reduction.
+
+    PCA finds the directions (principal components) in your data that
+    have the most variance. These directions are eigenvectors of the
+    covariance matrix. By projecting data onto the top few principal
+    components, we can reduce the dimensions while keeping most of
+    the information.
+
+    The Algorithm:
+    1. Center the data (subtract the mean)
+    2. Compute the covariance matrix
+    3. Find eigenvectors and eigenvalues of covariance matrix
+    4. Sort eigenvectors by eigenvalue (largest first)
+    5. Keep top k eigenvectors as principal components
+    6. Project data onto these components
+
+    Attributes:
+        n_components: Number of principal components to keep
+        components_: The principal components (eigenvectors), one per row
+        mean_: Mean of the training data
+        explained_variance_: Variance explained by each component (eigenvalues)
+        explained_variance_ratio_: Proportion of variance explained
+        svd_solver: "full", "randomized", "lanczos", "power" or "auto"
+        n_iter_: iterations the solver took (0 for full)
+
+    Example:
+        >>> X = np.random.randn(100, 50)  # 100 samples, 50 features
+        >>> pca = PCA(n_components=2)
+        >>> X_reduced = pca.fit_transform(X)  # Now (100, 2)
+        >>> print(f"Kept {pca.explained_variance_ratio_.sum():.1%} of variance")
+        >>> PCA(n_components=10, svd_solver="randomized").fit(X_wide)  # d in the thousands
+    """
+
+    def __init__(self, n_components: int = 2, svd_solver: str = "full", n_oversamples: int = 10,
+                 n_iter: int = 4, tol: float = 1e-10, max_iter: int = 500, random_state=None):
+        """
+        Initialize PCA.
+
+        Args:
+            n_components: Number of principal components to keep
+            svd_solver: "full", "randomized", "lanczos", "power" or "auto"
+            n_oversamples: extra random directions for the randomized solver
+            n_iter: power iterations for the randomized solver
+            tol: convergence tolerance (relative) for lanczos and power
+            max_iter: iteration cap for lanczos and power
+            random_state: seed (or np.random.Generator) for the iterative solvers
+
+        Raises:
+            ValueError: If svd_solver isn't known
+        """
+        if svd_solver not in SOLVERS and svd_solver != "auto":
+            raise ValueError(f"Unknown svd_solver '{svd_solver}'. Supported: {sorted(SOLVERS) + ['auto']}")
+        self.n_components = n_components
+        self.svd_solver = svd_solver
+        self.n_oversamples = n_oversamples
+        self.n_iter = n_iter
+        self.tol = tol
+        self.max_iter = max_iter
+        self.random_state = random_state
+        self.components_ = None
+        self.mean_ = None
+        self.explained_variance_ = None
+        self.explained_variance_ratio_ = None
+        self.n_iter_ = None
+
+    def fit(self, X: np.ndarray) -> 'PCA':
+        """
+        Fit PCA on data matrix X.
+
+        Finds the top n_components eigenvectors of the covariance of X with
+        the configured svd_solver; the iteration count (0 for full) is
+        stored in n_iter_.
+
+        Args:
+            X: Data matrix of shape (n_samples, n_features)
+
+        Returns:
+            self (for method chaining)
+
+        Raises:
+            ValueError: If there are fewer than 2 samples (no sample
+                covariance), or n_components is larger than the number of features
+        """
+        X = np.asarray(X, dtype=float)
+        n_samples, n_features = X.shape
+        if n_samples < 2:
+            raise ValueError(f"PCA needs at least 2 samples, got {n_samples}")
+        if not 1 <= self.n_components <= n_features:
+            raise ValueError(f"n_components must be between 1 and {n_features}, got {self.n_components}")
+
+        self.mean_ = X.mean(axis=0)
+        X_centered = X - self.mean_
+        # trace of the covariance = total variance, without forming d x d
+        total_variance = np.einsum('ij,ij->', X_centered, X_centered) / (n_samples - 1)
+
+        solver = self.svd_solver
+        if solver == "auto":
+            small = self.n_components < 0.8 * min(n_samples, n_features)
+            solver = "randomized" if n_features > 500 and small else "full"
+        variances, components, self.n_iter_ = SOLVERS[solver](X_centered, self.n_components, self)
+
+        self.components_ = _flip_signs(components)
+        self.explained_variance_ = variances
+        self.explained_variance_ratio_ = variances / total_variance
+        return self
+
+    def transform(self, X: np.ndarray) -> np.ndarray:
+        """
+        Project data onto the principal components.
+
+        Args:
+            X: (n_samples x n_features)
+
+        Returns:
+            (n_samples x n_components)
+        """
+        return (np.asarray(X, dtype=float) - self.mean_) @ self.components_.T
+
+    def fit_transform(self, X: np.ndarray) -> np.ndarray:
+        """Fit, then project the same data."""
+        return self.fit(X).transform(X)
+
+    def inverse_transform(self, X_reduced: np.ndarray) -> np.ndarray:
+        """
+        Map reduced coordinates back to the original space.
+
+        Returns:
+            (n_samples x n_features) reconstruction (exact only if no
+            variance was dropped)
+        """
+        return np.asarray(X_reduced, dtype=float) @ self.components_ + self.mean_
+
+
+def iter_chunks(source, batch_size: int):
+    """
+    Yield (rows x d) float chunks from any supported data source.
+
+    Args:
+        source: ndarray/memmap, .npy path, iterable of chunks, or a callable
+            returning an iterable of chunks
+        batch_size: rows per chunk when slicing arrays and files
+
+    Yields:
+        2D float ndarrays
+    """
+    if isinstance(source, str):
+        source = np.load(source, mmap_mode='r')
+    elif callable(source):
+        source = source()
+
+    if isinstance(source, np.ndarray):
+        if source.ndim != 2:
+            raise ValueError(f"Expected a 2D array, got shape {source.shape}")
+        for start in range(0, len(source), batch_size):
+            # slicing a memmap only reads these rows from disk
+            yield np.asarray(source[start:start + batch_size], dtype=float)
+        return
+
+    for chunk in source:
+        chunk = np.asarray(chunk, dtype=float)
+        yield chunk.reshape(1, -1) if chunk.ndim == 1 else chunk
+
+
+class IncrementalPCA(PCA):
+    """
+    PCA fitted one chunk of rows at a time, with bounded memory.
+
+    Keeping only the top n_components between chunks makes the result an
+    approximation (directions that are weak early can't come back later),
+    so n_oversamples extra directions are carried along internally. With
+    n_components + n_oversamples >= n_features the result is exact.
+
+    Attributes (in addition to PCA's):
+        batch_size: rows per chunk when slicing arrays and .npy files
+        n_oversamples: extra directions kept between chunks
+        singular_values_: singular values of the centered data seen so far
+        var_: per-feature variance of the data seen so far
+        n_samples_seen_: number of rows folded in
+
+    Example:
+        >>> ipca = IncrementalPCA(n_components=2)
+        >>> for chunk in read_chunks():
+        ...     ipca.partial_fit(chunk)
+        >>> ipca.transform(X_new)
+    """
+
+    def __init__(self, n_components: int = 2, batch_size: int = 1000, n_oversamples: int = 10):
+        """
+        Initialize incremental PCA.
+
+        Args:
+            n_components: Number of principal components to keep
+            batch_size: rows per chunk when slicing arrays and .npy files
+            n_oversamples: extra directions kept between chunks for accuracy
+        """
+        super().__init__(n_components)
+        self.batch_size = batch_size
+        self.n_oversamples = n_oversamples
+        self.singular_values_ = None
+        self.var_ = None
+        self.n_samples_seen_ = 0
+        self._sum_squares = None
+        self._basis = None   # (rank x d) singular values * directions carried between chunks
+
+    def partial_fit(self, X: np.ndarray) -> 'IncrementalPCA':
+        """
+        Fold one chunk of rows into the running decomposition.
+
+        Args:
+            X: (rows x n_features) chunk; the first chunk needs at least
+                2 and at least n_components rows
+
+        Returns:
+            self
+
+        Raises:
+            ValueError: If the feature count changes between chunks, or the
+                first chunk is too small
+        """
+        X = np.asarray(X, dtype=float)
+        if X.ndim == 1:
+            X = X.reshape(1, -1)
+        n_batch, n_features = X.shape
+        if n_batch == 0:
+            return self
+        n_seen = self.n_samples_seen_
+        if n_seen == 0:
+            if not 1 <= self.n_components <= n_features:
+                raise ValueError(f"n_components must be between 1 and {n_features}, got {self.n_components}")
+            if n_batch < max(2, self.n_components):
+                raise ValueError(f"The first chunk needs at least max(2, n_components={self.n_components}) rows, "
+                                 f"got {n_batch}")
+            self.mean_ = np.zeros(n_features)
+            self._sum_squares = np.zeros(n_features)
+        elif n_features != len(self.mean_):
+            raise ValueError(f"Chunk has {n_features} features, expected {len(self.mean_)}")
+
+        n_total = n_seen + n_batch
+        batch_mean = X.mean(axis=0)
+        X_centered = X - batch_mean
+        mean_shift = self.mean_ - batch_mean
+
+        # Stack what we know about the old data (its components scaled by their
+        # singular values), the new centered rows, and one row that accounts
+        # for the two parts having different means; its SVD is the SVD of
+        # everything seen so far.
+        if n_seen:
+            correction = np.sqrt(n_seen * n_batch / n_total) * mean_shift
+            stacked = np.vstack([self._basis, X_centered, correction])
+        else:
+            stacked = X_centered
+        _, singular_values, vt = np.linalg.svd(stacked, full_matrices=False)
+
+        # running per-feature sum of squared deviations (Chan et al. update)
+        self._sum_squares += (X_centered ** 2).sum(axis=0) + (n_seen * n_batch / n_total) * mean_shift ** 2
+        self.mean_ = self.mean_ + (n_batch / n_total) * (batch_mean - self.mean_)
+        self.n_samples_seen_ = n_total
+
+        rank = self.n_components + self.n_oversamples
+        self._basis = singular_values[:rank, None] * vt[:rank]
+        k = self.n_components
+        self.components_ = _flip_signs(vt[:k])
+        self.singular_values_ = singular_values[:k]
+        self.var_ = self._sum_squares / (n_total - 1)
+        self.explained_variance_ = singular_values[:k] ** 2 / (n_total - 1)
+        self.explained_variance_ratio_ = singular_values[:k] ** 2 / self._sum_squares.sum()
+        return self
+
+    def fit(self, source) -> 'IncrementalPCA':
+        """
+        Fit from scratch, streaming the source chunk by chunk.
+
+        Args:
+            source: ndarray/memmap, .npy path, iterable of chunks, or a
+                callable returning one (see iter_chunks)
+
+        Returns:
+            self
+        """
+        self.n_samples_seen_ = 0
+        for chunk in iter_chunks(source, self.batch_size):
+            self.partial_fit(chunk)
+        return self
+
+    def transform_chunks(self, source):
+        """
+        Project a source chunk by chunk.
+
+        Yields:
+            (rows x n_components) ndarray per input chunk
+        """
+        for chunk in iter_chunks(source, self.batch_size):
+            yield (chunk - self.mean_) @ self.components_.T
+
+    def transform(self, source) -> np.ndarray:
+        """
+        Project a whole source onto the components.
+
+        Only the (n_samples x n_components) result is held in memory; the
+        input is read one chunk at a time.
+
+        Returns:
+            (n_samples x n_components)
+        """
+        chunks = list(self.transform_chunks(source))
+        if not chunks:
+            return np.empty((0, self.n_components))
+        return np.vstack(chunks)
+
+    def fit_transform(self, source) -> np.ndarray:
+        """
+        Fit, then project the same data (two passes over the source).
+
+        Raises:
+            ValueError: If the source is a one-shot iterator (pass an array,
+                a .npy path or a callable that re-creates the iterator)
+        """
+        if not isinstance(source, (str, np.ndarray)) and not callable(source) and iter(source) is source:
+            raise ValueError("fit_transform reads the data twice; pass a re-iterable source")
+        return self.fit(source).transform(source)
@@ -0,0 +1,193 @@
+"""
+TransformPipeline: a chain of rotation/scaling/shear steps folded into one matrix
+Goal: Apply a 10-step transform for the price of one matrix
+
+Composing transformations is just matrix multiplication, so a chain of
+steps S1, S2, ..., Sn (S1 applied first) is the single matrix
+Sn @ ... @ S2 @ S1. The pipeline keeps the running products
+
+    P1 = S1,  P2 = S2 @ P1,  ...,  Pn = Sn @ P(n-1)
+
+and hands out Pn. When one step's parameters change, only the products
+from that step onward are recomputed; everything before it is reused.
+
+Example:
+    >>> pipe = TransformPipeline(3).rotate(30, "z").scale(1, 2, 1).shear(xy=0.5)
+    >>> pipe.transform_points(points)    # one matrix, however many steps
+    >>> pipe.update(0, 60, "z")          # re-folds steps 0..2 only
+"""
+
+from .matrix import Matrix
+from .matrix2D import Matrix2D
+from .matrix3D import Matrix3D
+
+# Step name -> matrix builder, per dimension
+_BUILDERS = {
+    2: {"rotation": Matrix2D.rotation, "scaling": Matrix2D.scaling, "shear": Matrix2D.shear},
+    3: {"rotation": Matrix3D.rotation, "scaling": Matrix3D.scaling, "shear": Matrix3D.shear},
+}
+
+
+class Stage:
+    """
+    One step of a pipeline: a named builder plus its arguments.
+
+    Attributes:
+        kind: "rotation", "scaling" or "shear"
+        args: positional arguments for the builder
+        kwargs: keyword arguments for the builder
+        matrix: the step's (frozen) matrix
+    """
+    __slots__ = ('kind', 'args', 'kwargs', 'matrix')
+
+    def __init__(self, kind: str, builder, args: tuple, kwargs: dict):
+        self.kind = kind
+        self.args = args
+        self.kwargs = kwargs
+        self.matrix = builder(*args, **kwargs).freeze()
+
+    def __repr__(self) -> str:
+        params = [repr(a) for a in self.args] + [f"{k}={v!r}" for k, v in self.kwargs.items()]
+        return f"{self.kind}({', '.join(params)})"
+
+
+class TransformPipeline:
+    """
+    Ordered chain of rotation/scaling/shear steps with a cached composite matrix.
+
+    Steps are applied to points in the order they are added. The composite
+    is rebuilt lazily, and only from the first changed step onward.
+
+    Attributes:
+        dim: 2 or 3
+        stages: the steps, first applied first
+        matrix: the fused composite (FrozenMatrix2D/FrozenMatrix3D)
+
+    Example:
+        >>> pipe = TransformPipeline(2).rotate(90).scale(2, 1)
+        >>> pipe.matrix           # scaling @ rotation
+        >>> pipe.update(1, 3, 1)  # new scale factors; the rotation is reused
+    """
+
+    def __init__(self, dim: int = 3):
+        """
+        Start an empty pipeline (its matrix is the identity).
+
+        Args:
+            dim: 2 for Matrix2D steps, 3 for Matrix3D steps
+
+        Raises:
+            ValueError: If dim isn't 2 or 3
+        """
+        if dim not in _BUILDERS:
+            raise ValueError(f"Pipelines support 2D or 3D, got {dim}")
+        self.dim = dim
+        self.stages = []
+        self._products = []   # _products[i] = stages[i].matrix @ ... @ stages[0].matrix
+        self._valid = 0       # _products[:_valid] are up to date
+
+    def __len__(self) -> int:
+        return len(self.stages)
+
+    def __getitem__(self, index: int) -> Stage:
+        return self.stages[index]
+
+    def __repr__(self) -> str:
+        return f"TransformPipeline({self.dim}, {self.stages})"
+
+    def _stage(self, kind: str, args: tuple, kwargs: dict) -> Stage:
+        return Stage(kind, _BUILDERS[self.dim][kind], args, kwargs)
+
+    def _invalidate(self, index: int) -> None:
+        """Mark every product from stage `index` onward as stale."""
+        self._valid = min(self._valid, index)
+        del self._products[self._valid:]
+
+    def add(self, kind: str, *args, **kwargs) -> 'TransformPipeline':
+        """
+        Append a step.
+
+        Args:
+            kind: "rotation", "scaling" or "shear"
+            *args, **kwargs: arguments for Matrix2D/Matrix3D.<kind>
+
+        Returns:
+            self, so calls can be chained
+
+        Raises:
+            ValueError: If kind isn't a known step
+        """
+        if kind not in _BUILDERS[self.dim]:
+            raise ValueError(f"Unknown step '{kind}'. Supported: {sorted(_BUILDERS[self.dim])}")
+        self.stages.append(self._stage(kind, args, kwargs))
+        return self
+
+    def rotate(self, *args, **kwargs) -> 'TransformPipeline':
+        """Append a rotation (same arguments as Matrix2D/Matrix3D.rotation)."""
+        return self.add("rotation", *args, **kwargs)
+
+    def scale(self, *args, **kwargs) -> 'TransformPipeline':
+        """Append a scaling (same arguments as Matrix2D/Matrix3D.scaling)."""
+        return self.add("scaling", *args, **kwargs)
+
+    def shear(self, *args, **kwargs) -> 'TransformPipeline':
+        """Append a shear (same arguments as Matrix2D/Matrix3D.shear)."""
+        return self.add("shear", *args, **kwargs)
+
+    def update(self, index: int, *args, **kwargs) -> 'TransformPipeline':
+        """
+        Replace the parameters of one step, keeping its kind.
+
+        Only the products from this step onward are recomputed the next
+        time the matrix is needed.
+
+        Args:
+            index: which step (0 = first applied)
+            *args, **kwargs: new arguments for that step's builder
+
+        Returns:
+            self
+        """
+        index = range(len(self.stages))[index]
+        self.stages[index] = self._stage(self.stages[index].kind, args, kwargs)
+        self._invalidate(index)
+        return self
+
+    def remove(self, index: int) -> 'TransformPipeline':
+        """Drop one step (the products before it are kept)."""
+        index = range(len(self.stages))[index]
+        del self.stages[index]
+        self._invalidate(index)
+        return self
+
+    @property
+    def matrix(self) -> Matrix:
+        """
+        The fused composite matrix (cached).
+
+        Returns:
+            FrozenMatrix2D/FrozenMatrix3D equal to stages[-1] @ ... @ stages[0];
+            the identity for an empty pipeline
+        """
+        if not self.stages:
+            identity = Matrix2D([[1, 0], [0, 1]]) if self.dim == 2 else Matrix3D.identity()
+            return identity.freeze()
+        for i in range(self._valid, len(self.stages)):
+            step = self.stages[i].matrix
+            self._products.append(step if i == 0 else step.multiply_matrix(self._products[i - 1]))
+        self._valid = len(self.stages)
+        return self._products[-1]
+
+    def transform_points(self, points, workers=None):
+        """
+        Apply the whole chain to a block of points with one matrix.
+
+        Args:
+            points: same layouts as Matrix.transform_points
+
+        Returns:
+            Transformed points in the same layout as the input
+        """
+        return self.matrix.transform_points(points, workers)
+
+    apply_batch = transform_points
@@ -0,0 +1,271 @@
+"""
+SparseMatrix: compressed sparse row (CSR) matrices that interoperate with Matrix and Vector
+Goal: Store and multiply mostly-zero transforms in time and memory proportional to their nonzeros
+
+A dense n x n Matrix keeps n^2 doubles no matter how many are zero. A
+scaling over hundreds of dimensions, or a graph's adjacency matrix, is
+almost all zeros. CSR keeps only the nonzeros, row by row, in three flat
+arrays:
+
+    values  - the nonzero entries, row 0's first, then row 1's, ...
+    indices - the column of each entry
+    indptr  - rows + 1 offsets: row i is values[indptr[i]:indptr[i + 1]]
+
+so a matrix-vector product touches each nonzero once (O(nnz)) and memory
+is O(nnz + rows). COO (three parallel lists of row, column, value) is the
+easy way to build one; from_coo sorts and packs it into CSR.
+
+Example:
+    >>> S = SparseMatrix.diagonal([2.0] * 500)              # 500 stored values, not 250,000
+    >>> S.multiply_vector(v)                                # O(nnz)
+    >>> A = SparseMatrix.from_coo([0, 1, 2], [1, 2, 0], [1, 1, 1], (3, 3))   # graph edges
+    >>> A.multiply_matrix(Matrix3D.identity()).data          # dense result
+    >>> A.to_matrix(), Matrix(rows).to_sparse()             # convert either way
+"""
+
+from array import array
+
+from .backend import get_backend
+from .matrix import Matrix
+from .storage import Storage
+from .vector import Vector
+
+
+class SparseMatrix:
+    """
+    Sparse matrix in CSR form.
+
+    Attributes:
+        values: array('d') of stored entries, row-major order
+        indices: array('q') column index of each stored entry
+        indptr: array('q') of rows + 1 offsets into values/indices
+        shape: (rows, cols)
+
+    Example:
+        >>> S = SparseMatrix.from_coo([0, 2], [0, 1], [5.0, -1.0], (3, 2))
+        >>> S.nnz                               # 2
+        >>> S.multiply_vector(Vector([1, 1]))   # Vector([5.0, 0.0, -1.0])
+    """
+    __slots__ = ('values', 'indices', 'indptr', 'shape')
+
+    def __init__(self, values, indices, indptr, shape):
+        """
+        Wrap existing CSR arrays.
+
+        Args:
+            values: nonzero entries, row by row
+            indices: column of each entry (sorted within a row)
+            indptr: rows + 1 offsets, indptr[0] == 0, indptr[-1] == len(values)
+            shape: (rows, cols)
+
+        Raises:
+            ValueError: If the arrays don't describe a rows x cols matrix
+        """
+        rows, cols = shape
+        self.values = values if isinstance(values, array) and values.typecode == 'd' else array('d', values)
+        self.indices = indices if isinstance(indices, array) and indices.typecode == 'q' else array('q', indices)
+        self.indptr = indptr if isinstance(indptr, array) and indptr.typecode == 'q' else array('q', indptr)
+        self.shape = (rows, cols)
+        if len(self.indptr) != rows + 1 or self.indptr[0] != 0 or self.indptr[-1] != len(self.values):
+            raise ValueError(f"indptr must have {rows + 1} offsets from 0 to {len(self.values)}")
+        if len(self.indices) != len(self.values):
+            raise ValueError("indices and values must be the same length")
+        if self.indices and not 0 <= min(self.indices) <= max(self.indices) < cols:
+            raise ValueError(f"Column index out of range for {cols} columns")
+
+    @classmethod
+    def from_coo(cls, row_indices, col_indices, values, shape, sum_duplicates: bool = True) -> 'SparseMatrix':
+        """
+        Build from coordinate (COO) triplets: entry (row_indices[t], col_indices[t]) = values[t].
+
+        Args:
+            row_indices: row of each entry
+            col_indices: column of each entry
+            values: the entries
+            shape: (rows, cols)
+            sum_duplicates: add up repeated coordinates (otherwise the last wins)
+
+        Returns:
+            SparseMatrix (explicit zeros are dropped)
+
+        Raises:
+            ValueError: If the lists differ in length or an index is out of range
+        """
+        rows, cols = shape
+        if not len(row_indices) == len(col_indices) == len(values):
+            raise ValueError("COO row, column and value lists must be the same length")
+        entries = {}
+        for i, j, value in zip(row_indices, col_indices, values):
+            if not (0 <= i < rows and 0 <= j < cols):
+                raise ValueError(f"Entry ({i}, {j}) is outside a {rows}x{cols} matrix")
+            entries[i, j] = entries.get((i, j), 0.0) + value if sum_duplicates else value
+        out_values, out_indices = array('d'), array('q')
+        indptr = array('q', bytes(8 * (rows + 1)))
+        for (i, j) in sorted(entries):
+            value = entries[i, j]
+            if value:
+                out_values.append(value)
+                out_indices.append(j)
+                indptr[i + 1] += 1
+        for i in range(rows):
+            indptr[i + 1] += indptr[i]
+        return cls(out_values, out_indices, indptr, (rows, cols))
+
+    @classmethod
+    def from_matrix(cls, matrix: Matrix, tolerance: float = 0.0) -> 'SparseMatrix':
+        """
+        Keep the entries of a dense Matrix whose magnitude is above tolerance.
+
+        Args:
+            matrix: Matrix (or Matrix2D/Matrix3D)
+            tolerance: entries with |x| <= tolerance are dropped
+
+        Returns:
+            SparseMatrix with the same shape
+        """
+        rows, cols = matrix._storage.shape
+        buffer = matrix._storage.buffer
+        values, indices = array('d'), array('q')
+        indptr = array('q', [0])
+        for i in range(rows):
+            for j, value in enumerate(buffer[i * cols:(i + 1) * cols]):
+                if abs(value) > tolerance:
+                    values.append(value)
+                    indices.append(j)
+            indptr.append(len(values))
+        return cls(values, indices, indptr, (rows, cols))
+
+    @classmethod
+    def diagonal(cls, diagonal) -> 'SparseMatrix':
+        """
+        Square diagonal matrix, e.g. a scaling over many dimensions.
+
+        Example:
+            >>> SparseMatrix.diagonal([2, 3, 4])   # sparse Matrix3D.scaling(2, 3, 4)
+        """
+        diagonal = list(diagonal)
+        n = len(diagonal)
+        return cls.from_coo(range(n), range(n), diagonal, (n, n))
+
+    @classmethod
+    def identity(cls, n: int) -> 'SparseMatrix':
+        """n x n identity (n stored ones)."""
+        return cls(array('d', [1.0] * n), array('q', range(n)), array('q', range(n + 1)), (n, n))
+
+    @property
+    def rows(self) -> int:
+        return self.shape[0]
+
+    @property
+    def cols(self) -> int:
+        return self.shape[1]
+
+    @property
+    def nnz(self) -> int:
+        """Number of stored (nonzero) entries."""
+        return len(self.values)
+
+    @property
+    def density(self) -> float:
+        """Fraction of entries that are stored."""
+        rows, cols = self.shape
+        return self.nnz / (rows * cols) if rows * cols else 0.0
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes used by the three CSR arrays."""
+        return sum(len(a) * a.itemsize for a in (self.values, self.indices, self.indptr))
+
+    def __repr__(self) -> str:
+        return f"SparseMatrix(shape={self.shape}, nnz={self.nnz})"
+
+    def get(self, i: int, j: int) -> float:
+        """Entry (i, j), 0.0 if it isn't stored."""
+        start, end = self.indptr[i], self.indptr[i + 1]
+        for column, value in zip(self.indices[start:end], self.values[start:end]):
+            if column == j:
+                return value
+        return 0.0
+
+    def to_coo(self) -> tuple:
+        """
+        Coordinate form.
+
+        Returns:
+            (row_indices, col_indices, values) as arrays, in row-major order
+        """
+        row_indices = array('q')
+        for i in range(self.rows):
+            row_indices.extend([i] * (self.indptr[i + 1] - self.indptr[i]))
+        return row_indices, array('q', self.indices), array('d', self.values)
+
+    def to_matrix(self) -> Matrix:
+        """Dense Matrix with the same entries."""
+        rows, cols = self.shape
+        dense = array('d', bytes(8 * rows * cols))
+        for i in range(rows):
+            for t in range(self.indptr[i], self.indptr[i + 1]):
+                dense[i * cols + self.indices[t]] = self.values[t]
+        return Matrix._wrap(Storage(dense, (rows, cols)))
+
+    def transpose(self) -> 'SparseMatrix':
+        """
+        Transposed matrix, still CSR (i.e. this matrix in CSC form), in O(nnz + cols).
+
+        A counting sort: count the entries in each column to get the new
+        row offsets, then drop every entry into its slot, row by row, so
+        columns stay sorted within each new row.
+        """
+        rows, cols = self.shape
+        indptr = array('q', bytes(8 * (cols + 1)))
+        for j in self.indices:
+            indptr[j + 1] += 1
+        for j in range(cols):
+            indptr[j + 1] += indptr[j]
+        slot = array('q', indptr[:-1])
+        values = array('d', bytes(8 * self.nnz))
+        indices = array('q', bytes(8 * self.nnz))
+        for i in range(rows):
+            for t in range(self.indptr[i], self.indptr[i + 1]):
+                j = self.indices[t]
+                values[slot[j]] = self.values[t]
+                indices[slot[j]] = i
+                slot[j] += 1
+        return SparseMatrix(values, indices, indptr, (cols, rows))
+
+    def multiply_vector(self, vector: Vector) -> Vector:
+        """
+        Apply this transformation to a vector in O(nnz).
+
+        Args:
+            vector: Vector with `cols` components
+
+        Returns:
+            Vector with `rows` components
+
+        Raises:
+            ValueError: If matrix columns don't match vector dimension
+        """
+        if self.cols != len(vector.components):
+            raise ValueError(f"Matrix columns ({self.cols}) must match vector dimension ({len(vector.components)})")
+        result = get_backend().csr_matvec(self.values, self.indices, self.indptr, self.rows, vector.components)
+        return Vector._wrap(result)
+
+    def multiply_matrix(self, other: Matrix) -> Matrix:
+        """
+        Compose with a dense transformation: self @ other, in O(nnz * other.cols).
+
+        Args:
+            other: Matrix (or Matrix2D/Matrix3D) with `cols` rows
+
+        Returns:
+            Dense rows x other.cols Matrix
+
+        Raises:
+            ValueError: If inner dimensions don't match
+        """
+        if self.cols != other.rows:
+            raise ValueError("Inner dimensions don't match")
+        product = get_backend().csr_matmul(self.values, self.indices, self.indptr, self.rows,
+                                           other._storage.buffer, other.cols)
+        return Matrix._wrap(Storage(product, (self.rows, other.cols)))
@@ -0,0 +1,195 @@
+"""
+Storage: contiguous memory for Vector and Matrix
+Goal: Keep numbers in one flat block of doubles instead of lists of boxed floats
+"""
+
+from array import array
+
+
+class Storage:
+    """
+    Flat, row-major block of doubles with shape and stride metadata.
+
+    A Python list of floats is really a list of pointers to separate float
+    objects scattered around the heap. Storage keeps the raw 8-byte doubles
+    side by side in a single array('d'), the same layout C, NumPy and BLAS
+    use. Anything that speaks the buffer protocol (memoryview, NumPy) can
+    read it without copying.
+
+    Attributes:
+        buffer: array('d') holding every element in row-major order
+        shape: tuple of dimension sizes, (n,) for a vector, (rows, cols) for a matrix
+        strides: tuple of element steps per dimension, (cols, 1) for a matrix
+
+    Example:
+        >>> s = Storage.from_rows([[1, 2, 3], [4, 5, 6]])
+        >>> s.shape    # (2, 3)
+        >>> s.strides  # (3, 1)
+        >>> s.get(1, 2)  # 6.0
+    """
+    __slots__ = ('buffer', 'shape')
+
+    def __init__(self, values, shape=None):
+        """
+        Wrap (or copy into) a flat block of doubles.
+
+        An existing array('d') is adopted without copying, so callers that
+        build a fresh result buffer pay for exactly one allocation.
+
+        Args:
+            values: array('d') to adopt, or any iterable of numbers to copy
+            shape: dimension sizes; defaults to (len(values),)
+
+        Raises:
+            ValueError: If shape doesn't match the number of values
+        """
+        if not (type(values) is array and values.typecode == 'd'):
+            values = array('d', values)
+        if shape is None:
+            shape = (len(values),)
+        size = 1
+        for dim in shape:
+            size *= dim
+        if size != len(values):
+            raise ValueError(f"Shape {tuple(shape)} doesn't match {len(values)} values")
+        self.buffer = values
+        self.shape = tuple(shape)
+
+    @classmethod
+    def from_rows(cls, rows) -> 'Storage':
+        """
+        Pack a 2D list (list of rows) into one contiguous block.
+
+        Args:
+            rows: 2D list where each inner list is a row
+
+        Returns:
+            Storage with shape (len(rows), len(rows[0]))
+
+        Raises:
+            ValueError: If the rows are not all the same length
+        """
+        n_rows = len(rows)
+        n_cols = len(rows[0]) if n_rows else 0
+        buffer = array('d')
+        for row in rows:
+            if len(row) != n_cols:
+                raise ValueError("Jagged Array! All rows must be the same length.")
+            buffer.extend(row)
+        return cls(buffer, (n_rows, n_cols))
+
+    @classmethod
+    def zeros(cls, shape) -> 'Storage':
+        """
+        Allocate a zero-filled block of the given shape.
+
+        Args:
+            shape: dimension sizes
+
+        Returns:
+            Storage of zeros
+        """
+        size = 1
+        for dim in shape:
+            size *= dim
+        return cls(array('d', bytes(8 * size)), shape)
+
+    @property
+    def strides(self) -> tuple:
+        """Element steps per dimension for a row-major layout."""
+        strides = []
+        step = 1
+        for dim in reversed(self.shape):
+            strides.append(step)
+            step *= dim
+        return tuple(reversed(strides))
+
+    @property
+    def ndim(self) -> int:
+        """Number of dimensions."""
+        return len(self.shape)
+
+    @property
+    def size(self) -> int:
+        """Total number of elements."""
+        return len(self.buffer)
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes used by the element data."""
+        return len(self.buffer) * self.buffer.itemsize
+
+    def __len__(self) -> int:
+        return self.shape[0] if self.shape else 0
+
+    def __repr__(self) -> str:
+        return f"Storage(shape={self.shape}, {self.buffer.tolist()})"
+
+    def offset(self, *index) -> int:
+        """
+        Convert an n-dimensional index to a position in the flat buffer.
+
+        Formula:
+            offset = sum(index[k] * strides[k])
+        """
+        return sum(i * s for i, s in zip(index, self.strides))
+
+    def get(self, *index) -> float:
+        """Read one element by its n-dimensional index."""
+        return self.buffer[self.offset(*index)]
+
+    def set(self, value, *index) -> None:
+        """Write one element by its n-dimensional index."""
+        self.buffer[self.offset(*index)] = value
+
+    def row(self, i: int) -> memoryview:
+        """
+        Zero-copy view of row i of a 2D block.
+
+        The view supports indexing, len(), iteration and unpacking like a
+        list, but reads straight out of the shared buffer.
+        """
+        cols = self.shape[1]
+        return memoryview(self.buffer)[i * cols:(i + 1) * cols]
+
+    def rows(self) -> list:
+        """Zero-copy views of every row of a 2D block."""
+        n_rows, cols = self.shape
+        view = memoryview(self.buffer)
+        return [view[i * cols:(i + 1) * cols] for i in range(n_rows)]
+
+    def column(self, j: int) -> array:
+        """
+        Copy column j of a 2D block into a new array('d').
+
+        Columns are strided (one element every `cols` slots), so this is a
+        single extended-slice copy rather than a Python loop.
+        """
+        return self.buffer[j::self.shape[1]]
+
+    def tolist(self) -> list:
+        """Nested Python lists with the same shape (for printing/debugging)."""
+        if self.ndim == 1:
+            return self.buffer.tolist()
+        return [list(row) for row in self.rows()]
+
+    def copy(self) -> 'Storage':
+        """Deep copy of the block."""
+        return Storage(array('d', self.buffer), self.shape)
+
+    def reshape(self, shape) -> 'Storage':
+        """Same buffer viewed with a new shape (no copy)."""
+        return Storage(self.buffer, shape)
+
+    def transpose(self) -> 'Storage':
+        """
+        Transposed copy of a 2D block, still contiguous and row-major.
+
+        Each row of the result is a column of the original, taken with one
+        strided slice.
+        """
+        n_rows, n_cols = self.shape
+        buffer = array('d')
+        for j in range(n_cols):
+            buffer.extend(self.buffer[j::n_cols])
+        return Storage(buffer, (n_cols, n_rows))
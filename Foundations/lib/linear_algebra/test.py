@@ -1,10 +1,12 @@
-from matrix import Matrix
+from .matrix import Matrix
 
-m1 = Matrix([[1,2], [3,4]])
 
-print(m1)
+if __name__ == "__main__":
+    m1 = Matrix([[1,2], [3,4]])
 
-try:
-    m2 = Matrix([[1,2], [3,4,5]])
-except ValueError as e:
-    print(f"Caught error: {e}")
+    print(m1)
+
+    try:
+        m2 = Matrix([[1,2], [3,4,5]])
+    except ValueError as e:
+        print(f"Caught error: {e}")
@@ -1,48 +1,90 @@
 import math
+from array import array
+from .storage import Storage
+from .backend import get_backend
+
+# Set by lazy.lazy_mode(): while active, +, - and * record an expression
+# graph (see lazy.py) instead of computing.
+_lazy_builder = None
 
 
 class Vector:
+    # A vector is a 1D block, so it holds its array('d') directly rather than
+    # paying for a Storage object and shape tuple per instance.
+    __slots__ = ('_components',)
+
     def __init__(self, components):
-        self.components = components
+        self._components = array('d', components)
+
+    @classmethod
+    def _wrap(cls, buffer):
+        """Build a vector around an existing array('d') without copying or validating"""
+        vector = cls.__new__(cls)
+        vector._components = buffer
+        return vector
+
+    @property
+    def components(self):
+        """Components as a contiguous array('d') (indexable like a list)"""
+        return self._components
+
+    @components.setter
+    def components(self, components):
+        self._components = array('d', components)
+
+    @property
+    def _storage(self):
+        """The components viewed as 1D Storage (shares the same buffer)"""
+        return Storage(self._components)
 
     def __repr__(self):
-        return f"Vector({self.components})"
+        return f"Vector({self.components.tolist()})"
 
     def __add__(self, other):
         """Add two vectors component-wise"""
+        if _lazy_builder is not None:
+            return _lazy_builder("add", self, other)
         if len(self.components) != len(other.components):
             raise ValueError("Vectors must be the same dimension")
-        result = [a + b for a, b in zip(self.components, other.components)]
-        return Vector(result)
-    
+        return Vector._wrap(get_backend().add(self.components, other.components))
+
     def __sub__(self, other):
         """
         Subtract two vectors component-wise
         """
+        if _lazy_builder is not None:
+            return _lazy_builder("sub", self, other)
         if len(self.components) != len(other.components):
             raise ValueError("Vectors are of different dimension!")
-        result = [a-b for a,b in zip(self.components, other.components)]
-        return Vector(result)
+        return Vector._wrap(get_backend().sub(self.components, other.components))
 
     def __mul__(self, scalar):
         """Multiply vector by a scalar"""
-        result = [scalar * component for component in self.components]
-        return Vector(result)
+        if _lazy_builder is not None:
+            return _lazy_builder("scale", self, scalar)
+        return Vector._wrap(get_backend().scale(self.components, scalar))
 
     def magnitude(self):
         """Calculate the magnitude (length) of the vector"""
-        sum_of_squares = sum(c**2 for c in self.components)
-        return sum_of_squares ** 0.5
+        return get_backend().norm(self.components)
 
     def dot(self, other):
         """Compute dot product with another vector"""
         if len(self.components) != len(other.components):
             raise ValueError("Vectors must be the same dimension")
-        return sum(a * b for a, b in zip(self.components, other.components))
+        return get_backend().dot(self.components, other.components)
 
     def normalize(self):
-        """Return a unit vector (magnitude = 1) in the same direction"""
-        return [component / self.magnitude() for component in self.components]
+        """
+        Return a unit vector (magnitude = 1) in the same direction, as the same class
+
+        The magnitude is computed once and the components scaled in one
+        backend call (it used to be recomputed for every component).
+        """
+        magnitude = self.magnitude()
+        if magnitude == 0:
+            raise ValueError("Cannot normalize the zero vector")
+        return type(self)._wrap(get_backend().scale(self.components, 1.0 / magnitude))
 
     def angle_between(self, other):
         """Calculate the angle between two vectors, return in degrees"""
@@ -54,8 +96,7 @@ class Vector:
     def projection(self, other):
         """Project self onto other"""
         # Get unit vector
-        other_norm = other.normalize()
-        unit = Vector(other_norm)
+        unit = other.normalize()
         # Get scalar by computing dot product of v1 (self) by normalized v2 (unit vector)
         scalar = self.dot(unit)
         proj_v = unit * scalar
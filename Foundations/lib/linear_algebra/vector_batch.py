@@ -0,0 +1,232 @@
+"""
+VectorBatch: many same-length vectors in one contiguous N x d block
+Goal: Run dot/norm/normalize/angle/projection over millions of vectors without a Python object per vector
+
+A list of a million Vectors is a million Python objects, and every
+similarity computation loops over them one at a time. A VectorBatch keeps
+all N vectors back to back in one row-major array('d') (the same layout as
+a Matrix, see Storage), and each operation is one call into the active
+backend that sweeps the whole block: pure-Python kernels, or NumPy.
+
+Operations against `other` pair row i with row i of another batch of the
+same size, or, when other is a single Vector, compare every row with it.
+
+Example:
+    >>> batch = VectorBatch.from_vectors(embeddings)      # N x 768
+    >>> batch.norms()                                      # N lengths
+    >>> batch.normalize().dot(query.normalize())           # N cosine similarities
+    >>> batch.pairwise_dots(other)                         # N x M Matrix
+    >>> VectorBatch.from_vectors(normals).cross(up)        # N cross products (d = 3)
+"""
+
+from array import array
+
+from .backend import get_backend
+from .matrix import Matrix
+from .storage import Storage
+from .vector import Vector
+from .Vector3D import Vector3D
+
+
+class VectorBatch:
+    """
+    N vectors of dimension d, stored as one flat row-major block.
+
+    Attributes:
+        buffer: array('d') of N*d components, vector i at [i*d:(i+1)*d]
+        count: N, number of vectors
+        dim: d, components per vector
+
+    Example:
+        >>> batch = VectorBatch([[3, 4], [1, 0]])
+        >>> batch.norms()           # array('d', [5.0, 1.0])
+        >>> batch.normalize()[0]    # Vector([0.6, 0.8])
+    """
+    __slots__ = ('_storage',)
+
+    def __init__(self, vectors):
+        """
+        Pack vectors into one block.
+
+        Args:
+            vectors: list of Vectors or of equal-length number sequences
+
+        Raises:
+            ValueError: If the vectors aren't all the same length
+        """
+        self._storage = Storage.from_rows([getattr(v, 'components', v) for v in vectors])
+
+    @classmethod
+    def _wrap(cls, buffer: array, dim: int) -> 'VectorBatch':
+        """Build a batch around an existing array('d') without copying or validating."""
+        batch = cls.__new__(cls)
+        batch._storage = Storage(buffer, (len(buffer) // dim if dim else 0, dim))
+        return batch
+
+    @classmethod
+    def from_vectors(cls, vectors) -> 'VectorBatch':
+        """Same as VectorBatch(vectors)."""
+        return cls(vectors)
+
+    @classmethod
+    def from_buffer(cls, values, dim: int) -> 'VectorBatch':
+        """
+        Adopt a flat buffer of N*dim numbers (array('d') is used without copying).
+
+        Args:
+            values: array('d'), or anything array('d') can be built from
+                (an ndarray of any dtype or layout is converted to a
+                contiguous float copy and taken via its buffer)
+            dim: components per vector
+
+        Raises:
+            ValueError: If the length isn't a multiple of dim
+        """
+        if not (isinstance(values, array) and values.typecode == 'd'):
+            if hasattr(values, '__array_interface__'):
+                import numpy as np
+                buffer = array('d')
+                buffer.frombytes(memoryview(np.ascontiguousarray(values, dtype=float)).cast('B'))
+                values = buffer
+            else:
+                values = array('d', values)
+        if dim <= 0 or len(values) % dim:
+            raise ValueError(f"Buffer length {len(values)} isn't a multiple of dimension {dim}")
+        return cls._wrap(values, dim)
+
+    @classmethod
+    def from_numpy(cls, points) -> 'VectorBatch':
+        """Copy an (N x d) ndarray into a batch."""
+        import numpy as np
+        points = np.ascontiguousarray(points, dtype=float)
+        if points.ndim != 2:
+            raise ValueError(f"Expected an N x d array, got shape {points.shape}")
+        return cls.from_buffer(points.reshape(-1), points.shape[1])
+
+    @property
+    def buffer(self) -> array:
+        return self._storage.buffer
+
+    @property
+    def count(self) -> int:
+        return self._storage.shape[0]
+
+    @property
+    def dim(self) -> int:
+        return self._storage.shape[1]
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __repr__(self) -> str:
+        return f"VectorBatch(count={self.count}, dim={self.dim})"
+
+    def _vector_type(self) -> type:
+        return Vector3D if self.dim == 3 else Vector
+
+    def __getitem__(self, i: int) -> Vector:
+        """Vector i (a copy of its d components)."""
+        i = range(self.count)[i]
+        d = self.dim
+        return self._vector_type()._wrap(self.buffer[i * d:(i + 1) * d])
+
+    def __iter__(self):
+        for i in range(self.count):
+            yield self[i]
+
+    def to_numpy(self):
+        """(N x d) ndarray view of the same memory (no copy)."""
+        import numpy as np
+        return np.frombuffer(self.buffer, dtype=float).reshape(self.count, self.dim)
+
+    def to_matrix(self) -> Matrix:
+        """The block as an N x d Matrix (shares the buffer)."""
+        return Matrix._wrap(self._storage)
+
+    def _operand(self, other):
+        """(buffer, rows) for another batch of the same size or one shared Vector."""
+        if isinstance(other, VectorBatch):
+            if other.dim != self.dim or other.count not in (self.count, 1):
+                raise ValueError(f"Batch shapes don't match ({self.count}x{self.dim} vs {other.count}x{other.dim})")
+            return other.buffer, other.count
+        if len(other.components) != self.dim:
+            raise ValueError(f"Vector dimension ({len(other.components)}) must match batch dimension ({self.dim})")
+        return other.components, 1
+
+    def dot(self, other) -> array:
+        """
+        Row-wise dot products.
+
+        Args:
+            other: VectorBatch with the same count and dim, or one Vector
+
+        Returns:
+            array('d') of N dots
+        """
+        b, rows = self._operand(other)
+        return get_backend().row_dots(self.buffer, b, self.count, self.dim, rows)
+
+    def pairwise_dots(self, other: 'VectorBatch' = None) -> Matrix:
+        """
+        Every row against every row of other: the N x M Gram matrix A @ B^T.
+
+        One matrix multiply instead of N*M dot calls.
+
+        Args:
+            other: VectorBatch of dim d (defaults to self)
+
+        Returns:
+            N x M Matrix, entry (i, j) = self[i] . other[j]
+        """
+        other = self if other is None else other
+        if other.dim != self.dim:
+            raise ValueError(f"Dimensions don't match ({self.dim} vs {other.dim})")
+        backend = get_backend()
+        bt = backend.transpose(other.buffer, other.count, other.dim)
+        product = backend.matmul(self.buffer, bt, self.count, self.dim, other.count)
+        return Matrix._wrap(Storage(product, (self.count, other.count)))
+
+    def norms(self) -> array:
+        """Length of every vector, as array('d') of N."""
+        return get_backend().row_norms(self.buffer, self.count, self.dim)
+
+    def normalize(self) -> 'VectorBatch':
+        """Unit vectors in the same directions (zero vectors stay zero)."""
+        return VectorBatch._wrap(get_backend().normalize_rows(self.buffer, self.count, self.dim), self.dim)
+
+    def angle_between(self, other) -> array:
+        """
+        Angle between each row and the matching row of other (or one Vector), in degrees.
+
+        Returns:
+            array('d') of N angles; nan where either vector is zero
+        """
+        b, rows = self._operand(other)
+        return get_backend().row_angles(self.buffer, b, self.count, self.dim, rows)
+
+    def project_onto(self, other) -> 'VectorBatch':
+        """
+        Project each row onto the matching row of other (or onto one Vector).
+
+        proj_i = (a_i . b_i / b_i . b_i) b_i; projecting onto a zero vector gives zero.
+
+        Returns:
+            VectorBatch of the projections
+        """
+        b, rows = self._operand(other)
+        return VectorBatch._wrap(get_backend().project_rows(self.buffer, b, self.count, self.dim, rows), self.dim)
+
+    def cross(self, other) -> 'VectorBatch':
+        """
+        Row-wise 3D cross products (see Vector3D.cross).
+
+        Args:
+            other: VectorBatch of 3D vectors, or one Vector3D
+
+        Raises:
+            ValueError: If the vectors aren't 3D
+        """
+        if self.dim != 3:
+            raise ValueError(f"Cross product needs 3D vectors, got dimension {self.dim}")
+        b, rows = self._operand(other)
+        return VectorBatch._wrap(get_backend().cross_rows(self.buffer, b, self.count, rows), 3)
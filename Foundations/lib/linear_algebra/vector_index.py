@@ -0,0 +1,465 @@
+"""
+VectorIndex: top-k nearest-neighbour search over a growing collection of vectors
+Goal: Answer "which stored vectors are most like this one?" without a Python loop over every vector
+
+Exact search scans the stored vectors in blocks: one block @ queries
+matrix multiply scores block_size vectors against every query at once,
+and np.argpartition keeps the running top k. Norms are computed once when
+vectors are added, so
+    cosine:    sim(x, q)  = x . q / (|x| |q|)
+    euclidean: |x - q|^2  = |x|^2 - 2 x . q + |q|^2
+both cost one dot product per stored vector.
+
+Approximate modes trade a little recall for not scanning everything:
+    lsh    - random-hyperplane locality-sensitive hashing (cosine only).
+             Each of n_tables tables hashes a vector to the sign pattern of
+             n_bits random projections; similar directions collide. A query
+             reranks, exactly, only the vectors in its buckets (and, with
+             probes=1, the buckets one bit away).
+    kdtree - k-d tree for low-dimensional data (say d <= 16). Branch and
+             bound over axis-aligned cells; eps > 0 prunes cells that can't
+             beat the current k-th best by more than a factor (1 + eps).
+             Cosine uses the tree over unit vectors.
+
+Vectors can be added and removed at any time. Removal moves the last row
+into the hole (O(d)); the hash tables are updated in place, and the k-d
+tree scans vectors added since it was built and is rebuilt once those
+changes reach rebuild_fraction of its size.
+
+Example:
+    >>> index = VectorIndex(metric="cosine", approximate="lsh")
+    >>> ids = index.add(embeddings)              # Vectors, VectorBatch or N x d ndarray
+    >>> index.query(Vector(q), k=5)              # [(id, similarity), ...] best first
+    >>> index.remove(ids[:10])
+"""
+
+import heapq
+
+import numpy as np
+
+METRICS = ("cosine", "euclidean")
+APPROXIMATE = (None, "lsh", "kdtree")
+
+
+def _as_rows(vectors, dim: int = None) -> np.ndarray:
+    """Vector, list of Vectors/sequences, one sequence, VectorBatch or ndarray -> (N x d) float array."""
+    if hasattr(vectors, 'to_numpy'):             # VectorBatch: zero-copy view
+        rows = vectors.to_numpy()
+    elif hasattr(vectors, 'components'):         # a single Vector
+        rows = np.frombuffer(vectors.components, dtype=float)[None, :]
+    elif isinstance(vectors, np.ndarray):
+        rows = vectors.astype(float, copy=False)
+        if rows.ndim == 1:
+            rows = rows[None, :]
+    else:
+        rows = np.array([getattr(v, 'components', v) for v in vectors], dtype=float)
+        if rows.ndim == 1 and len(rows):           # one plain sequence of numbers
+            rows = rows[None, :]
+    if rows.ndim != 2 or (dim is not None and rows.shape[1] != dim):
+        raise ValueError(f"Expected vectors of dimension {dim}, got shape {rows.shape}")
+    return rows
+
+
+class _HyperplaneLSH:
+    """Random-hyperplane hash tables mapping code -> list of ids."""
+
+    def __init__(self, dim: int, n_tables: int, n_bits: int, rng: np.random.Generator):
+        self.planes = rng.standard_normal((n_tables, n_bits, dim))
+        self.weights = 1 << np.arange(n_bits, dtype=np.int64)
+        self.tables = [{} for _ in range(n_tables)]
+
+    def codes(self, rows: np.ndarray) -> np.ndarray:
+        """(N x n_tables) bucket codes: the sign bits of each table's projections."""
+        bits = np.einsum('tbd,nd->ntb', self.planes, rows) > 0
+        return bits.astype(np.int64) @ self.weights
+
+    def insert(self, ids: np.ndarray, codes: np.ndarray) -> None:
+        for t, table in enumerate(self.tables):
+            column = codes[:, t]
+            order = np.argsort(column, kind='stable')
+            keys, starts = np.unique(column[order], return_index=True)
+            for key, group in zip(keys.tolist(), np.split(ids[order], starts[1:])):
+                table.setdefault(key, []).extend(group.tolist())
+
+    def delete(self, item, codes: np.ndarray) -> None:
+        for table, code in zip(self.tables, codes.tolist()):
+            bucket = table[code]
+            bucket.remove(item)
+            if not bucket:
+                del table[code]
+
+    def candidates(self, code_row: np.ndarray, probes: int) -> set:
+        found = set()
+        flips = [0] + ([int(w) for w in self.weights] if probes else [])
+        for table, code in zip(self.tables, code_row.tolist()):
+            for flip in flips:
+                found.update(table.get(code ^ flip, ()))
+        return found
+
+
+class _KDTree:
+    """
+    Static k-d tree over a snapshot of points.
+
+    Nodes are lists [dim, split, left, right, start, end]; leaves have
+    dim = -1 and own points[start:end] (points are stored in tree order).
+    """
+
+    def __init__(self, points: np.ndarray, ids: np.ndarray, leaf_size: int = 32):
+        self.points = points
+        self.ids = ids
+        self.sq_norms = np.einsum('ij,ij->i', points, points)
+        order = np.arange(len(points))
+        self.nodes = []
+        stack = [(0, len(points), None, 0)]      # (start, end, parent, which child)
+        while stack:
+            start, end, parent, side = stack.pop()
+            index = len(self.nodes)
+            if parent is not None:
+                self.nodes[parent][2 + side] = index
+            block = points[order[start:end]]
+            if end - start <= leaf_size:
+                self.nodes.append([-1, 0.0, None, None, start, end])
+                continue
+            dim = int(np.argmax(block.max(axis=0) - block.min(axis=0)))
+            middle = (end - start) // 2
+            part = np.argpartition(block[:, dim], middle)
+            order[start:end] = order[start:end][part]
+            split = float(points[order[start + middle], dim])
+            self.nodes.append([dim, split, None, None, start, end])
+            stack.append((start + middle, end, index, 1))
+            stack.append((start, start + middle, index, 0))
+        self.points = points[order]
+        self.ids = ids[order]
+        self.sq_norms = self.sq_norms[order]
+
+    def __len__(self) -> int:
+        return len(self.points)
+
+    def query(self, q: np.ndarray, k: int, eps: float, alive) -> list:
+        """k nearest (squared distance, id) pairs among ids for which alive(id) is true."""
+        best = []      # max-heap of (-squared distance, id)
+        shrink = 1.0 / (1.0 + eps) ** 2
+        q_sq = float(q @ q)
+        stack = [(0, 0.0)]
+        while stack:
+            index, bound = stack.pop()
+            if len(best) == k and bound >= -best[0][0] * shrink:
+                continue
+            dim, split, left, right, start, end = self.nodes[index]
+            if dim < 0:
+                distances = self.sq_norms[start:end] - 2 * (self.points[start:end] @ q) + q_sq
+                for i in np.argsort(distances).tolist():
+                    item, distance = int(self.ids[start + i]), max(float(distances[i]), 0.0)
+                    if len(best) == k and distance >= -best[0][0]:
+                        break
+                    if not alive(item):
+                        continue
+                    if len(best) < k:
+                        heapq.heappush(best, (-distance, item))
+                    else:
+                        heapq.heapreplace(best, (-distance, item))
+                continue
+            gap = q[dim] - split
+            near, far = (left, right) if gap < 0 else (right, left)
+            # push the far side first so the near side is searched first
+            stack.append((far, max(bound, gap * gap)))
+            stack.append((near, bound))
+        return sorted((-d, item) for d, item in best)
+
+
+class VectorIndex:
+    """
+    Top-k similarity search over vectors that can be added and removed.
+
+    Attributes:
+        dim: vector dimension (fixed by the first add if not given)
+        metric: "cosine" (scores are similarities, higher first) or
+            "euclidean" (scores are distances, lower first)
+        approximate: None (exact), "lsh" or "kdtree"
+
+    Example:
+        >>> index = VectorIndex(metric="euclidean", approximate="kdtree")
+        >>> index.add(points)                         # ids 0 .. N-1
+        >>> index.query(Vector([0.1, 0.2, 0.3]), k=3)
+        [(17, 0.012...), (4, 0.05...), (230, 0.06...)]
+    """
+
+    def __init__(self, dim: int = None, metric: str = "cosine", approximate: str = None,
+                 block_size: int = 65536, n_tables: int = 8, n_bits: int = 16, probes: int = 1,
+                 leaf_size: int = 32, eps: float = 0.0, rebuild_fraction: float = 0.25, seed: int = 0):
+        """
+        Create an empty index.
+
+        Args:
+            dim: vector dimension, or None to take it from the first add
+            metric: "cosine" or "euclidean"
+            approximate: None for exact scans, "lsh" or "kdtree"
+            block_size: stored vectors scored per matrix multiply in exact scans
+            n_tables: LSH hash tables (more -> better recall, more memory)
+            n_bits: hyperplanes per LSH table (more -> smaller buckets)
+            probes: 1 to also check LSH buckets one bit away, 0 for exact buckets only
+            leaf_size: points per k-d tree leaf
+            eps: k-d tree approximation factor (0 = exact answers)
+            rebuild_fraction: rebuild the k-d tree when adds/removes since the
+                last build exceed this fraction of its size
+            seed: seed for the LSH hyperplanes
+
+        Raises:
+            ValueError: If metric or approximate isn't supported, or lsh is
+                combined with the euclidean metric
+        """
+        if metric not in METRICS:
+            raise ValueError(f"Unknown metric '{metric}'. Supported: {METRICS}")
+        if approximate not in APPROXIMATE:
+            raise ValueError(f"Unknown approximate mode '{approximate}'. Supported: {APPROXIMATE}")
+        if approximate == "lsh" and metric != "cosine":
+            raise ValueError("Hyperplane LSH approximates cosine similarity; use kdtree for euclidean")
+        self.dim = dim
+        self.metric = metric
+        self.approximate = approximate
+        self.block_size = block_size
+        self.n_tables = n_tables
+        self.n_bits = n_bits
+        self.probes = probes
+        self.leaf_size = leaf_size
+        self.eps = eps
+        self.rebuild_fraction = rebuild_fraction
+        self._rng = np.random.default_rng(seed)
+        self._data = None         # (capacity x dim); rows [0, _count) are live
+        self._norms = None        # |x| per row
+        self._ids = None          # id per row
+        self._codes = None        # LSH codes per row
+        self._rows = {}           # id -> row
+        self._count = 0
+        self._next_id = 0
+        self._lsh = None
+        self._tree = None
+        self._pending = set()     # ids added since the k-d tree was built
+        self._stale = set()       # ids whose k-d tree entry was removed (even if re-added since)
+        self._changes = 0         # adds + removes since the k-d tree was built
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __contains__(self, item) -> bool:
+        return item in self._rows
+
+    def __repr__(self) -> str:
+        return (f"VectorIndex(count={self._count}, dim={self.dim}, metric='{self.metric}', "
+                f"approximate={self.approximate!r})")
+
+    @property
+    def vectors(self) -> np.ndarray:
+        """(N x dim) view of the stored vectors, in row order (see ids)."""
+        return self._data[:self._count]
+
+    @property
+    def ids(self) -> np.ndarray:
+        """Id of each stored row."""
+        return self._ids[:self._count]
+
+    def _reserve(self, extra: int) -> None:
+        """Grow the row arrays (doubling) so `extra` more rows fit."""
+        needed = self._count + extra
+        capacity = 0 if self._data is None else len(self._data)
+        if needed <= capacity:
+            return
+        capacity = max(needed, 2 * capacity, 1024)
+        data = np.empty((capacity, self.dim))
+        norms, ids = np.empty(capacity), np.empty(capacity, dtype=np.int64)
+        codes = np.empty((capacity, self.n_tables), dtype=np.int64)
+        if self._data is not None:
+            n = self._count
+            data[:n], norms[:n], ids[:n], codes[:n] = self._data[:n], self._norms[:n], self._ids[:n], self._codes[:n]
+        self._data, self._norms, self._ids, self._codes = data, norms, ids, codes
+
+    def add(self, vectors, ids=None) -> list:
+        """
+        Store vectors (and precompute their norms and hashes).
+
+        Args:
+            vectors: a Vector, list of Vectors/sequences, VectorBatch, or N x d ndarray
+            ids: integer ids, one per vector; default: consecutive new ids
+
+        Returns:
+            The ids of the added vectors
+
+        Raises:
+            ValueError: On a dimension mismatch, or an id already in the index
+        """
+        rows = _as_rows(vectors, self.dim)
+        if self.dim is None:
+            self.dim = rows.shape[1]
+        n = len(rows)
+        if ids is None:
+            ids = np.arange(self._next_id, self._next_id + n, dtype=np.int64)
+        else:
+            ids = np.asarray(ids, dtype=np.int64)
+            if len(ids) != n or len(set(ids.tolist())) != n or any(i in self._rows for i in ids.tolist()):
+                raise ValueError("ids must be unique, new, and one per vector")
+        if n == 0:
+            return []
+        self._next_id = max(self._next_id, int(ids.max()) + 1)
+
+        self._reserve(n)
+        start, end = self._count, self._count + n
+        self._data[start:end] = rows
+        self._norms[start:end] = np.linalg.norm(rows, axis=1)
+        self._ids[start:end] = ids
+        self._rows.update(zip(ids.tolist(), range(start, end)))
+        self._count = end
+
+        if self.approximate == "lsh":
+            if self._lsh is None:
+                self._lsh = _HyperplaneLSH(self.dim, self.n_tables, self.n_bits, self._rng)
+            self._codes[start:end] = self._lsh.codes(rows)
+            self._lsh.insert(ids, self._codes[start:end])
+        elif self.approximate == "kdtree":
+            self._pending.update(ids.tolist())
+            self._changes += n
+        return ids.tolist()
+
+    def remove(self, ids) -> None:
+        """
+        Delete vectors by id; nothing is deleted unless every id is present.
+
+        Raises:
+            KeyError: If an id isn't in the index
+        """
+        items = list(dict.fromkeys(int(item) for item in ([ids] if isinstance(ids, (int, np.integer)) else ids)))
+        missing = [item for item in items if item not in self._rows]
+        if missing:
+            raise KeyError(missing[0] if len(missing) == 1 else missing)
+        for item in items:
+            row = self._rows.pop(item)
+            if self._lsh is not None:
+                self._lsh.delete(item, self._codes[row])
+            if item in self._pending:
+                self._pending.discard(item)
+            elif self._tree is not None:
+                self._stale.add(item)
+            last = self._count - 1
+            if row != last:
+                # fill the hole with the last row
+                self._data[row], self._norms[row] = self._data[last], self._norms[last]
+                self._ids[row], self._codes[row] = self._ids[last], self._codes[last]
+                self._rows[int(self._ids[row])] = row
+            self._count = last
+            self._changes += 1
+
+    def _points(self, rows: np.ndarray, norms: np.ndarray) -> np.ndarray:
+        """What the k-d tree indexes: the vectors themselves, or unit vectors for cosine."""
+        if self.metric == "euclidean":
+            return rows
+        return rows / np.where(norms == 0, 1.0, norms)[:, None]
+
+    def _scores(self, rows: np.ndarray, norms: np.ndarray, queries: np.ndarray, query_norms: np.ndarray) -> np.ndarray:
+        """(rows x queries) scores, arranged so that larger is always better."""
+        dots = rows @ queries.T
+        if self.metric == "cosine":
+            scale = np.outer(norms, query_norms)
+            return np.divide(dots, scale, out=np.zeros_like(dots), where=scale != 0)
+        # negative squared distance
+        return 2 * dots - (norms ** 2)[:, None] - (query_norms ** 2)[None, :]
+
+    def _finish(self, scores, ids) -> list:
+        """Best-first (id, score) list, converting negative squared distances back to distances."""
+        order = np.argsort(-scores, kind='stable')
+        if self.metric == "cosine":
+            return [(int(ids[i]), float(scores[i])) for i in order]
+        return [(int(ids[i]), float(np.sqrt(max(-scores[i], 0.0)))) for i in order]
+
+    def _exact(self, queries: np.ndarray, k: int) -> list:
+        """Blocked scan: one matrix multiply per block, running top-k per query."""
+        query_norms = np.linalg.norm(queries, axis=1)
+        m = len(queries)
+        best_scores = np.full((m, 0), -np.inf)
+        best_rows = np.zeros((m, 0), dtype=np.int64)
+        for start in range(0, self._count, self.block_size):
+            end = min(start + self.block_size, self._count)
+            block = self._scores(self._data[start:end], self._norms[start:end], queries, query_norms).T
+            scores = np.concatenate([best_scores, block], axis=1)
+            rows = np.concatenate([best_rows, np.broadcast_to(np.arange(start, end), (m, end - start))], axis=1)
+            if scores.shape[1] > k:
+                keep = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+                scores = np.take_along_axis(scores, keep, axis=1)
+                rows = np.take_along_axis(rows, keep, axis=1)
+            best_scores, best_rows = scores, rows
+        return [self._finish(best_scores[j], self._ids[best_rows[j]]) for j in range(m)]
+
+    def _lsh_query(self, query: np.ndarray, k: int) -> list:
+        candidates = self._lsh.candidates(self._lsh.codes(query[None, :])[0], self.probes)
+        if len(candidates) < k:
+            return self._exact(query[None, :], k)[0]
+        rows = np.fromiter((self._rows[i] for i in candidates), dtype=np.int64, count=len(candidates))
+        scores = self._scores(self._data[rows], self._norms[rows], query[None, :],
+                              np.linalg.norm(query)[None])[:, 0]
+        keep = np.argpartition(-scores, k - 1)[:k] if len(scores) > k else np.arange(len(scores))
+        return self._finish(scores[keep], self._ids[rows[keep]])
+
+    def _ensure_tree(self) -> None:
+        size = 0 if self._tree is None else len(self._tree)
+        if self._tree is None or self._changes > self.rebuild_fraction * max(size, 1):
+            n = self._count
+            points = self._points(self._data[:n], self._norms[:n])
+            self._tree = _KDTree(points, self._ids[:n].copy(), self.leaf_size)
+            self._pending = set()
+            self._stale = set()
+            self._changes = 0
+
+    def _tree_query(self, query: np.ndarray, k: int) -> list:
+        self._ensure_tree()
+        norm = float(np.linalg.norm(query))
+        point = query if self.metric == "euclidean" else query / (norm or 1.0)
+        stale = self._stale
+        found = self._tree.query(point, k, self.eps, lambda item: item not in stale)
+        # vectors added since the tree was built are scanned directly
+        pending = list(self._pending)
+        if pending:
+            rows = np.array([self._rows[i] for i in pending], dtype=np.int64)
+            points = self._points(self._data[rows], self._norms[rows])
+            distances = np.einsum('ij,ij->i', points - point, points - point)
+            found = sorted(found + list(zip(distances.tolist(), pending)))[:k]
+        if self.metric == "euclidean":
+            return [(item, float(np.sqrt(d))) for d, item in found]
+        # |u - v|^2 = 2 - 2 cos for unit vectors
+        return [(item, 1.0 - d / 2.0 if norm else 0.0) for d, item in found]
+
+    def query(self, vector, k: int = 10, exact: bool = False) -> list:
+        """
+        The k stored vectors most similar to `vector`.
+
+        Args:
+            vector: Vector, sequence or 1-D ndarray of length dim
+            k: number of results
+            exact: force an exact scan even if the index is approximate
+
+        Returns:
+            Up to k (id, score) pairs, best first: cosine similarity
+            (descending) or euclidean distance (ascending)
+        """
+        if self._count == 0 or k <= 0:
+            return []
+        query = _as_rows(vector, self.dim)[0]
+        k = min(k, self._count)
+        if exact or self.approximate is None:
+            return self._exact(query[None, :], k)[0]
+        if self.approximate == "lsh":
+            return self._lsh_query(query, k)
+        return self._tree_query(query, k)
+
+    def query_batch(self, vectors, k: int = 10, exact: bool = False) -> list:
+        """
+        query() for many vectors; exact scans score all of them in the same block multiplies.
+
+        Returns:
+            One result list per query vector
+        """
+        queries = _as_rows(vectors, self.dim)
+        if self._count == 0 or k <= 0:
+            return [[] for _ in range(len(queries))]
+        k = min(k, self._count)
+        if exact or self.approximate is None:
+            return self._exact(queries, k)
+        return [self.query(q, k) for q in queries]
@@ -0,0 +1,11 @@
+"""
+Test configuration: make linear_algebra and visualization importable from lib/.
+
+Run from lib/ (or anywhere):
+    python -m pytest tests
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
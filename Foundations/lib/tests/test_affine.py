@@ -0,0 +1,70 @@
+"""Affine transforms agree with their homogeneous matrices, and only orthogonal ones take the transpose inverse."""
+
+import random
+from array import array
+
+import pytest
+
+from linear_algebra.affine import Affine2D, Affine3D
+from linear_algebra.matrix import Matrix
+from linear_algebra.matrix2D import Matrix2D
+from linear_algebra.matrix3D import Matrix3D
+from linear_algebra.quaternion import Quaternion
+from linear_algebra.Vector3D import Vector3D
+
+
+def _homogeneous_apply(transform, point):
+    column = Matrix([[c] for c in list(point) + [1.0]])
+    return list(transform.matrix.multiply_matrix(column)._storage.buffer[:transform.dim])
+
+
+def test_from_trs_order():
+    transform = Affine3D.from_trs([1, 2, 3], (90, "z"), [2, 2, 2])
+    assert list(transform.apply(Vector3D([1, 0, 0])).components) == pytest.approx([1, 4, 3])
+
+
+@pytest.mark.parametrize("rotation, rigid", [
+    ((30, "x"), True),
+    (Quaternion.from_axis_angle([1, 1, 0], 40), True),
+    (Matrix3D.rotation(25, "y"), True),
+    (Matrix3D.scaling(2, 2, 2), False),
+    (Matrix3D.shear(xy=0.5), False),
+])
+def test_from_trs_rigid_only_when_orthogonal(rotation, rigid):
+    transform = Affine3D.from_trs([1, 2, 3], rotation=rotation)
+    assert transform.rigid is rigid
+    back = transform.inverse().apply(transform.apply([1, 1, 1]))
+    assert list(back.components) == pytest.approx([1, 1, 1])
+
+
+@pytest.mark.parametrize("transform", [
+    Affine3D.rotation(33, [1, 2, 3]).compose(Affine3D.translation(4, 5, 6)),
+    Affine3D.shear(xy=0.3).compose(Affine3D.scaling(1, 2, 3)).compose(Affine3D.translation(-1, 0, 2)),
+    Affine2D.from_trs([5, 0], 90, 2),
+    Affine2D.from_trs([1, 1], Matrix2D.shear(0.5)),
+])
+def test_matches_homogeneous_matrix(transform):
+    rng = random.Random(transform.dim)
+    d = transform.dim
+    points = array('d', [rng.uniform(-5, 5) for _ in range(d * 40)])
+    out = transform.transform_points(points)
+    inverse = transform.inverse()
+    for i in range(0, len(points), d):
+        point = points[i:i + d]
+        assert list(out[i:i + d]) == pytest.approx(_homogeneous_apply(transform, point))
+        assert list(inverse.apply(out[i:i + d]).components) == pytest.approx(list(point))
+
+
+def test_from_matrix_round_trip():
+    transform = Affine3D.from_trs([1, 2, 3], (50, "z"))
+    copy = Affine3D.from_matrix(transform.matrix)
+    assert copy.rigid
+    assert list(copy.matrix._storage.buffer) == list(transform.matrix._storage.buffer)
+    with pytest.raises(ValueError):
+        Affine3D.from_matrix(Matrix3D.identity(3))
+
+
+def test_homogeneous_matrix_type():
+    assert type(Affine2D.translation(1, 2).matrix) is Matrix3D
+    four = Affine3D.translation(1, 2, 3).matrix
+    assert type(four) is Matrix and (four.rows, four.cols) == (4, 4)
@@ -0,0 +1,35 @@
+"""The animation scene's update() works under profiling and alongside the live preview's FrameTimer."""
+
+import pytest
+
+pytest.importorskip("matplotlib")
+
+from linear_algebra.instrument import profile  # noqa: E402
+from visualization import Animation  # noqa: E402
+
+
+def test_update_records_timers():
+    fig, update = Animation.build_scene(max_frames=4, grid_size=3)
+    fig.canvas.draw()
+    with profile() as p:
+        for frame in range(4):
+            update(frame)
+    assert p.timers["animation.segments"].calls == 4
+    assert p.timers["animation.projection"].calls == 4
+
+
+def test_update_survives_script_globals(monkeypatch):
+    # running Animation.py as a script binds its preview's FrameTimer at module level
+    monkeypatch.setattr(Animation, "frame_timer", Animation.FrameTimer(), raising=False)
+    monkeypatch.setattr(Animation, "timer", Animation.FrameTimer(), raising=False)
+    fig, update = Animation.build_scene(max_frames=2, grid_size=3)
+    with profile() as p:
+        update(1)
+    assert p.timers["animation.segments"].calls == 1
+
+
+def test_build_scene_accepts_pipeline():
+    from linear_algebra.pipeline import TransformPipeline
+    pipe = TransformPipeline(3).rotate(90, "z").scale(1, 1, 2)
+    fig, update = Animation.build_scene(pipe, max_frames=3, grid_size=3)
+    assert len(update(2)) == 4
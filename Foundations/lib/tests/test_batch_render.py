@@ -0,0 +1,55 @@
+"""Manifests are validated on load, and batch rendering writes one PNG per entry headlessly."""
+
+import json
+
+import pytest
+
+matplotlib = pytest.importorskip("matplotlib")
+
+from visualization.batch_render import load_manifest, render_batch  # noqa: E402
+
+ENTRIES = [("shear", "shear", [[1, 1], [0, 1]]), ("swap", "swap", [[0, 1], [1, 0]])]
+
+
+def write_manifest(tmp_path, data):
+    path = tmp_path / "manifest.json"
+    path.write_text(json.dumps(data))
+    return str(path)
+
+
+def test_load_manifest_formats(tmp_path):
+    listed = write_manifest(tmp_path, [{"name": "shear", "matrix": [[1, 1], [0, 1]]}, {"matrix": [[0, 1], [1, 0]]}])
+    assert load_manifest(listed) == [("shear", "shear", [[1, 1], [0, 1]]),
+                                     ("transform_00001", "transform_00001", [[0, 1], [1, 0]])]
+    mapping = write_manifest(tmp_path, {"shear": [[1, 1], [0, 1]], "swap": [[0, 1], [1, 0]]})
+    assert load_manifest(mapping) == ENTRIES
+
+
+@pytest.mark.parametrize("data", [
+    [{"name": "../escape", "matrix": [[1, 0], [0, 1]]}],
+    [{"name": "sub/dir", "matrix": [[1, 0], [0, 1]]}],
+    [{"name": "..", "matrix": [[1, 0], [0, 1]]}],
+    [{"name": "twice", "matrix": [[1, 0], [0, 1]]}, {"name": "twice", "matrix": [[2, 0], [0, 2]]}],
+    [[[1, 0], [0, 1]]],
+    [{"name": "short", "matrix": [[1, 0]]}],
+    [{"name": "missing"}],
+])
+def test_load_manifest_rejects_bad_entries(tmp_path, data):
+    with pytest.raises(ValueError):
+        load_manifest(write_manifest(tmp_path, data))
+
+
+def test_serial_render_keeps_backend(tmp_path):
+    matplotlib.use("svg", force=True)
+    try:
+        stats = render_batch(ENTRIES, str(tmp_path), workers=1, grid_size=3, dpi=20)
+        assert matplotlib.get_backend() == "svg"
+    finally:
+        matplotlib.use("Agg", force=True)
+    assert stats["images"] == 2
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["shear.png", "swap.png"]
+
+
+def test_parallel_render(tmp_path):
+    stats = render_batch(ENTRIES, str(tmp_path), workers=2, grid_size=3, dpi=20, chunk_size=1)
+    assert stats["images"] == 2
@@ -0,0 +1,14 @@
+"""Every conformance case must give the python backend's answers under every other backend."""
+
+import pytest
+
+from linear_algebra.backend import available_backends
+from linear_algebra.conformance import CASES, check_conformance
+
+CANDIDATES = [name for name in available_backends() if name != "python"]
+
+
+@pytest.mark.parametrize("candidate", CANDIDATES)
+@pytest.mark.parametrize("build", CASES, ids=lambda build: build.__name__)
+def test_backend_matches_reference(build, candidate):
+    assert check_conformance("python", candidate, cases=[build]) == []
@@ -0,0 +1,80 @@
+"""top_k_eigen and lanczos return exactly k correct eigenpairs, including after breakdown and restarts."""
+
+import random
+
+import pytest
+
+from linear_algebra.backend import get_backend
+from linear_algebra.decompositions import lanczos
+from linear_algebra.matrix import Matrix
+from linear_algebra.matrix3D import Matrix3D
+
+
+def _residual(matrix, result):
+    n, k = result.vectors.rows, result.vectors.cols
+    worst = 0.0
+    for i in range(k):
+        v = result.vectors.get_column(i)
+        av = matrix.multiply_vector(v).components
+        worst = max(worst, max(abs(x - result.values[i] * y) for x, y in zip(av, v.components)))
+    return worst
+
+
+@pytest.mark.parametrize("method", ["lanczos", "power"])
+def test_identity(method):
+    result = Matrix3D.identity(5).top_k_eigen(3, method=method)
+    assert len(result.values) == 3
+    assert (result.vectors.rows, result.vectors.cols) == (5, 3)
+    assert result.values == pytest.approx([1, 1, 1])
+
+
+def test_repeated_eigenvalue():
+    result = Matrix3D([[2, 0, 0], [0, 2, 0], [0, 0, 1]]).top_k_eigen(2)
+    assert result.values == pytest.approx([2, 2])
+    assert result.converged
+
+
+def test_matches_full_eigen():
+    rng = random.Random(3)
+    rows = [[rng.uniform(-1, 1) for _ in range(30)] for _ in range(30)]
+    symmetric = Matrix([[rows[i][j] + rows[j][i] for j in range(30)] for i in range(30)])
+    expected = sorted(symmetric.eigen().values, key=abs, reverse=True)[:4]
+    result = symmetric.top_k_eigen(4)
+    assert list(result.values) == pytest.approx(expected, rel=1e-8)
+    assert _residual(symmetric, result) < 1e-7
+
+
+def _symmetric(n, seed):
+    rng = random.Random(seed)
+    rows = [[rng.uniform(-1, 1) for _ in range(n)] for _ in range(n)]
+    return Matrix([[rows[i][j] + rows[j][i] for j in range(n)] for i in range(n)])
+
+
+def test_lanczos_accepts_an_operator():
+    symmetric = _symmetric(25, 4)
+    buffer = symmetric._storage.buffer
+    backend = get_backend("python")
+    direct = lanczos(buffer, 25, 3, backend)
+    implicit = lanczos(lambda v: backend.matvec(buffer, 25, 25, v), 25, 3, backend)
+    assert implicit.values == pytest.approx(direct.values)
+    assert implicit.iterations == direct.iterations
+
+
+def test_lanczos_stops_at_max_iterations():
+    buffer = _symmetric(40, 5)._storage.buffer
+    result = lanczos(buffer, 40, 2, get_backend("python"), max_iterations=6)
+    assert result.iterations == 6
+    assert len(result.values) == 2 and len(result.vectors) == 80
+    assert not result.converged
+    # fewer products than pairs asked for still yields k Ritz pairs
+    assert lanczos(buffer, 40, 3, get_backend("python"), max_iterations=1).iterations == 3
+
+
+def test_lanczos_restarts_converge():
+    # a tight tolerance forces restarts (20, 40, 80 steps); restarting from the
+    # Ritz vectors found so far, rather than the first start vector, needs no fourth
+    symmetric = _symmetric(200, 1)
+    expected = sorted(symmetric.eigen().values, key=abs, reverse=True)[:3]
+    result = lanczos(symmetric._storage.buffer, 200, 3, get_backend(), tolerance=1e-13)
+    assert result.converged and result.iterations <= 140
+    assert list(result.values) == pytest.approx(expected, rel=1e-9)
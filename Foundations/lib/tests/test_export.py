@@ -0,0 +1,41 @@
+"""Animation export, serial and across worker processes, produces one image per frame."""
+
+import pytest
+
+pytest.importorskip("matplotlib")
+Image = pytest.importorskip("PIL.Image")
+
+import matplotlib.pyplot as plt  # noqa: E402
+
+from visualization.Animation import build_scene  # noqa: E402
+from visualization.export import export_animation  # noqa: E402
+
+FRAMES = 6
+
+
+def small_scene():
+    return build_scene(max_frames=FRAMES, grid_size=3)
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_export_gif(tmp_path, workers):
+    path = str(tmp_path / "scene.gif")
+    open_figures = plt.get_fignums()
+    export_animation(path, small_scene, FRAMES, fps=10, workers=workers, chunk_size=2)
+    # serial export closes its figure; parallel export never builds one here
+    assert plt.get_fignums() == open_figures
+    with Image.open(path) as gif:
+        assert gif.n_frames == FRAMES
+        assert gif.info["duration"] == 100
+
+
+def test_export_rejects_bad_requests(tmp_path):
+    with pytest.raises(ValueError):
+        export_animation(str(tmp_path / "scene.avi"), small_scene, FRAMES)
+    with pytest.raises(ValueError):
+        export_animation(str(tmp_path / "scene.gif"), small_scene, 0)
+
+
+def test_update_before_first_draw():
+    fig, update = small_scene()
+    assert len(update(FRAMES - 1)) == 4
@@ -0,0 +1,36 @@
+"""Precomputed animation frames: interpolation modes and accepted transform types."""
+
+import numpy as np
+import pytest
+
+from linear_algebra.matrix3D import Matrix3D
+from linear_algebra.pipeline import TransformPipeline
+from visualization.interpolation import interpolate_frames, interpolate_matrices
+
+
+def test_pipeline_matches_its_fused_matrix():
+    pipe = TransformPipeline(3).rotate(30, "z").scale(1, 2, 1).shear(xy=0.5)
+    points = np.random.default_rng(0).normal(size=(20, 3))
+    via_pipeline = interpolate_frames(Matrix3D.identity(), pipe, points, 5, mode="log")
+    via_matrix = interpolate_frames(Matrix3D.identity(), pipe.matrix, points, 5, mode="log")
+    np.testing.assert_allclose(via_pipeline.matrices, via_matrix.matrices)
+    np.testing.assert_allclose(via_pipeline[4], pipe.transform_points(points), atol=1e-12)
+
+
+def test_endpoints_in_every_mode():
+    end = Matrix3D.rotation(90, "z").multiply_matrix(Matrix3D.scaling(2, 2, 2))
+    for mode in ("linear", "slerp", "log"):
+        matrices = interpolate_matrices(Matrix3D.identity(), end, [0.0, 1.0], mode)
+        np.testing.assert_allclose(matrices[0], np.eye(3), atol=1e-12)
+        np.testing.assert_allclose(matrices[1], end.data, atol=1e-12)
+
+
+def test_singular_or_defective_transforms_raise():
+    with pytest.raises(ValueError):
+        interpolate_matrices(Matrix3D.scaling(1, 1, 0), Matrix3D.identity(), [0.5], "log")
+    with pytest.raises(ValueError):
+        interpolate_matrices(Matrix3D.scaling(1, 0, 1), Matrix3D.identity(), [0.5], "slerp")
+    with pytest.raises(ValueError):
+        interpolate_matrices(Matrix3D.identity(), Matrix3D.shear(xy=1), [0.5], "log")
+    # linear mode never inverts anything
+    assert interpolate_matrices(Matrix3D.scaling(1, 1, 0), Matrix3D.identity(), [0.5]).shape == (1, 3, 3)
@@ -0,0 +1,68 @@
+"""Lazy expression graphs give the eager results on every backend without touching their inputs."""
+
+import pytest
+
+from linear_algebra.backend import use_backend
+from linear_algebra.lazy import LazyVector, lazy_mode
+from linear_algebra.vector import Vector
+
+
+@pytest.fixture(params=["python", "numpy"])
+def backend(request):
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+    with use_backend(request.param):
+        yield request.param
+
+
+def _vectors():
+    return Vector([1.0, 2.0, 3.0]), Vector([-4.0, 0.5, 2.0]), Vector([0.0, 1.0, -1.0])
+
+
+def test_matches_eager(backend):
+    a, b, c = _vectors()
+    eager = a * 2 + b - c * 3
+    with lazy_mode():
+        lazy = a * 2 + b - c * 3
+    assert isinstance(lazy, LazyVector) and len(lazy) == 3
+    assert lazy.dot(b) == pytest.approx(eager.dot(b))
+    assert lazy.magnitude() == pytest.approx(eager.magnitude())
+    assert list(lazy.components) == pytest.approx(list(eager.components))
+    # the inputs are read, never overwritten by the fused evaluation
+    assert (list(a.components), list(b.components), list(c.components)) == \
+        ([1.0, 2.0, 3.0], [-4.0, 0.5, 2.0], [0.0, 1.0, -1.0])
+
+
+def test_shared_subexpressions(backend):
+    a, b, _ = _vectors()
+    with lazy_mode():
+        s = a + b
+        r = s * 2 - (a + b) + s
+    assert list(r.components) == pytest.approx([2 * (x + y) for x, y in zip(a.components, b.components)])
+
+
+def test_evaluated_result_is_reused():
+    a, b, _ = _vectors()
+    with lazy_mode():
+        s = a - b
+    first = s.components
+    assert s.components is first
+    with lazy_mode():
+        t = s * 0.5
+    assert list(t.components) == pytest.approx([x * 0.5 for x in first])
+
+
+def test_outside_the_block_is_eager():
+    a, b, _ = _vectors()
+    with lazy_mode():
+        pass
+    assert type(a + b) is Vector
+
+
+def test_dimension_mismatch():
+    with lazy_mode():
+        with pytest.raises(ValueError):
+            Vector([1, 2]) + Vector([1, 2, 3])
+        lazy = Vector([1, 2]) * 3
+    with pytest.raises(ValueError):
+        lazy.dot(Vector([1, 2, 3]))
@@ -0,0 +1,48 @@
+"""Process-pool kernels agree with the serial ones and validate their inputs the same way."""
+
+import random
+from array import array
+
+import pytest
+
+from linear_algebra import kernels, parallel
+
+
+def test_matvec_batch_matches_serial():
+    rng = random.Random(0)
+    matrix = array('d', [rng.uniform(-1, 1) for _ in range(9)])
+    points = array('d', [rng.uniform(-5, 5) for _ in range(3 * 500)])
+    assert parallel.matvec_batch(matrix, 3, 3, points, workers=2) == kernels.matvec_batch(matrix, 3, 3, points)
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_matvec_batch_rejects_partial_point(workers):
+    with pytest.raises(ValueError):
+        parallel.matvec_batch(array('d', [1, 0, 0, 1]), 2, 2, array('d', range(7)), workers)
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_multiply_matches_serial(workers):
+    rng = random.Random(1)
+    a = array('d', [rng.uniform(-1, 1) for _ in range(7 * 5)])
+    b = array('d', [rng.uniform(-1, 1) for _ in range(5 * 4)])
+    assert parallel.multiply(a, b, 7, 5, 4, workers=workers) == kernels.gemm(a, b, 7, 5, 4)
+
+
+def test_matvec_batch_applies_offset_in_workers():
+    matrix = array('d', [2, 0, 0, 3])
+    points = array('d', range(10))
+    expected = kernels.affine_batch(matrix, (1, -1), 2, 2, points)
+    assert parallel.matvec_batch(matrix, 2, 2, points, workers=2, offset=(1, -1)) == expected
+
+
+def test_worker_defaults():
+    previous = parallel.get_workers()
+    try:
+        parallel.set_workers(3)
+        assert parallel.resolve_workers(None) == 3
+        parallel.set_workers(None)
+        assert parallel.get_workers() == 1
+        assert parallel.resolve_workers(0) >= 1
+    finally:
+        parallel.set_workers(previous)
@@ -0,0 +1,65 @@
+"""PCA solvers (batch and incremental) agree with each other and always return n_components components."""
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from linear_algebra.pca import PCA, SOLVERS, IncrementalPCA  # noqa: E402
+
+SOLVER_NAMES = sorted(name for name in SOLVERS if name != "auto")
+
+
+@pytest.mark.parametrize("solver", SOLVER_NAMES)
+def test_rank_deficient_data_keeps_all_components(solver):
+    rng = np.random.default_rng(1)
+    X = np.outer(rng.standard_normal(200), rng.standard_normal(30))   # rank 1
+    pca = PCA(3, svd_solver=solver).fit(X)
+    assert pca.components_.shape == (3, 30)
+    np.testing.assert_allclose(pca.components_ @ pca.components_.T, np.eye(3), atol=1e-8)
+
+
+@pytest.mark.parametrize("solver", SOLVER_NAMES)
+def test_solvers_match_full(solver):
+    rng = np.random.default_rng(2)
+    X = rng.standard_normal((400, 40)) * np.geomspace(20, 0.1, 40)
+    full = PCA(4, svd_solver="full").fit(X)
+    other = PCA(4, svd_solver=solver).fit(X)
+    np.testing.assert_allclose(other.explained_variance_, full.explained_variance_, rtol=1e-4)
+    np.testing.assert_allclose(np.abs(other.components_ @ full.components_.T), np.eye(4), atol=1e-3)
+
+
+def test_incremental_matches_full():
+    rng = np.random.default_rng(3)
+    X = rng.standard_normal((500, 12)) * np.geomspace(10, 0.5, 12) + 4
+    full = PCA(3).fit(X)
+    incremental = IncrementalPCA(3, batch_size=64).fit(X)
+    assert incremental.n_samples_seen_ == 500
+    np.testing.assert_allclose(incremental.mean_, full.mean_)
+    np.testing.assert_allclose(incremental.explained_variance_, full.explained_variance_, rtol=1e-6)
+    np.testing.assert_allclose(incremental.explained_variance_ratio_, full.explained_variance_ratio_, rtol=1e-6)
+    np.testing.assert_allclose(np.abs(incremental.components_ @ full.components_.T), np.eye(3), atol=1e-6)
+
+
+@pytest.mark.parametrize("solver", SOLVER_NAMES)
+def test_single_sample_is_rejected(solver):
+    with pytest.raises(ValueError):
+        PCA(1, svd_solver=solver).fit(np.ones((1, 5)))
+
+
+def test_incremental_single_sample_is_rejected():
+    pca = IncrementalPCA(1)
+    with pytest.raises(ValueError):
+        pca.partial_fit(np.ones(5))
+    # a one-row chunk is fine once the decomposition has started
+    pca.partial_fit(np.arange(10.0).reshape(2, 5)).partial_fit(np.ones(5))
+    assert pca.n_samples_seen_ == 3 and pca.explained_variance_.shape == (1,)
+
+
+def test_lanczos_solver_respects_max_iter():
+    rng = np.random.default_rng(4)
+    X = rng.standard_normal((300, 60)) * np.geomspace(5, 1, 60)
+    pca = PCA(3, svd_solver="lanczos", max_iter=7, random_state=0).fit(X)
+    assert pca.n_iter_ == 7 and pca.components_.shape == (3, 60)
+    # seeded runs are reproducible
+    again = PCA(3, svd_solver="lanczos", max_iter=7, random_state=0).fit(X)
+    np.testing.assert_array_equal(pca.components_, again.components_)
@@ -0,0 +1,58 @@
+"""Matrix3D.rotation and Quaternion agree, and bad axes or operands are rejected."""
+
+import math
+import random
+
+import pytest
+
+from linear_algebra.matrix3D import Matrix3D
+from linear_algebra.quaternion import Quaternion
+from linear_algebra.Vector3D import Vector3D
+
+
+def _close(a, b, tolerance=1e-12):
+    return all(abs(x - y) <= tolerance for x, y in zip(a._storage.buffer, b._storage.buffer))
+
+
+@pytest.mark.parametrize("axis, vector", [("x", [1, 0, 0]), ("y", [0, 1, 0]), ("z", [0, 0, 1])])
+def test_named_axis_matches_vector_axis(axis, vector):
+    assert _close(Matrix3D.rotation(37, axis), Matrix3D.rotation(37, vector))
+
+
+def test_z_quarter_turn():
+    rotated = Quaternion.from_axis_angle("z", 90).rotate(Vector3D([1, 0, 0]))
+    assert list(rotated.components) == pytest.approx([0, 1, 0], abs=1e-12)
+
+
+def test_compose_and_round_trip():
+    rng = random.Random(0)
+    for _ in range(50):
+        p, q = (Quaternion.from_axis_angle([rng.gauss(0, 1) for _ in range(3)], rng.uniform(-360, 360))
+                for _ in range(2))
+        assert _close((p * q).to_matrix(), p.to_matrix().multiply_matrix(q.to_matrix()))
+        assert abs(Quaternion.from_matrix(p.to_matrix()).dot(p)) == pytest.approx(1.0)
+
+
+def test_slerp_midpoint():
+    half = Quaternion.identity().slerp(Quaternion.from_axis_angle("z", 90), 0.5)
+    axis, angle = half.to_axis_angle()
+    assert angle == pytest.approx(45) and list(axis.components) == pytest.approx([0, 0, 1])
+    assert math.isclose(half.norm(), 1.0)
+
+
+@pytest.mark.parametrize("axis", ["w", 5, [1, 2], [0, 0, 0], ["a", "b", "c"], None])
+def test_bad_axis_raises_value_error(axis):
+    with pytest.raises(ValueError):
+        Matrix3D.rotation(30, axis)
+
+
+def test_multiply_operands():
+    q = Quaternion.from_axis_angle("z", 90)
+    v = Vector3D([1, 0, 0])
+    assert (q * v).components.tolist() == pytest.approx(q.rotate(v).components.tolist())
+    assert (2 * q).w == pytest.approx(2 * q.w) and (q * 2.0).z == pytest.approx(2 * q.z)
+    for other in ("2", [1, 0, 0], None):
+        with pytest.raises(TypeError):
+            q * other
+        with pytest.raises(TypeError):
+            other * q
@@ -0,0 +1,69 @@
+"""SparseMatrix (CSR) matches the dense Matrix it stands for on every backend."""
+
+import random
+
+import pytest
+
+from linear_algebra.backend import use_backend
+from linear_algebra.matrix import Matrix
+from linear_algebra.sparse import SparseMatrix
+from linear_algebra.vector import Vector
+
+
+@pytest.fixture(params=["python", "numpy"])
+def backend(request):
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+    with use_backend(request.param):
+        yield request.param
+
+
+def _random_dense(rows, cols, density, seed):
+    rng = random.Random(seed)
+    return Matrix([[rng.uniform(-1, 1) if rng.random() < density else 0.0 for _ in range(cols)]
+                   for _ in range(rows)])
+
+
+def test_dense_round_trip():
+    dense = _random_dense(7, 5, 0.3, 0)
+    sparse = dense.to_sparse()
+    assert sparse.nnz == sum(1 for row in dense.data for x in row if x)
+    assert sparse.to_matrix().data == dense.data
+    assert sparse.transpose().to_matrix().data == dense.transpose().data
+    rows, cols, values = sparse.to_coo()
+    assert SparseMatrix.from_coo(rows, cols, values, sparse.shape).to_matrix().data == dense.data
+
+
+def test_from_coo_duplicates_and_zeros():
+    summed = SparseMatrix.from_coo([0, 0, 1, 1], [1, 1, 0, 1], [2.0, 3.0, 0.0, 4.0], (2, 2))
+    assert summed.nnz == 2 and summed.get(0, 1) == 5.0 and summed.get(1, 0) == 0.0
+    last = SparseMatrix.from_coo([0, 0], [1, 1], [2.0, 3.0], (2, 2), sum_duplicates=False)
+    assert last.get(0, 1) == 3.0
+
+
+def test_products_match_dense(backend):
+    dense = _random_dense(30, 20, 0.1, 1)
+    sparse = SparseMatrix.from_matrix(dense)
+    v = Vector([random.Random(2).uniform(-1, 1) for _ in range(20)])
+    assert sparse.multiply_vector(v).components == pytest.approx(dense.multiply_vector(v).components)
+    other = _random_dense(20, 4, 1.0, 3)
+    product = sparse.multiply_matrix(other)
+    expected = dense.multiply_matrix(other)
+    for got, want in zip(product.data, expected.data):
+        assert got == pytest.approx(want)
+
+
+def test_empty_rows(backend):
+    sparse = SparseMatrix.from_coo([2], [0], [5.0], (4, 3))
+    assert sparse.multiply_vector(Vector([1, 1, 1])).components == pytest.approx([0, 0, 5, 0])
+
+
+def test_invalid_input():
+    with pytest.raises(ValueError):
+        SparseMatrix([1.0], [3], [0, 1], (1, 3))          # column out of range
+    with pytest.raises(ValueError):
+        SparseMatrix([1.0], [0], [0, 0], (1, 3))          # indptr doesn't end at nnz
+    with pytest.raises(ValueError):
+        SparseMatrix.from_coo([0], [5], [1.0], (2, 2))
+    with pytest.raises(ValueError):
+        SparseMatrix.identity(3).multiply_vector(Vector([1, 2]))
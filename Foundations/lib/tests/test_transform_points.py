@@ -0,0 +1,46 @@
+"""transform_points accepts every documented point layout and returns the same layout."""
+
+from array import array
+
+import pytest
+
+from linear_algebra.matrix import Matrix
+from linear_algebra.matrix3D import Matrix3D
+from linear_algebra.vector import Vector
+from linear_algebra.Vector3D import Vector3D
+
+SCALE = Matrix3D.scaling(2, 3, 4)
+EXPECTED = [2.0, 6.0, 12.0, 8.0, 15.0, 24.0]
+VALUES = [1, 2, 3, 4, 5, 6]
+
+
+@pytest.mark.parametrize("typecode", ["d", "f", "i", "q"])
+def test_typed_buffers(typecode):
+    assert list(SCALE.transform_points(array(typecode, VALUES))) == EXPECTED
+    assert list(SCALE.transform_points(memoryview(array(typecode, VALUES)))) == EXPECTED
+
+
+def test_raw_double_bytes():
+    assert list(SCALE.transform_points(array('d', VALUES).tobytes())) == EXPECTED
+    with pytest.raises(ValueError):
+        SCALE.transform_points(b"\0" * 12)
+
+
+def test_vectors_keep_their_class():
+    out = SCALE.transform_points([Vector3D([1, 2, 3]), Vector3D([4, 5, 6])])
+    assert all(type(v) is Vector3D for v in out)
+    assert [x for v in out for x in v.components] == EXPECTED
+
+
+def test_rectangular_and_partial_points():
+    m = Matrix([[1, 2, 3], [4, 5, 6]])
+    assert list(m.transform_points(array('d', [1, 0, 0, 0, 1, 0]))) == [1, 4, 2, 5]
+    assert type(m.transform_points([Vector([1, 1, 1])])[0]) is Vector
+    with pytest.raises(ValueError):
+        m.transform_points(array('d', [1, 2, 3, 4]))
+
+
+def test_ndarray():
+    np = pytest.importorskip("numpy")
+    out = SCALE.transform_points(np.array(VALUES, dtype=np.float32).reshape(2, 3))
+    assert out.shape == (2, 3) and out.ravel().tolist() == EXPECTED
@@ -0,0 +1,73 @@
+"""VectorBatch row operations agree with the per-Vector methods on every backend."""
+
+import math
+from array import array
+
+import pytest
+
+from linear_algebra.backend import use_backend
+from linear_algebra.vector import Vector
+from linear_algebra.vector_batch import VectorBatch
+from linear_algebra.Vector3D import Vector3D
+
+ROWS = [[3.0, 4.0, 0.0], [1.0, -2.0, 2.0], [0.0, 0.0, 0.0]]
+
+
+@pytest.fixture(params=["python", "numpy"])
+def backend(request):
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+    with use_backend(request.param):
+        yield request.param
+
+
+def test_rows_match_vectors(backend):
+    batch = VectorBatch(ROWS)
+    other = VectorBatch([[1.0, 0.0, 0.0], [0.0, 1.0, 1.0], [1.0, 1.0, 1.0]])
+    up = Vector3D([0.0, 0.0, 1.0])
+    assert list(batch.norms()) == pytest.approx([5.0, 3.0, 0.0])
+    assert list(batch.dot(other)) == pytest.approx([3.0, 0.0, 0.0])
+    assert list(batch.dot(up)) == pytest.approx([0.0, 2.0, 0.0])
+    assert list(batch.normalize()[0].components) == pytest.approx([0.6, 0.8, 0.0])
+    assert list(batch.normalize()[2].components) == [0.0, 0.0, 0.0]
+    angles = batch.angle_between(other)
+    assert angles[0] == pytest.approx(math.degrees(math.acos(0.6))) and math.isnan(angles[2])
+    assert list(batch.project_onto(up).buffer) == pytest.approx([0, 0, 0, 0, 0, 2, 0, 0, 0])
+    for i, row in enumerate(batch.cross(up)):
+        assert list(row.components) == pytest.approx(list(Vector3D(ROWS[i]).cross(up).components))
+    gram = batch.pairwise_dots()
+    assert gram.data[1] == pytest.approx([-5.0, 9.0, 0.0])
+
+
+def test_items_keep_their_class():
+    assert type(VectorBatch(ROWS)[0]) is Vector3D
+    assert type(VectorBatch([[1, 2]])[-1]) is Vector
+
+
+def test_shape_errors():
+    batch = VectorBatch(ROWS)
+    with pytest.raises(ValueError):
+        batch.dot(VectorBatch([[1.0, 2.0, 3.0]] * 2))
+    with pytest.raises(ValueError):
+        batch.dot(Vector([1, 2]))
+    with pytest.raises(ValueError):
+        VectorBatch([[1, 2]]).cross(Vector([1, 2]))
+    with pytest.raises(ValueError):
+        VectorBatch.from_buffer(array('d', range(5)), 2)
+
+
+def test_from_buffer_converts_any_ndarray():
+    np = pytest.importorskip("numpy")
+    expected = [float(x) for x in range(6)]
+    assert list(VectorBatch.from_buffer(np.arange(6, dtype=np.int64), 3).buffer) == expected
+    assert list(VectorBatch.from_buffer(np.arange(6, dtype=np.float32), 3).buffer) == expected
+    strided = np.arange(12, dtype=float)[::2]
+    assert list(VectorBatch.from_buffer(strided, 2).buffer) == [float(x) for x in range(0, 12, 2)]
+    points = np.arange(6.0).reshape(2, 3)
+    assert VectorBatch.from_numpy(points.T).to_numpy().tolist() == points.T.tolist()
+
+
+def test_normalize_zero_vector():
+    assert Vector3D([0, 3, 4]).normalize().components.tolist() == pytest.approx([0, 0.6, 0.8])
+    with pytest.raises(ValueError):
+        Vector([0, 0]).normalize()
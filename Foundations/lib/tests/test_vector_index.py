@@ -0,0 +1,68 @@
+"""VectorIndex: approximate modes agree with the exact scan through adds, removes and id reuse."""
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from linear_algebra.vector_index import VectorIndex  # noqa: E402
+
+
+def _index(approximate, metric="euclidean", n=2000, dim=3):
+    rng = np.random.default_rng(0)
+    X = rng.standard_normal((n, dim))
+    index = VectorIndex(dim, metric=metric, approximate=approximate, rebuild_fraction=0.5)
+    index.add(X)
+    return index, X
+
+
+@pytest.mark.parametrize("metric", ["euclidean", "cosine"])
+def test_kdtree_matches_exact(metric):
+    index, X = _index("kdtree", metric)
+    index.remove(list(range(0, 100, 3)))
+    for q in X[200:210]:
+        tree = index.query(q, 5)
+        exact = index.query(q, 5, exact=True)
+        assert [i for i, _ in tree] == [i for i, _ in exact]
+
+
+def test_kdtree_reused_id_returns_new_vector():
+    index, X = _index("kdtree")
+    index.query(X[0], 1)                     # build the tree
+    replacement = X[5] + 10.0
+    index.remove([5])
+    index.add(replacement[None, :], ids=[5])
+    result = index.query(X[5], 10)
+    assert [i for i, _ in result].count(5) <= 1
+    assert (5, 0.0) not in result
+    assert index.query(replacement, 1) == [(5, pytest.approx(0.0))]
+
+
+def test_remove_numpy_integer_id():
+    index, _ = _index(None, n=10)
+    index.remove(np.int64(3))
+    assert 3 not in index and len(index) == 9
+
+
+def test_lsh_removed_ids_never_returned():
+    index, X = _index("lsh", "cosine", dim=16)
+    index.remove(list(range(50)))
+    for q in X[:50]:
+        assert all(i >= 50 for i, _ in index.query(q, 5))
+
+
+@pytest.mark.parametrize("approximate", [None, "kdtree"])
+def test_plain_list_query_and_add(approximate):
+    index, X = _index(approximate, n=50)
+    assert index.query(X[7].tolist(), 1) == index.query(X[7], 1)
+    (new_id,) = index.add([5.0, 5.0, 5.0])
+    assert index.query((5, 5, 5), 1)[0][0] == new_id
+
+
+def test_remove_is_all_or_nothing():
+    index, X = _index("kdtree", n=20)
+    with pytest.raises(KeyError):
+        index.remove([1, 2, 999])
+    assert len(index) == 20 and all(i in index for i in (1, 2))
+    assert index.query(X[1], 1, exact=True)[0][0] == 1
+    index.remove([4, 4])
+    assert 4 not in index and len(index) == 19
@@ -1,10 +1,10 @@
 
-from matrix3D import Matrix3D
-from Vector3D import Vector3D
-import matplotlib.pyplot as plt
-from mpl_toolkits.mplot3d import Axes3D
+import time
+from linear_algebra import instrument
+from linear_algebra.matrix3D import Matrix3D
 import numpy as np
-from matplotlib.animation import FuncAnimation
+from .interpolation import interpolate_frames
+from .export import export_animation
 
 
 def lerp_matrix(start: Matrix3D, end: Matrix3D, t: float):
@@ -29,179 +29,215 @@ def lerp_matrix(start: Matrix3D, end: Matrix3D, t: float):
 
 
 
-# Create 3D Plot
-fig = plt.figure()
-ax = fig.add_subplot(111, projection='3d')
-#Define Basis Vectors
-i_hat = Vector3D([1,0,0])
-j_hat = Vector3D([0,1,0])
-k_hat = Vector3D([0,0,1])
-t_mat = Matrix3D.rotation(45, "z")
-
-i_transformed = t_mat.multiply_vector(i_hat)
-j_transformed = t_mat.multiply_vector(j_hat)
-k_transformed = t_mat.multiply_vector(k_hat)
-scale = 3
-
-quiver_i = ax.quiver(0,0,0,i_transformed.components[0]*scale,i_transformed.components[1]*scale,i_transformed.components[2]*scale,
-          color='orange', arrow_length_ratio=0.1, linewidth=3, label='i-hat')
-quiver_j = ax.quiver(0,0,0,j_transformed.components[0]*scale, j_transformed.components[1]*scale, j_transformed.components[2]*scale,
-          color='yellow', arrow_length_ratio=0.1, linewidth=3, label='j-hat')
-quiver_k = ax.quiver(0,0,0,k_transformed.components[0]*scale, k_transformed.components[1]*scale, k_transformed.components[2]*scale,
-          color='cyan', arrow_length_ratio=0.1, linewidth=3, label='k-hat')
-quivers = {'i' : quiver_i, 'j' : quiver_j, 'k' : quiver_k}
-
-x_points = np.linspace(-2,2,9)
-x_vectors = [Vector3D([x,0,0]) for x in x_points]
-transformed_x = [t_mat.multiply_vector(x) for x in x_vectors]
-x_coords = [vector.components[0] for vector in transformed_x]
-y_coords = [vector.components[1] for vector in transformed_x]
-z_coords = [vector.components[2] for vector in transformed_x]
-
- # Y-axis line
-y_points = np.linspace(-2, 2, 9)
-y_vectors = [Vector3D([0, y, 0]) for y in y_points]
-transformed_y = [t_mat.multiply_vector(y) for y in y_vectors]
-"""
-y_coords_t = [v.components[0] for v in transformed_y]
-y_coords_t_y = [v.components[1] for v in transformed_y]
-y_coords_t_z = [v.components[2] for v in transformed_y]
-ax.plot(y_coords_t, y_coords_t_y, y_coords_t_z, color='magenta', label='y-axis line')
-"""
-# Z-axis line
-z_points = np.linspace(-2, 2, 9)
-z_vectors = [Vector3D([0, 0, z]) for z in z_points]
-transformed_z = [t_mat.multiply_vector(z) for z in z_vectors]
-"""
-z_coords_t = [v.components[0] for v in transformed_z]
-z_coords_t_y = [v.components[1] for v in transformed_z]
-z_coords_t_z = [v.components[2] for v in transformed_z]
-ax.plot(z_coords_t, z_coords_t_y, z_coords_t_z, color='lime', label='z-axis line')
-
-ax.plot(x_coords, y_coords, z_coords, color='magenta')
-"""
-
-"""
-#plot as arrows from origin
-#ax.quiver - (start_x, start_y, start_z, dir_x dir_y dir_z
-ax.quiver(0,0,0,1,0,0, color='r', arrow_length_ratio=0.1, label='i-hat')
-ax.quiver(0,0,0,0,1,0, color='g', arrow_length_ratio=0.1, label='j-hat')
-ax.quiver(0,0,0,0,0,1, color='b', arrow_length_ratio=0.1, label='k-hat')
-"""
-x_lines = []
-y_lines = []
-z_lines = []
-grid_positions = np.linspace(-2,2,9)
-for y in grid_positions:
-    for z in grid_positions:
-        x_vectors = [Vector3D([x,y,z]) for x in x_points]
-        transformed_x = [t_mat.multiply_vector(v) for v in x_vectors]
-        grid_x = [x.components[0] for x in transformed_x]
-        grid_y = [x.components[1] for x in transformed_x]
-        grid_z = [x.components[2] for x in transformed_x]
-
-        line = ax.plot(grid_x, grid_y, grid_z,color='green', alpha=.3)
-        x_lines.append(line)
-        
-
-for x in grid_positions:
-    for z in grid_positions:
-        y_vectors = [Vector3D([x,y,z]) for y in y_points]
-        transformed_y = [t_mat.multiply_vector(v) for v in y_vectors]
-        grid_x = [y.components[0] for y in transformed_y]
-        grid_y = [y.components[1] for y in transformed_y]
-        grid_z = [y.components[2] for y in transformed_y]
-
-        line = ax.plot(grid_x, grid_y, grid_z, color='blue', alpha=.3)
-        y_lines.append(line)
-        
-
-for x in grid_positions:
-    for y in grid_positions:
-        z_vectors = [Vector3D([x,y,z]) for z in z_points]
-        transformed_z = [t_mat.multiply_vector(v) for v in z_vectors]
-        grid_x = [z.components[0] for z in transformed_z]
-        grid_y = [z.components[1] for z in transformed_z]
-        grid_z = [z.components[2] for z in transformed_z]
-
-        line = ax.plot(grid_x, grid_y, grid_z, color='red', alpha=.3)
-        z_lines.append(line)
-
-# set axis limits and labels
-ax.set_xlim([-2,2])
-ax.set_ylim([-2,2])
-ax.set_zlim([-2,2])
-ax.set_xlabel('X')
-ax.set_ylabel('Y')
-ax.set_zlabel('Z')
-
-def update(frame):
-    t = frame/max_frames
-    quivers['i'].remove()
-    quivers['j'].remove()
-    quivers['k'].remove()
-
-    start = Matrix3D.identity()
-    current_matrix = lerp_matrix(start,t_mat, t)
-
-    idx = 0
-    idy = 0
-    idz = 0
-    #update x parallel lines
-    for y in grid_positions:
-        for z in grid_positions:
-            x_vectors = [Vector3D([x,y,z]) for x in x_points]
-            transformed = [current_matrix.multiply_vector(v) for v in x_vectors]
-            xs = [v.components[0] for v in transformed]
-            ys = [v.components[1] for v in transformed]
-            zs = [v.components[2] for v in transformed]
-
-            x_lines[idx][0].set_data_3d(xs,ys,zs)
-            idx+=1
-    #update y parallel lines
-    for x in grid_positions:
-        for z in grid_positions:
-            y_vectors = [Vector3D([x,y,z]) for y in y_points]
-            transformed = [current_matrix.multiply_vector(v) for v in y_vectors]
-            xs = [v.components[0] for v in transformed]
-            ys = [v.components[1] for v in transformed]
-            zs = [v.components[2] for v in transformed]
-
-            y_lines[idy][0].set_data_3d(xs,ys,zs)
-            idy+=1
-    #update z parallel lines
-    for x in grid_positions:
-        for y in grid_positions:
-            z_vectors = [Vector3D([x,y,z]) for z in z_points]
-            transformed = [current_matrix.multiply_vector(v) for v in z_vectors]
-            xs = [v.components[0] for v in transformed]
-            ys = [v.components[1] for v in transformed]
-            zs = [v.components[2] for v in transformed]
-
-            z_lines[idz][0].set_data_3d(xs,ys,zs)
-            idz+=1
-    #update basis vectors
-    i_transformed = current_matrix.multiply_vector(i_hat)
-    j_transformed = current_matrix.multiply_vector(j_hat)
-    k_transformed = current_matrix.multiply_vector(k_hat)
-
-    quivers['i'] = ax.quiver(0,0,0,i_transformed.components[0]*scale,i_transformed.components[1]*scale,i_transformed.components[2]*scale,
-          color='orange', arrow_length_ratio=0.1, linewidth=3, label='i-hat')
-    quivers['j'] = ax.quiver(0,0,0,j_transformed.components[0]*scale, j_transformed.components[1]*scale, j_transformed.components[2]*scale,
-              color='yellow', arrow_length_ratio=0.1, linewidth=3, label='j-hat')
-    quivers['k'] = ax.quiver(0,0,0,k_transformed.components[0]*scale, k_transformed.components[1]*scale, k_transformed.components[2]*scale,
-              color='cyan', arrow_length_ratio=0.1, linewidth=3, label='k-hat')
+MAX_FRAMES = 60
+FPS = 20
+ARROW_RATIO = 0.1     # arrow head length as a fraction of the arrow
+BASIS_COLORS = ['orange', 'yellow', 'cyan']
 
-    
 
-    return []
-max_frames = 60
-anim = FuncAnimation(fig, update, frames=max_frames, interval=50, blit=False)
-anim.save('transformation_animation.gif', writer='pillow', fps=20)
-print("Animation saved!")
-
-plt.show()
-start = Matrix3D([[1,1,1],[1,1,1],[1,1,1]])
-end = Matrix3D([[2,2,2],[2,2,2],[2,2,2]])
-inter = lerp_matrix(start,end,.5)
-print(inter)
\ No newline at end of file
+def grid_lines_3d(extent: float = 2, count: int = 9) -> np.ndarray:
+    """
+    Every line of a 3D grid as one (lines, 2, 3) block of end points.
+
+    Linear maps keep lines straight, so each line only needs its two ends.
+    Order: x-parallel lines, then y-parallel, then z-parallel.
+    """
+    positions = np.linspace(-extent, extent, count)
+    a, b = (g.ravel() for g in np.meshgrid(positions, positions, indexing='ij'))
+    lines = np.empty((3, count * count, 2, 3))
+    for axis, (u, v) in enumerate(((1, 2), (0, 2), (0, 1))):
+        lines[axis, :, :, axis] = [-extent, extent]
+        lines[axis, :, :, u] = a[:, None]
+        lines[axis, :, :, v] = b[:, None]
+    return lines.reshape(-1, 2, 3)
+
+
+def arrow_segments(vectors: np.ndarray, ratio: float = ARROW_RATIO) -> np.ndarray:
+    """
+    Shaft plus two head strokes for arrows from the origin, as (3*N, 2, 3) segments.
+
+    Lets the basis arrows live in one Line3DCollection whose segments are
+    replaced each frame, instead of removing and re-creating ax.quiver artists.
+    """
+    lengths = np.linalg.norm(vectors, axis=1, keepdims=True)
+    direction = vectors / np.where(lengths == 0, 1, lengths)
+    # any direction perpendicular to the arrow works for the head strokes
+    helper = np.where(np.abs(direction[:, 2:3]) < 0.9, [[0, 0, 1]], [[1, 0, 0]])
+    side = np.cross(direction, helper)
+    side /= np.linalg.norm(side, axis=1, keepdims=True)
+    head = ratio * lengths
+    back = vectors - head * direction
+    segments = np.empty((len(vectors), 3, 2, 3))
+    segments[:, :, 1] = vectors[:, None]           # every stroke ends at the tip
+    segments[:, 0, 0] = 0                          # shaft starts at the origin
+    segments[:, 1, 0] = back + 0.5 * head * side
+    segments[:, 2, 0] = back - 0.5 * head * side
+    return segments.reshape(-1, 2, 3)
+
+
+def build_scene(t_mat: Matrix3D = None, max_frames: int = MAX_FRAMES, mode: str = "linear",
+                grid_size: int = 9):
+    """
+    Build the 3D figure and its per-frame update function.
+
+    Every frame's matrix and transformed points are computed once up front
+    (see interpolation.py). The grid is three Line3DCollections (one per
+    direction) and the basis arrows are one more; update(frame) only swaps
+    their segment arrays in place and returns them, so FuncAnimation can
+    blit just those artists over a cached background.
+
+    Args:
+        t_mat: target transformation, a Matrix3D or a 3D TransformPipeline
+            whose fused matrix is used (default: 45 degree rotation about z)
+        max_frames: number of frames from the identity towards t_mat
+        mode: "linear", "slerp" or "log" interpolation
+        grid_size: grid lines per direction (3 * grid_size**2 lines in total)
+
+    Return:
+        (fig, update)
+    """
+    if t_mat is None:
+        t_mat = Matrix3D.rotation(45, "z")
+
+    # matplotlib is only loaded once something is drawn
+    import matplotlib.pyplot as plt
+    from mpl_toolkits.mplot3d.art3d import Line3DCollection
+
+    # Create 3D Plot
+    fig = plt.figure()
+    ax = fig.add_subplot(111, projection='3d')
+    scale = 3
+
+    grid = grid_lines_3d(2, grid_size)
+    per_direction = grid_size * grid_size
+    basis = np.eye(3)
+    points = np.vstack([grid.reshape(-1, 3), basis])
+    grid_count = grid.size // 3
+
+    # Persistent artists, drawn where t_mat sends everything
+    initial = t_mat.transform_points(points)
+    initial_grid = initial[:grid_count].reshape(grid.shape)
+    grid_artists = []
+    for n, color in enumerate(['green', 'blue', 'red']):
+        lines = Line3DCollection(initial_grid[n * per_direction:(n + 1) * per_direction], colors=color, alpha=.3)
+        ax.add_collection3d(lines)
+        grid_artists.append(lines)
+    arrow_colors = np.repeat(BASIS_COLORS, 3)
+    arrows = Line3DCollection(arrow_segments(initial[grid_count:] * scale), colors=arrow_colors, linewidths=3)
+    ax.add_collection3d(arrows)
+    artists = grid_artists + [arrows]
+
+    # set axis limits and labels
+    ax.set_xlim([-2,2])
+    ax.set_ylim([-2,2])
+    ax.set_zlim([-2,2])
+    ax.set_xlabel('X')
+    ax.set_ylabel('Y')
+    ax.set_zlabel('Z')
+
+    # The grid points followed by the three basis vectors, (frames, points, 3).
+    # t = frame/max_frames, as before; mode="slerp" or "log" rotates at constant speed.
+    frames = interpolate_frames(Matrix3D.identity(), t_mat, points, max_frames, mode=mode, endpoint=False)
+
+    def update(frame):
+        # pure lookup: this frame's slab of the precomputed buffer
+        # (timers are no-ops unless an instrument.profile() is running)
+        with instrument.timer("animation.segments"):
+            frame_points = frames[frame]
+            segments = frame_points[:grid_count].reshape(grid.shape)
+            for n, lines in enumerate(grid_artists):
+                lines.set_segments(segments[n * per_direction:(n + 1) * per_direction])
+            arrows.set_segments(arrow_segments(frame_points[grid_count:] * scale))
+        # A blit draws these artists directly, skipping Axes3D.draw, which is
+        # where 3D segments normally get projected to the screen. Until the
+        # axes have been drawn once there is no projection (ax.M) yet; the
+        # first full draw projects everything anyway (export workers, init).
+        if ax.M is not None:
+            with instrument.timer("animation.projection"):
+                for artist in artists:
+                    artist.do_3d_projection()
+        return artists
+
+    return fig, update
+
+
+class FrameTimer:
+    """
+    Measures wall time between successive frames of a live animation.
+
+    Call tick() at the start of every frame; the gap between ticks is the
+    full frame time (update + draw + event loop).
+
+    Example:
+        >>> frame_timer = FrameTimer()
+        >>> ... frame_timer.tick() inside update ...
+        >>> print(frame_timer.report())   # "60 frames: mean 9.8 ms, p95 12.1 ms (102.0 fps)"
+    """
+
+    def __init__(self):
+        self.times = []
+        self._last = None
+
+    def tick(self) -> None:
+        now = time.perf_counter()
+        if self._last is not None:
+            self.times.append(now - self._last)
+        self._last = now
+
+    def report(self) -> str:
+        if not self.times:
+            return "no frames timed"
+        ordered = sorted(self.times)
+        mean = sum(ordered) / len(ordered)
+        p95 = ordered[min(len(ordered) - 1, int(0.95 * len(ordered)))]
+        return (f"{len(ordered)} frames: mean {mean * 1000:.1f} ms, p95 {p95 * 1000:.1f} ms "
+                f"({1 / mean:.1f} fps)")
+
+
+def preview(t_mat: Matrix3D = None, max_frames: int = MAX_FRAMES, mode: str = "linear",
+            grid_size: int = 9, fps: float = 60):
+    """
+    Interactive preview with blitting, reporting the measured frame time.
+
+    On backends that support it, FuncAnimation caches the static background
+    (axes, panes, labels) once and then redraws only the artists update()
+    returns. Other backends fall back to full redraws.
+
+    Args:
+        t_mat, max_frames, mode, grid_size: see build_scene
+        fps: target frame rate
+
+    Return:
+        (animation, FrameTimer); keep the animation referenced while it runs
+    """
+    from matplotlib.animation import FuncAnimation
+    fig, update = build_scene(t_mat, max_frames, mode, grid_size)
+    frame_timer = FrameTimer()
+
+    def timed_update(frame):
+        frame_timer.tick()
+        return update(frame)
+
+    anim = FuncAnimation(fig, timed_update, frames=max_frames, init_func=lambda: update(0),
+                         interval=1000 / fps, blit=fig.canvas.supports_blit)
+    return anim, frame_timer
+
+
+if __name__ == "__main__":
+    # Streams frames to disk as they are rendered (bounded memory).
+    # ANIMATION_WORKERS=N renders frames in N processes.
+    import os
+    import matplotlib.pyplot as plt
+    export_animation('transformation_animation.gif', build_scene, MAX_FRAMES, fps=FPS,
+                     workers=int(os.environ.get("ANIMATION_WORKERS", "1")))
+    print("Animation saved!")
+
+    if plt.get_backend().lower() != "agg":
+        anim, frame_timer = preview()
+        plt.show()
+        print(frame_timer.report())
+
+    start = Matrix3D([[1,1,1],[1,1,1],[1,1,1]])
+    end = Matrix3D([[2,2,2],[2,2,2],[2,2,2]])
+    inter = lerp_matrix(start,end,.5)
+    print(inter)
@@ -4,12 +4,126 @@ Visualizes how matrices transform the 2D plane.
 """
 
 import numpy as np
-import matplotlib.pyplot as plt
-from matrix import Matrix
-from vector import Vector
+from linear_algebra.matrix import Matrix
+from linear_algebra.matrix2D import Matrix2D
 
 
-def plot_transformation(matrix, title: str = "Transformation") -> None:
+def grid_lines(extent: float = 2, count: int = 9, samples: int = 2) -> np.ndarray:
+    """
+    Build a square grid as one block of line segments.
+
+    A linear transformation keeps straight lines straight, so two samples
+    (the end points) per line are enough; more samples only matter for
+    non-linear warps.
+
+    Args:
+        extent: grid spans [-extent, extent] in x and y
+        count: number of lines in each direction
+        samples: points per line
+
+    Returns:
+        (2*count x samples x 2) array: the vertical lines, then the horizontal ones
+
+    Example:
+        >>> grid_lines(2, 9).shape  # (18, 2, 2)
+    """
+    positions = np.linspace(-extent, extent, count)
+    along = np.linspace(-extent, extent, samples)
+    lines = np.empty((2, count, samples, 2))
+    lines[0, :, :, 0] = positions[:, None]   # vertical: x fixed, y runs along
+    lines[0, :, :, 1] = along
+    lines[1, :, :, 0] = along                # horizontal: y fixed, x runs along
+    lines[1, :, :, 1] = positions[:, None]
+    return lines.reshape(2 * count, samples, 2)
+
+
+def transform_grid(matrix, lines: np.ndarray) -> np.ndarray:
+    """Apply a 2x2 matrix to every point of a (lines x points x 2) block in one batched call."""
+    return matrix.transform_points(lines.reshape(-1, 2)).reshape(lines.shape)
+
+
+class TransformationFigure:
+    """
+    A reusable before/after figure for 2D transformations.
+
+    Everything that doesn't depend on the matrix (axes, limits, the
+    original grid and basis vectors, legends) is drawn once. draw() only
+    swaps the transformed grid's segments, moves the two transformed basis
+    arrows and retitles the right panel, so rendering many matrices reuses
+    the same figure, axes and artists.
+
+    Attributes:
+        fig: the matplotlib Figure
+        lines: (lines x points x 2) untransformed grid
+
+    Example:
+        >>> view = TransformationFigure(Figure(figsize=(12, 5)))
+        >>> for name, M in transforms.items():
+        ...     view.draw(M, name).savefig(f"{name}.png")
+    """
+
+    def __init__(self, fig=None, grid_size: int = 9, extent: float = 2, limit: float = 3):
+        """
+        Lay out the two panels and draw the static "Original" side.
+
+        Args:
+            fig: Figure to draw into (default: a new 12x5 pyplot figure)
+            grid_size: number of grid lines in each direction
+            extent: grid spans [-extent, extent]
+            limit: both axes show [-limit, limit]
+        """
+        from matplotlib.collections import LineCollection
+        if fig is None:
+            import matplotlib.pyplot as plt
+            fig = plt.figure(figsize=(12, 5))
+        self.fig = fig
+        ax1, ax2 = self.fig.subplots(1, 2)  # 1 row, 2 columns
+        self.lines = grid_lines(extent, grid_size)
+
+        # Plot original grid and basis vectors on ax1
+        ax1.add_collection(LineCollection(self.lines, colors='b', linewidths=0.5))
+        ax1.arrow(0, 0, 1, 0, head_width=0.1, head_length=0.1, fc='red', ec='red', label='i-hat')
+        ax1.arrow(0, 0, 0, 1, head_width=0.1, head_length=0.1, fc='green', ec='green', label='j-hat')
+        ax1.set_title('Original')
+
+        # Transformed side: artists created once, updated by draw()
+        self._grid = ax2.add_collection(LineCollection(self.lines, colors='b', linewidths=0.5))
+        self._i_hat = ax2.arrow(0, 0, 1, 0, head_width=0.1, head_length=0.1, fc='red', ec='red', label='i-hat')
+        self._j_hat = ax2.arrow(0, 0, 0, 1, head_width=0.1, head_length=0.1, fc='green', ec='green', label='j-hat')
+        self._title = ax2.set_title('')
+
+        for ax in (ax1, ax2):
+            ax.set_xlim(-limit, limit)
+            ax.set_ylim(-limit, limit)
+            ax.set_aspect('equal')
+            ax.grid(True, alpha=0.3)
+            ax.legend()
+        self.fig.tight_layout()
+
+    def draw(self, matrix, title: str = "Transformation") -> 'TransformationFigure':
+        """
+        Show a new matrix on the right panel.
+
+        Args:
+            matrix: 2x2 Matrix/Matrix2D
+            title: Description of the transformation
+
+        Returns:
+            self (so calls like view.draw(M, t).savefig(path) chain)
+        """
+        # one batched transform for the whole grid, one for both basis vectors
+        self._grid.set_segments(transform_grid(matrix, self.lines))
+        i_hat, j_hat = matrix.transform_points(np.eye(2))
+        self._i_hat.set_data(dx=i_hat[0], dy=i_hat[1])
+        self._j_hat.set_data(dx=j_hat[0], dy=j_hat[1])
+        self._title.set_text(f'After {title}')
+        return self
+
+    def savefig(self, path, **kwargs) -> None:
+        self.fig.savefig(path, **kwargs)
+
+
+def plot_transformation(matrix, title: str = "Transformation", grid_size: int = 9) -> None:
     """
     Visualize how a matrix transforms the 2D plane.
 
@@ -23,6 +137,8 @@ def plot_transformation(matrix, title: str = "Transformation") -> None:
     Args:
         matrix: Matrix object to visualize
         title: Description of the transformation
+        grid_size: Number of grid lines in each direction (200 is fine:
+            the whole grid is one batched transform and one LineCollection)
 
     Visual Elements:
         - Blue grid lines show how space is warped
@@ -30,80 +146,34 @@ def plot_transformation(matrix, title: str = "Transformation") -> None:
         - Green arrow (j-hat): y-axis basis vector [0,1]
 
     Example Usage:
-        >>> M = Matrix.scaling(2, 0.5)
+        >>> M = Matrix2D.scaling(2, 0.5)
         >>> plot_transformation(M, "Scaling (2x, 0.5y)")
         # Shows original square grid stretched horizontally, compressed vertically
     """
-    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(12, 5))  # 1 row, 2 columns
-
-    # Create grid points
-    x_points = np.linspace(-2, 2, 9)
-    y_points = np.linspace(-2, 2, 9)
-
-    # Plot original grid on ax1
-    for x in x_points:
-        ax1.plot([x, x], [y_points[0], y_points[-1]], 'b-', linewidth=0.5)
-    for y in y_points:
-        ax1.plot([x_points[0], x_points[-1]], [y, y], 'b-', linewidth=0.5)
-
-    # Plot basis vectors on ax1 (original)
-    ax1.arrow(0, 0, 1, 0, head_width=0.1, head_length=0.1, fc='red', ec='red', label='i-hat')
-    ax1.arrow(0, 0, 0, 1, head_width=0.1, head_length=0.1, fc='green', ec='green', label='j-hat')
-    ax1.set_xlim(-3, 3)
-    ax1.set_ylim(-3, 3)
-    ax1.set_aspect('equal')
-    ax1.grid(True, alpha=0.3)
-    ax1.set_title('Original')
-    ax1.legend()
-
-    # Plot transformed grid on ax2
-    for x in x_points:
-        # Transform vertical line
-        points = np.array([[x, y] for y in y_points])
-        transformed = np.array([matrix.multiply_vector(Vector(p)).components for p in points])
-        ax2.plot(transformed[:, 0], transformed[:, 1], 'b-', linewidth=0.5)
-
-    for y in y_points:
-        # Transform horizontal line
-        points = np.array([[x, y] for x in x_points])
-        transformed = np.array([matrix.multiply_vector(Vector(p)).components for p in points])
-        ax2.plot(transformed[:, 0], transformed[:, 1], 'b-', linewidth=0.5)
-
-    # Plot transformed basis vectors
-    i_hat = matrix.multiply_vector(Vector([1, 0])).components
-    j_hat = matrix.multiply_vector(Vector([0, 1])).components
-    ax2.arrow(0, 0, i_hat[0], i_hat[1], head_width=0.1, head_length=0.1, fc='red', ec='red', label='i-hat')
-    ax2.arrow(0, 0, j_hat[0], j_hat[1], head_width=0.1, head_length=0.1, fc='green', ec='green', label='j-hat')
-    ax2.set_xlim(-3, 3)
-    ax2.set_ylim(-3, 3)
-    ax2.set_aspect('equal')
-    ax2.grid(True, alpha=0.3)
-    ax2.set_title(f'After {title}')
-    ax2.legend()
-
-    plt.tight_layout()
+    import matplotlib.pyplot as plt
+    TransformationFigure(grid_size=grid_size).draw(matrix, title)
     plt.show()
 
 
 if __name__ == "__main__":
     # Test 1: Scaling transformation
     print("Test 1: Scaling Transformation (2x, 0.5y)")
-    M = Matrix.scaling(2, 0.5)
+    M = Matrix2D.scaling(2, 0.5)
     plot_transformation(M, "Scaling (2x, 0.5y)")
 
     # Test 2: Rotation transformation
     print("\nTest 2: Rotation 45 degrees")
-    R = Matrix.rotation(45)
-    plot_transformation(R, "Rotation 45")
+    R = Matrix2D.rotation(45)
+    plot_transformation(R, "Rotation 45°")
 
     # Test 3: Rotation 90 degrees
     print("\nTest 3: Rotation 90 degrees")
-    R90 = Matrix.rotation(90)
-    plot_transformation(R90, "Rotation 90")
+    R90 = Matrix2D.rotation(90)
+    plot_transformation(R90, "Rotation 90°")
 
     # Test 4: Shear transformation
     print("\nTest 4: Shear Transformation")
-    Sh = Matrix.shear(1)
+    Sh = Matrix2D.shear(1)
     plot_transformation(Sh, "Shear (factor=1)")
 
     # Test 5: Custom transformation
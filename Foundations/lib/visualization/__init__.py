@@ -0,0 +1,58 @@
+"""
+visualization: plots and animations of linear transformations
+Goal: Import for free, pay for matplotlib only when something is drawn
+
+Public names are resolved on first access through a module-level
+__getattr__ (PEP 562). The submodules themselves import matplotlib inside
+the functions that draw, so even `from visualization import
+plot_transformation` loads only NumPy and linear_algebra; matplotlib
+arrives with the first figure.
+
+Example:
+    >>> from visualization import plot_transformation    # no matplotlib yet
+    >>> plot_transformation(Matrix2D.rotation(45), "Rotation 45°")
+
+Scripts run as modules from the lib directory:
+    python -m visualization.Animation
+    python -m visualization.batch_render manifest.json -o renders/
+"""
+
+import importlib
+
+# public name -> submodule that defines it
+_EXPORTS = {
+    "TransformationFigure": "TransformationVisualizer",
+    "plot_transformation": "TransformationVisualizer",
+    "grid_lines": "TransformationVisualizer",
+    "transform_grid": "TransformationVisualizer",
+    "build_scene": "Animation",
+    "preview": "Animation",
+    "lerp_matrix": "Animation",
+    "FrameTimer": "Animation",
+    "interpolate_matrices": "interpolation",
+    "interpolate_frames": "interpolation",
+    "export_animation": "export",
+    "render_frame": "export",
+    "load_manifest": "batch_render",
+    "render_batch": "batch_render",
+}
+
+_SUBMODULES = ("Animation", "TransformationVisualizer", "batch_render", "export", "interpolation")
+
+__all__ = sorted(_EXPORTS)
+
+
+def __getattr__(name: str):
+    """Import the submodule behind `name` on first use and cache the result in this module."""
+    if name in _EXPORTS:
+        value = getattr(importlib.import_module(f".{_EXPORTS[name]}", __name__), name)
+    elif name in _SUBMODULES:
+        value = importlib.import_module(f".{name}", __name__)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list:
+    return sorted(set(globals()) | set(_EXPORTS) | set(_SUBMODULES))
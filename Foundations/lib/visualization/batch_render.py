@@ -0,0 +1,164 @@
+"""
+Batch Render: headless PNG rendering of many transformations
+Goal: Turn a manifest of thousands of matrices into plot_transformation images quickly
+
+Each worker process switches to the Agg backend (the serial path uses an
+explicit Agg canvas instead, leaving the caller's backend alone), builds one
+TransformationFigure, and then only redraws the transformed grid and basis
+arrows for each matrix before saving a PNG. No figure, axes or static
+artist is created more than once per worker.
+
+Manifest formats:
+    JSON  - a list of {"name": ..., "matrix": [[a, b], [c, d]], "title": ...}
+            ("name" and "title" optional), or an object {name: matrix}
+    NPY   - an (N x 2 x 2) array; images are named transform_00000.png, ...
+
+Usage:
+    python -m visualization.batch_render manifest.json -o renders/ --workers 4   # from lib/
+    python -m visualization.batch_render matrices.npy -o renders/ --grid-size 50 --dpi 80
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+
+def load_manifest(path: str) -> list:
+    """
+    Read a manifest into a list of (name, title, rows) entries.
+
+    Args:
+        path: .json or .npy file
+
+    Returns:
+        List of (name, title, matrix rows as nested lists)
+
+    Raises:
+        ValueError: If the format or a matrix shape isn't supported, an
+            entry isn't an object, or a name is repeated or isn't a plain
+            file name (names become <out_dir>/<name>.png)
+    """
+    extension = os.path.splitext(path)[1].lower()
+    if extension == ".npy":
+        matrices = np.load(path)
+        if matrices.ndim != 3 or matrices.shape[1:] != (2, 2):
+            raise ValueError(f"Expected an N x 2 x 2 array, got shape {matrices.shape}")
+        return [(f"transform_{i:05d}", f"transform {i}", m.tolist()) for i, m in enumerate(matrices)]
+    if extension != ".json":
+        raise ValueError(f"Unsupported manifest '{extension}'. Use .json or .npy")
+
+    with open(path) as f:
+        data = json.load(f)
+    if isinstance(data, dict):
+        data = [{"name": name, "matrix": matrix} for name, matrix in data.items()]
+    if not isinstance(data, list):
+        raise ValueError(f"Expected a list or an object of entries, got {type(data).__name__}")
+    entries = []
+    names = set()
+    for i, item in enumerate(data):
+        if not isinstance(item, dict):
+            raise ValueError(f"Entry {i}: expected an object with a \"matrix\", got {type(item).__name__}")
+        name = str(item.get("name", f"transform_{i:05d}"))
+        if name in ("", ".", "..") or os.sep in name or "/" in name or (os.altsep and os.altsep in name):
+            raise ValueError(f"Entry {i}: name '{name}' must be a plain file name")
+        if name in names:
+            raise ValueError(f"Entry {i}: duplicate name '{name}'")
+        names.add(name)
+        rows = item.get("matrix")
+        if (not isinstance(rows, list) or len(rows) != 2
+                or any(not isinstance(row, list) or len(row) != 2 for row in rows)):
+            raise ValueError(f"Entry '{name}': expected a 2x2 matrix")
+        entries.append((name, item.get("title", name), rows))
+    return entries
+
+
+# Worker side: one figure per process, built by the pool initializer
+_view = None
+_options = None
+
+
+def _build_view(grid_size: int, dpi: int) -> None:
+    """Build this process's figure on an explicit Agg canvas (no pyplot, no global backend switch)."""
+    global _view, _options
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+    from .TransformationVisualizer import TransformationFigure
+    figure = Figure(figsize=(12, 5))
+    FigureCanvasAgg(figure)
+    _view = TransformationFigure(figure, grid_size=grid_size)
+    _options = {"dpi": dpi}
+
+
+def _init_worker(grid_size: int, dpi: int) -> None:
+    """Pool initializer: worker processes are ours, so they can be forced onto Agg."""
+    import matplotlib
+    matplotlib.use("Agg", force=True)
+    _build_view(grid_size, dpi)
+
+
+def _render_chunk(entries: list, out_dir: str) -> int:
+    """Worker: render a list of (name, title, rows) entries into out_dir."""
+    from linear_algebra.matrix import Matrix
+    for name, title, rows in entries:
+        _view.draw(Matrix(rows), title).savefig(os.path.join(out_dir, f"{name}.png"), **_options)
+    return len(entries)
+
+
+def render_batch(entries: list, out_dir: str, workers: int = 1, grid_size: int = 9,
+                 dpi: int = 100, chunk_size: int = 16) -> dict:
+    """
+    Render every manifest entry to <out_dir>/<name>.png.
+
+    Args:
+        entries: output of load_manifest
+        out_dir: directory for the PNGs (created if missing)
+        workers: render processes; 1 renders in this process, 0 means one per CPU
+        grid_size: grid lines in each direction
+        dpi: PNG resolution
+        chunk_size: entries per task sent to a worker
+
+    Returns:
+        {"images": count, "seconds": wall time, "images_per_second": throughput}
+    """
+    os.makedirs(out_dir, exist_ok=True)
+    if workers == 0:
+        workers = os.cpu_count() or 1
+    chunks = [entries[i:i + chunk_size] for i in range(0, len(entries), chunk_size)]
+
+    start = time.perf_counter()
+    if workers <= 1:
+        _build_view(grid_size, dpi)   # the caller's matplotlib backend is left alone
+        count = sum(_render_chunk(chunk, out_dir) for chunk in chunks)
+    else:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(grid_size, dpi)) as pool:
+            count = sum(pool.map(_render_chunk, chunks, [out_dir] * len(chunks)))
+    seconds = time.perf_counter() - start
+    return {"images": count, "seconds": seconds,
+            "images_per_second": count / seconds if seconds else float('inf')}
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('manifest', help=".json or .npy manifest of 2x2 matrices")
+    parser.add_argument('-o', '--out', default="renders", help="output directory")
+    parser.add_argument('--workers', type=int, default=1, help="render processes (0 = one per CPU)")
+    parser.add_argument('--grid-size', type=int, default=9)
+    parser.add_argument('--dpi', type=int, default=100)
+    parser.add_argument('--chunk-size', type=int, default=16)
+    args = parser.parse_args()
+
+    entries = load_manifest(args.manifest)
+    stats = render_batch(entries, args.out, args.workers, args.grid_size, args.dpi, args.chunk_size)
+    print(f"Rendered {stats['images']} images in {stats['seconds']:.2f}s "
+          f"({stats['images_per_second']:.1f} images/sec) -> {args.out}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,224 @@
+"""
+Export: streaming GIF/MP4 export for transformation animations
+Goal: Keep memory flat no matter how long or large the animation is
+
+FuncAnimation.save(..., writer='pillow') renders every frame, keeps all
+of them as full RGBA images and only then writes the GIF. Here frames
+are pulled one at a time from the figure's reused Agg canvas: MP4 frames
+are piped straight to ffmpeg's stdin, and GIF frames are quantized to
+one byte per pixel as Pillow encodes them, so only a few full frames
+are ever alive.
+
+Frames can also be rendered by worker processes. Each worker builds its
+own copy of the scene once and renders contiguous chunks of frames; the
+parent writes chunks strictly in frame order and keeps at most
+2 * workers chunks in flight.
+
+A scene is a zero-argument callable returning (fig, update), where
+update(frame) moves the artists to that frame. For workers it must be
+picklable, i.e. a module-level function.
+
+Example:
+    >>> def scene():
+    ...     fig, ax = plt.subplots()
+    ...     ...
+    ...     return fig, update
+    >>> export_animation("out.gif", scene, frames=600, fps=20, workers=4)
+
+Rendering only needs an Agg-based canvas (Agg itself, or TkAgg/QtAgg/...),
+so it works headless with MPLBACKEND=Agg.
+"""
+
+import os
+import shutil
+import subprocess
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+
+def render_frame(fig) -> np.ndarray:
+    """
+    Draw a figure and return its RGBA pixels.
+
+    Returns:
+        (height x width x 4) uint8 view of the canvas buffer. The canvas
+        reuses this memory, so it is only valid until the next draw.
+    """
+    fig.canvas.draw()
+    return np.asarray(fig.canvas.buffer_rgba())
+
+
+class GifStreamWriter:
+    """
+    GIF writer fed by an iterator of frames.
+
+    Each frame is quantized to its own 256-color palette and handed to
+    Pillow's public multi-frame save (save_all with append_images), which
+    pulls frames from the iterator as it encodes. Pillow keeps the encoded
+    frames (one byte per pixel, cropped to what changed since the previous
+    frame) until the file is written, and merges identical consecutive
+    frames into one longer frame.
+    """
+
+    def __init__(self, path: str, fps: float, loop: int = 0):
+        from PIL import Image  # Pillow ships with matplotlib
+        self._image = Image
+        self._path = path
+        self._duration = int(round(1000 / fps))
+        self._loop = loop
+
+    def write_all(self, frames) -> None:
+        """
+        Encode every RGBA frame of an iterator into the GIF.
+
+        Raises:
+            ValueError: If the iterator yields no frames
+        """
+        images = (self._image.fromarray(np.ascontiguousarray(rgba[..., :3])).quantize(colors=256)
+                  for rgba in frames)
+        first = next(images, None)
+        if first is None:
+            raise ValueError("A GIF needs at least one frame")
+        first.save(self._path, save_all=True, append_images=images,
+                   duration=self._duration, loop=self._loop)
+
+
+class FFMpegStreamWriter:
+    """
+    Pipe raw RGBA frames into ffmpeg (H.264 MP4 by default).
+
+    ffmpeg is started on the first frame, whose size sets the video size.
+
+    Raises:
+        RuntimeError: If ffmpeg isn't installed
+    """
+
+    def __init__(self, path: str, fps: float, ffmpeg: str = None, codec: str = "libx264", extra_args=()):
+        import matplotlib
+        ffmpeg = ffmpeg or matplotlib.rcParams["animation.ffmpeg_path"]
+        if shutil.which(ffmpeg) is None:
+            raise RuntimeError(f"MP4 export needs ffmpeg on PATH (looked for '{ffmpeg}')")
+        # the frame size ("-s") goes between these once the first frame arrives
+        self._input = [ffmpeg, "-y", "-loglevel", "error", "-f", "rawvideo", "-pix_fmt", "rgba"]
+        self._output = ["-r", str(fps), "-i", "-",
+                        "-c:v", codec, "-pix_fmt", "yuv420p",
+                        # yuv420p needs even dimensions
+                        "-vf", "pad=ceil(iw/2)*2:ceil(ih/2)*2",
+                        *extra_args, path]
+
+    def write_all(self, frames) -> None:
+        """
+        Stream every RGBA frame of an iterator into ffmpeg's stdin.
+
+        Raises:
+            RuntimeError: If ffmpeg exits with an error
+        """
+        process = None
+        try:
+            for rgba in frames:
+                if process is None:
+                    height, width = rgba.shape[:2]
+                    process = subprocess.Popen([*self._input, "-s", f"{width}x{height}", *self._output],
+                                               stdin=subprocess.PIPE)
+                process.stdin.write(memoryview(np.ascontiguousarray(rgba)).cast("B"))
+        finally:
+            if process is not None:
+                process.stdin.close()
+                if process.wait():
+                    raise RuntimeError(f"ffmpeg exited with status {process.returncode}")
+
+
+WRITERS = {".gif": GifStreamWriter, ".mp4": FFMpegStreamWriter}
+
+
+def _open_writer(path: str, fps: float):
+    extension = os.path.splitext(path)[1].lower()
+    if extension not in WRITERS:
+        raise ValueError(f"Unsupported format '{extension}'. Supported: {sorted(WRITERS)}")
+    return WRITERS[extension](path, fps)
+
+
+# Worker side: one scene per process, built by the pool initializer
+_scene = None
+
+
+def _init_worker(scene) -> None:
+    global _scene
+    import matplotlib
+    # workers never show anything: render off-screen, no display needed
+    matplotlib.use("Agg", force=True)
+    _scene = scene()
+
+
+def _render_chunk(start: int, end: int) -> list:
+    """Worker: render frames [start, end) and return copies of their RGBA pixels."""
+    fig, update = _scene
+    frames = []
+    for frame in range(start, end):
+        update(frame)
+        frames.append(render_frame(fig).copy())
+    return frames
+
+
+def _render_serial(fig, update, frames: int):
+    """Yield each frame's RGBA pixels, drawn in this process."""
+    for frame in range(frames):
+        update(frame)
+        yield render_frame(fig)
+
+
+def _render_parallel(pool, frames: int, workers: int, chunk_size: int):
+    """Yield each frame's RGBA pixels in order, rendered in chunks by the pool."""
+    pending = deque()
+    for start in range(0, frames, chunk_size):
+        pending.append(pool.submit(_render_chunk, start, min(start + chunk_size, frames)))
+        # bounded window: wait for the oldest chunk before queueing more
+        while len(pending) >= 2 * workers:
+            yield from pending.popleft().result()
+    while pending:
+        yield from pending.popleft().result()
+
+
+def export_animation(path: str, scene, frames: int, fps: float = 20,
+                     workers: int = 1, chunk_size: int = 8) -> str:
+    """
+    Render an animation and stream it to a GIF or MP4 file.
+
+    With workers > 1 the scene is only built inside the workers; the
+    parent never creates a figure.
+
+    Args:
+        path: output file, ".gif" or ".mp4"
+        scene: zero-argument callable returning (fig, update)
+        frames: number of frames (update is called with 0 .. frames-1)
+        fps: frames per second
+        workers: render processes; 1 renders in this process, 0 means one per CPU
+        chunk_size: frames per task sent to a worker
+
+    Returns:
+        path
+
+    Raises:
+        ValueError: If the file extension isn't supported or frames < 1
+        RuntimeError: If MP4 is requested and ffmpeg isn't available
+    """
+    if frames < 1:
+        raise ValueError(f"An animation needs at least one frame, got {frames}")
+    if workers == 0:
+        workers = os.cpu_count() or 1
+    writer = _open_writer(path, fps)
+
+    if workers <= 1:
+        import matplotlib.pyplot as plt
+        fig, update = scene()
+        try:
+            writer.write_all(_render_serial(fig, update, frames))
+        finally:
+            plt.close(fig)
+        return path
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(scene,)) as pool:
+        writer.write_all(_render_parallel(pool, frames, workers, chunk_size))
+    return path